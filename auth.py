@@ -0,0 +1,116 @@
+# 인증 사용자(principal) 캐시 모듈
+# 검증이 끝난 액세스 토큰 → 사용자 정보를 크기가 제한된 LRU 캐시에 보관하여,
+# 같은 토큰으로 들어오는 인증 요청은 JWT 검증과 users 테이블 조회 없이 처리함.
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import make_transient_to_detached
+
+from models import User
+
+# 캐시에 보관할 최대 토큰 수
+PRINCIPAL_CACHE_SIZE = int(os.environ.get("PRINCIPAL_CACHE_SIZE", "10000"))
+
+# 캐시에 저장할 사용자 컬럼 목록
+USER_COLUMNS = tuple(column.key for column in inspect(User).column_attrs)
+
+
+class PrincipalCache:
+    """
+    액세스 토큰 → 사용자 정보를 보관하는 스레드 안전한 LRU 캐시 클래스.
+
+    설명:
+    - 항목은 토큰의 만료 시각(exp)이 지나면 더 이상 반환되지 않음.
+    - 사용자 정보가 바뀌거나 삭제되면 해당 이메일로 발급된 토큰 항목을 모두 제거함.
+    - 캐시에는 컬럼 값만 저장하고, 조회할 때마다 세션에 연결되지 않은(detached) User 객체를 새로 만들어 반환함.
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[dict, float]] = OrderedDict()
+        self._tokens_by_email: dict[str, set[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, token: str) -> User | None:
+        """
+        토큰에 해당하는 사용자 객체를 반환하는 함수 (없거나 만료되었으면 None).
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None or entry[1] <= now:
+                if entry is not None:
+                    self._remove(token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            values = entry[0]
+        user = User(**values)
+        make_transient_to_detached(user)
+        return user
+
+    def put(self, token: str, user: User, expires_at: float):
+        """
+        검증이 끝난 토큰과 사용자 정보를 캐시에 저장하는 함수.
+        """
+        values = {key: getattr(user, key) for key in USER_COLUMNS}
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (values, expires_at)
+            self._tokens_by_email.setdefault(values["email"], set()).add(token)
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate_email(self, email: str):
+        """
+        해당 이메일 사용자로 발급된 토큰 항목을 모두 제거하는 함수.
+        """
+        with self._lock:
+            for token in list(self._tokens_by_email.get(email, ())):
+                self._remove(token)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_email.clear()
+
+    def _remove(self, token: str):
+        # lock을 잡은 상태에서 호출해야 함
+        values, _ = self._entries.pop(token)
+        tokens = self._tokens_by_email.get(values["email"])
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_email[values["email"]]
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_size, "hits": self.hits, "misses": self.misses}
+
+
+# 애플리케이션 전체에서 공유하는 인증 사용자 캐시
+principal_cache = PrincipalCache(PRINCIPAL_CACHE_SIZE)
+
+
+@event.listens_for(User.email, "set", active_history=True)
+def _load_previous_email(target, value, oldvalue, initiator):
+    # 커밋 후 만료된 사용자 객체의 이메일을 바꿀 때도 변경 전 이메일을 읽어 history 에 남기도록 함
+    # (active_history 가 없으면 변경 전 값을 읽지 않아, 이전 이메일로 캐시된 토큰이 무효화되지 않음)
+    pass
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target):
+    # 사용자 정보가 바뀌면 변경 전/후 이메일로 캐시된 토큰을 모두 제거함
+    history = inspect(target).attrs.email.history
+    for email in {target.email, *(history.deleted or ())}:
+        if email:
+            principal_cache.invalidate_email(email)
@@ -0,0 +1,155 @@
+# 동기 모드(main:app)와 비동기 모드(main_async:app)의 처리량 비교 벤치마크
+#
+# 사용 예:
+#   python benchmark/bench_async.py --clients 500 --duration 10
+#
+# 각 모드마다 임시 디렉터리에 빈 SQLite 데이터베이스를 만들고 uvicorn 서버를 띄운 뒤,
+# 동시 클라이언트 수만큼의 요청을 계속 보내 초당 처리량과 지연 시간 분포를 측정함.
+import argparse
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE_POST = {
+    "title": "벤치마크 채용공고",
+    "company_name": "(주)벤치",
+    "hashtags": "#벤치마크 #테스트",
+    "job_type": "개발",
+    "career": "신입",
+    "content": "벤치마크용 게시글 본문입니다. " * 20,
+    "deadline": "2024-12-31",
+    "salary": "3000~4000만원",
+    "joblocation": "서울",
+    "Education": "대졸",
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(app: str, workdir: str, port: int) -> subprocess.Popen:
+    # 상대 경로 ./test.db 가 임시 디렉터리를 가리키도록 cwd를 바꿔서 서버를 실행함
+    env = dict(os.environ, PYTHONPATH=ROOT)
+    return subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", app, "--port", str(port), "--log-level", "warning", "--no-access-log"],
+        cwd=workdir,
+        env=env,
+    )
+
+
+async def wait_ready(base_url: str, timeout: float = 30.0):
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get("/posts/?limit=1")).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError(f"server at {base_url} did not start")
+
+
+async def seed(base_url: str, posts: int) -> list[int]:
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        ids = []
+        for _ in range(posts):
+            ids.append((await client.post("/posts/", json=SAMPLE_POST)).json()["id"])
+        return ids
+
+
+async def run_load(base_url: str, post_ids: list[int], clients: int, duration: float, timeout: float) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    stop_at = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+
+    async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+        async def worker():
+            nonlocal errors
+            while time.monotonic() < stop_at:
+                # 읽기 위주 트래픽: 상세 조회 80%, 목록 조회 20%
+                if random.random() < 0.8:
+                    path = f"/posts/{random.choice(post_ids)}"
+                else:
+                    path = "/posts/?limit=20"
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    if response.status_code != 200:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.perf_counter() - started)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(clients)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000 if latencies else float("nan")
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(0.50),
+        "p99_ms": percentile(0.99),
+        "mean_ms": statistics.fmean(latencies) * 1000 if latencies else float("nan"),
+    }
+
+
+async def bench(app: str, args) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+        server = start_server(app, workdir, port)
+        try:
+            await wait_ready(base_url)
+            post_ids = await seed(base_url, args.posts)
+            return await run_load(base_url, post_ids, args.clients, args.duration, args.timeout)
+        finally:
+            # 처리되지 못한 요청이 남아 있으면 정상 종료가 끝나지 않을 수 있으므로 잠시 기다린 뒤 강제 종료함
+            server.terminate()
+            try:
+                server.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                server.kill()
+                server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="sync vs async throughput benchmark")
+    parser.add_argument("--clients", type=int, default=500, help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="모드별 측정 시간 (초)")
+    parser.add_argument("--posts", type=int, default=200, help="미리 생성할 게시글 수")
+    parser.add_argument("--timeout", type=float, default=10.0, help="요청별 타임아웃 (초), 초과 시 오류로 집계")
+    args = parser.parse_args()
+
+    print(f"clients={args.clients} duration={args.duration}s posts={args.posts}")
+    print(f"{'mode':<8}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for mode, app in (("sync", "main:app"), ("async", "main_async:app")):
+        result = asyncio.run(bench(app, args))
+        print(
+            f"{mode:<8}{result['requests']:>10}{result['errors']:>8}{result['rps']:>10.1f}"
+            f"{result['p50_ms']:>10.1f}{result['p99_ms']:>10.1f}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+# 게시글별 추천 지원자 검색 벤치마크 (구획 검색 vs 전체 검색, 스냅숏 만들기 vs 열기)
+#
+# 사용 예:
+#   python benchmark/bench_candidates.py --resumes 200000 --queries 200
+#
+# 임의로 만든 이력서 --resumes 개로 임시 디렉터리에 스냅숏을 만든 뒤
+#   1) 스냅숏 만들기 시간 / 새 프로세스가 스냅숏을 여는 시간 (워커 부팅 비용) / 디스크 크기
+#   2) 게시글 질의 한 번의 지연 시간: 게시글 조건 구획만 읽을 때와 모든 구획을 읽을 때 (평균/p50/p99)
+#   3) 질의마다 점수를 계산한 이력서 비율과, 전체 검색 상위 k 개 중 구획 검색 결과에 포함된 비율
+# 을 측정함. DB 를 거치지 않고 검색만 측정함.
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# models 를 임포트할 때 작업 디렉터리의 test.db 를 건드리지 않도록 임시 DB를 가리키게 함
+_scratch = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_scratch, 'import.db')}")
+
+import candidates  # noqa: E402
+import numpy as np  # noqa: E402
+
+WORDS = (
+    "python java kotlin go rust spark kafka airflow react vue typescript docker kubernetes aws gcp mysql postgresql "
+    "redis 백엔드 프론트엔드 데이터 엔지니어 파이프라인 운영 개발 설계 서비스 플랫폼 분석 모델 머신러닝 추천 검색 "
+    "결제 커머스 금융 보안 인프라 모니터링 자동화 테스트 협업 경험 프로젝트 리드 팀 성과 개선 도입 구축 담당"
+).split()
+EDUCATIONS = ("고졸", "초대졸", "대졸", "석사", "박사", "")
+REGIONS = ("서울", "경기", "인천", "부산", "대구", "대전", "광주", "울산", "세종", "강원", "충북", "충남", "전북", "전남",
+           "경북", "경남", "제주")
+
+
+def random_resume(resume_id: int) -> tuple:
+    location = f"{random.choice(REGIONS)} {random.choice(('중구', '동구', '서구', '남구', '북구'))}"
+    return resume_id, " ".join(random.choices(WORDS, k=random.randint(15, 60))), random.choice(EDUCATIONS), location
+
+
+def random_post() -> tuple:
+    content = " ".join(random.choices(WORDS, k=random.randint(30, 90)))
+    hashtags = " ".join(f"#{word}" for word in random.sample(WORDS, 3))
+    return content, hashtags, random.choice(("대졸", "학력무관", "석사", "고졸")), f"{random.choice(REGIONS)} 중구"
+
+
+def percentiles(timings: list[float]) -> str:
+    timings = sorted(timings)
+    mean = statistics.fmean(timings) * 1000
+    p50 = timings[len(timings) // 2] * 1000
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000
+    return f"mean {mean:8.3f} ms  p50 {p50:8.3f} ms  p99 {p99:8.3f} ms"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="candidate search benchmark: partitioned vs full scan")
+    parser.add_argument("--resumes", type=int, default=200000, help="스냅숏에 넣을 이력서 수")
+    parser.add_argument("--queries", type=int, default=200, help="게시글 질의 반복 횟수")
+    parser.add_argument("--k", type=int, default=50, help="질의마다 고를 이력서 수")
+    args = parser.parse_args()
+    random.seed(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        started = time.perf_counter()
+        with candidates.build_lock(directory):
+            name = candidates.build_snapshot((random_resume(i) for i in range(1, args.resumes + 1)), directory)
+        build_seconds = time.perf_counter() - started
+        size_mb = sum(
+            os.path.getsize(os.path.join(directory, name, entry)) for entry in os.listdir(os.path.join(directory, name))
+        ) / 1e6
+
+        started = time.perf_counter()
+        index = candidates.CandidateIndex(directory)
+        index._switch(candidates._current_name(directory))
+        open_seconds = time.perf_counter() - started
+        snapshot = index.snapshot
+
+        posts = [random_post() for _ in range(args.queries)]
+        queries = [(candidates.post_query(*post), post[2], post[3]) for post in posts]
+        timings = {"partitioned": [], "full scan": []}
+        scanned, recall = [], []
+        for query, education, joblocation in queries:
+            started = time.perf_counter()
+            hits = index.top_k(query, education, joblocation, args.k)
+            timings["partitioned"].append(time.perf_counter() - started)
+            scanned.append(index.last_scanned / snapshot.count)
+
+            started = time.perf_counter()
+            weights = candidates.matching.query_weights(query, snapshot.df, snapshot.count)
+            full = index._search(snapshot, {}, np.empty(0, dtype=np.int64), weights, None, args.k)
+            timings["full scan"].append(time.perf_counter() - started)
+            recall.append(len({i for i, _ in hits} & {i for i, _ in full}) / max(len(full), 1))
+
+    print(f"resumes={args.resumes} k={args.k} partitions={len(snapshot.partitions)}")
+    print(f"snapshot build     {build_seconds:8.2f} s  ({args.resumes / build_seconds:,.0f} resumes/s), {size_mb:.1f} MB on disk")
+    print(f"snapshot open      {open_seconds * 1000:8.2f} ms (memory-mapped, per worker)")
+    for kind, values in timings.items():
+        print(f"{kind:<19}{percentiles(values)}")
+    print(f"scanned per query  {statistics.fmean(scanned) * 100:8.1f} % of resumes")
+    print(f"overlap with full  {statistics.fmean(recall) * 100:8.1f} % of full-scan top-{args.k} (full scan ignores region/education)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+# 인덱스 구성 변경 전후의 쓰기 비용 / 조회 지연 시간 비교 벤치마크
+#
+# 사용 예:
+#   python benchmark/bench_indexes.py --posts 20000 --inserts 2000
+#
+# before: 컬럼마다 index=True 로 만들어진 단일 컬럼 인덱스 (마이그레이션 2 이전)
+# after : 조회 형태에 맞춘 인덱스 (범위 검색 복합 인덱스, 작성자 FK 인덱스, 목록 커버링 인덱스)
+#
+# 구성마다 임시 SQLite 파일을 만들어
+#   1) 게시글/이력서를 한 건씩 INSERT + 커밋 하는 처리량 (create_post / create_resume 와 같은 쓰기 형태)
+#   2) 게시글을 미리 채운 뒤 API 가 실행하는 조회별 평균/p99 지연 시간
+# 을 측정함.
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# models 를 임포트할 때 작업 디렉터리의 test.db 를 건드리지 않도록 임시 DB를 가리키게 함
+_scratch = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_scratch, 'import.db')}")
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import models  # noqa: E402
+import postfields  # noqa: E402
+from migrations import LEGACY_INDEXES  # noqa: E402
+from models import Base, Post, Resume  # noqa: E402
+
+SAMPLE_POST = {
+    "title": "벤치마크 채용공고",
+    "company_name": "(주)벤치",
+    "hashtags": "#벤치마크 #테스트",
+    "job_type": "개발",
+    "career": "신입",
+    "content": "벤치마크용 게시글 본문입니다. " * 100,
+    "deadline": "2024-12-31",
+    "salary": "3000~4000만원",
+    "joblocation": "서울",
+    "Education": "대졸",
+}
+
+SAMPLE_RESUME = {
+    "title": "백엔드 개발자 지원",
+    "name": "홍길동",
+    "gender": "남",
+    "email": "hong@example.com",
+    "phonenumber": "010-0000-0000",
+    "education": "대졸",
+    "location": "서울",
+    "introduce": "자기소개 문단입니다. " * 100,
+}
+
+LIST_COLUMNS = [Post.id, Post.company_name, Post.title, Post.hashtags, Post.author_id]
+
+# 마이그레이션 2에서 새로 추가된 인덱스 (before 구성에서는 제거함)
+NEW_INDEXES = ("ix_posts_author_id", "ix_posts_list")
+
+
+def random_post(index: int) -> dict:
+    low = random.randrange(2000, 8000, 500)
+    return dict(
+        SAMPLE_POST,
+        title=f"채용공고 {index}",
+        company_name=f"회사 {index % 500}",
+        salary=f"{low}~{low + 1000}만원",
+        deadline=f"2024-{random.randint(1, 12)}-{random.randint(1, 28)}",
+        author_id=random.randint(1, 200),
+    )
+
+
+def make_engine(path: str, legacy: bool):
+    engine = models.create_db_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        if legacy:
+            for name in NEW_INDEXES:
+                conn.exec_driver_sql(f'DROP INDEX IF EXISTS "{name}"')
+            for name, table, column in LEGACY_INDEXES:
+                conn.exec_driver_sql(f'CREATE INDEX IF NOT EXISTS "{name}" ON {table} ("{column}")')
+    return engine
+
+
+def bench_inserts(Session, model, make_row, count: int) -> float:
+    # 한 건씩 INSERT 후 커밋 (초당 처리 건수)
+    started = time.perf_counter()
+    for index in range(count):
+        with Session() as db:
+            db.add(model(**make_row(index)))
+            db.commit()
+    return count / (time.perf_counter() - started)
+
+
+def queries(posts: int) -> dict:
+    # API 엔드포인트가 실행하는 조회 형태 (이름 → 문장을 만드는 함수)
+    def ranged(**filters):
+        query, id_column = postfields.filter_posts(select(*LIST_COLUMNS), **filters)
+        return query.order_by(id_column).limit(11)
+
+    return {
+        "GET /posts/{id}": lambda: select(Post).where(Post.id == random.randint(1, posts)),
+        "GET /posts/ (page 1)": lambda: select(*LIST_COLUMNS).order_by(Post.id).limit(11),
+        "GET /posts/?cursor": lambda: select(*LIST_COLUMNS).where(Post.id > random.randint(1, posts)).order_by(Post.id).limit(11),
+        "GET /posts/?salary_min": lambda: ranged(salary_min=8500),
+        "posts by author": lambda: select(*LIST_COLUMNS).where(Post.author_id == random.randint(1, 200)).order_by(Post.id).limit(11),
+        "GET /resumes/{id}": lambda: select(Resume).where(Resume.id == random.randint(1, 100)),
+    }
+
+
+def bench_queries(Session, posts: int, iterations: int) -> dict:
+    results = {}
+    with Session() as db:
+        for name, make in queries(posts).items():
+            timings = []
+            for _ in range(iterations):
+                stmt = make()
+                started = time.perf_counter()
+                db.execute(stmt).all()
+                timings.append(time.perf_counter() - started)
+            timings.sort()
+            results[name] = (sum(timings) / len(timings) * 1000, timings[int(len(timings) * 0.99)] * 1000)
+    return results
+
+
+def run(legacy: bool, args) -> dict:
+    random.seed(0)
+    with tempfile.TemporaryDirectory() as workdir:
+        path = os.path.join(workdir, "bench.db")
+        engine = make_engine(path, legacy)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        def post_row(index):
+            row = random_post(index)
+            postfields.apply(row)
+            return row
+
+        post_rate = bench_inserts(Session, Post, post_row, args.inserts)
+        resume_rate = bench_inserts(Session, Resume, lambda _: SAMPLE_RESUME, args.inserts)
+
+        with Session() as db:
+            rows = [post_row(index) for index in range(args.posts)]
+            db.execute(Post.__table__.insert(), rows)
+            db.commit()
+        total = args.posts + args.inserts
+        latencies = bench_queries(Session, total, args.iterations)
+        engine.dispose()
+        size = os.path.getsize(path) + (os.path.getsize(path + "-wal") if os.path.exists(path + "-wal") else 0)
+    return {"post_rate": post_rate, "resume_rate": resume_rate, "latencies": latencies, "size_mb": size / 1e6}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="index set benchmark: write throughput and query latency")
+    parser.add_argument("--posts", type=int, default=20000, help="조회 측정 전에 채울 게시글 수")
+    parser.add_argument("--inserts", type=int, default=2000, help="쓰기 처리량 측정에 사용할 INSERT 건수 (테이블별)")
+    parser.add_argument("--iterations", type=int, default=500, help="조회 형태별 반복 횟수")
+    args = parser.parse_args()
+
+    results = {name: run(legacy, args) for name, legacy in (("before", True), ("after", False))}
+    print(f"posts={args.posts} inserts={args.inserts} iterations={args.iterations}")
+    print(f"{'':<28}{'before':>14}{'after':>14}")
+    print(f"{'post INSERT+commit /s':<28}{results['before']['post_rate']:>14.0f}{results['after']['post_rate']:>14.0f}")
+    print(f"{'resume INSERT+commit /s':<28}{results['before']['resume_rate']:>14.0f}{results['after']['resume_rate']:>14.0f}")
+    print(f"{'database size (MB)':<28}{results['before']['size_mb']:>14.1f}{results['after']['size_mb']:>14.1f}")
+    print(f"{'query (mean / p99 ms)':<28}")
+    for name in results["after"]["latencies"]:
+        before = results["before"]["latencies"][name]
+        after = results["after"]["latencies"][name]
+        print(f"  {name:<26}{before[0]:>7.3f}/{before[1]:<6.3f}{after[0]:>7.3f}/{after[1]:<6.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# 이력서-게시글 매칭 인덱스 벤치마크
+#
+# 사용 예:
+#   python benchmark/bench_matching.py --posts 100000 --queries 200
+#
+# 임의로 만든 게시글 --posts 개로 matching.MatchIndex 를 만든 뒤
+#   1) 인덱스 생성 시간과 행렬 메모리 크기
+#   2) 이력서 질의 한 번의 top-k 지연 시간 (평균/p50/p99)
+#   3) 게시글 한 건 작성/수정/삭제를 인덱스에 반영하는 시간
+#   4) 같은 점수를 파이썬 반복문으로 게시글마다 계산하는 방식(비교 기준)의 지연 시간
+# 을 측정함. DB 를 거치지 않고 인덱스만 측정함 (엔드포인트는 여기에 이력서 조회와 게시글 k 개 IN 조회가 더해짐).
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# models 를 임포트할 때 작업 디렉터리의 test.db 를 건드리지 않도록 임시 DB를 가리키게 함
+_scratch = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_scratch, 'import.db')}")
+
+import numpy as np  # noqa: E402
+
+import matching  # noqa: E402
+
+WORDS = (
+    "python java kotlin go rust spark kafka airflow react vue typescript docker kubernetes aws gcp mysql postgresql "
+    "redis 백엔드 프론트엔드 데이터 엔지니어 파이프라인 운영 개발 설계 서비스 플랫폼 분석 모델 머신러닝 추천 검색 "
+    "결제 커머스 금융 보안 인프라 모니터링 자동화 테스트 협업 경험자 우대 신입 경력 채용 담당 업무 자격 요건"
+).split()
+EDUCATIONS = ("고졸", "초대졸", "대졸", "석사", "박사", "학력무관")
+LOCATIONS = ("서울 강남구", "서울 마포구", "경기 성남시", "부산 해운대구", "대전 유성구", "대구", "광주", "원격")
+
+
+def random_text(words: int) -> str:
+    return " ".join(random.choices(WORDS, k=words))
+
+
+def random_post(post_id: int) -> tuple:
+    hashtags = " ".join(f"#{word}" for word in random.sample(WORDS, 3))
+    return post_id, random_text(random.randint(30, 120)), hashtags, random.choice(EDUCATIONS), random.choice(LOCATIONS)
+
+
+def random_query() -> tuple:
+    return matching.resume_query(random_text(random.randint(20, 60)), random.choice(EDUCATIONS), random.choice(LOCATIONS))
+
+
+def percentiles(timings: list[float]) -> str:
+    timings = sorted(timings)
+    mean = statistics.fmean(timings) * 1000
+    p50 = timings[len(timings) // 2] * 1000
+    p99 = timings[min(len(timings) - 1, int(len(timings) * 0.99))] * 1000
+    return f"mean {mean:8.3f} ms  p50 {p50:8.3f} ms  p99 {p99:8.3f} ms"
+
+
+def python_top_k(index: matching.MatchIndex, query: tuple, k: int) -> list:
+    # 비교 기준: 같은 행렬과 가중치로 게시글마다 파이썬 반복문으로 점수를 계산하고 전체를 정렬함
+    cols, vals, text_len = query
+    idf = np.log((len(index) + 1) / (index.df[cols[:text_len]] + 1)) + 1
+    text = [value * float(weight) for value, weight in zip(vals[:text_len], idf)]
+    norm = sum(value * value for value in text) ** 0.5 or 1.0
+    weights = {}
+    for col, value in zip(cols, [value * matching.TEXT_WEIGHT / norm for value in text] + list(vals[text_len:])):
+        weights[col] = weights.get(col, 0.0) + value
+    rows_cols = index.cols[:index.size].tolist()
+    rows_vals = index.vals[:index.size].tolist()
+    scores = []
+    for post_id, row_cols, row_vals in zip(index.ids[:index.size].tolist(), rows_cols, rows_vals):
+        score = sum(value * weights.get(col, 0.0) for col, value in zip(row_cols, row_vals) if value)
+        if score > 0:
+            scores.append((score, post_id))
+    scores.sort(reverse=True)
+    return scores[:k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="resume matching index benchmark")
+    parser.add_argument("--posts", type=int, default=100000, help="인덱스에 넣을 게시글 수")
+    parser.add_argument("--queries", type=int, default=200, help="top-k 질의 반복 횟수")
+    parser.add_argument("--k", type=int, default=20, help="질의마다 고를 게시글 수")
+    parser.add_argument("--updates", type=int, default=1000, help="증분 반영(작성/수정/삭제) 반복 횟수")
+    parser.add_argument("--baseline-queries", type=int, default=3, help="파이썬 반복문 비교 기준 질의 횟수 (0이면 생략)")
+    args = parser.parse_args()
+    random.seed(0)
+
+    posts = [random_post(post_id) for post_id in range(1, args.posts + 1)]
+    index = matching.MatchIndex()
+    started = time.perf_counter()
+    index.build(posts)
+    build_seconds = time.perf_counter() - started
+    matrix_mb = (index.cols[:index.size].nbytes + index.vals[:index.size].nbytes) / 1e6
+
+    queries = [random_query() for _ in range(args.queries)]
+    index.top_k(queries[0], args.k)  # 첫 호출 비용(메모리 할당 등)은 제외함
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        index.top_k(query, args.k)
+        timings.append(time.perf_counter() - started)
+
+    update_timings = {"create": [], "update": [], "delete": []}
+    next_id = args.posts + 1
+    for _ in range(args.updates):
+        for kind, post_id in (("create", next_id), ("update", random.randint(1, args.posts)), ("delete", next_id)):
+            values = None if kind == "delete" else random_post(post_id)[1:]
+            started = time.perf_counter()
+            index.apply({post_id: values})
+            update_timings[kind].append(time.perf_counter() - started)
+        next_id += 1
+
+    print(f"posts={args.posts} k={args.k} features/post<={matching.ROW_WIDTH} dim={matching.FEATURE_DIM}")
+    print(f"index build        {build_seconds:8.2f} s  ({args.posts / build_seconds:,.0f} posts/s), matrix {matrix_mb:.1f} MB")
+    print(f"top-k (numpy)      {percentiles(timings)}")
+    for kind, values in update_timings.items():
+        print(f"{kind + ' (apply)':<19}{percentiles(values)}")
+    if args.baseline_queries:
+        baseline = []
+        for query in queries[:args.baseline_queries]:
+            started = time.perf_counter()
+            expected = python_top_k(index, query, args.k)
+            baseline.append(time.perf_counter() - started)
+            assert [post_id for _, post_id in expected][:1] == [post_id for post_id, _ in index.top_k(query, args.k)][:1]
+        print(f"top-k (python)     {percentiles(baseline)}")
+
+
+if __name__ == "__main__":
+    main()
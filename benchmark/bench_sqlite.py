@@ -0,0 +1,140 @@
+# SQLite 엔진 설정(WAL, PRAGMA, 연결 풀) 적용 전후의 읽기/쓰기 혼합 처리량 비교 벤치마크
+#
+# 사용 예:
+#   python benchmark/bench_sqlite.py --threads 16 --duration 10 --write-ratio 0.2
+#
+# 설정마다 임시 디렉터리에 새 SQLite 파일을 만들고 게시글을 미리 채운 뒤,
+# 여러 스레드가 동시에 게시글 조회(읽기)와 게시글 작성 + 커밋(쓰기)을 섞어 실행하여
+# 초당 처리량, 지연 시간 분포, 잠금 오류(database is locked) 수를 측정함.
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# models 를 임포트할 때 작업 디렉터리의 test.db 를 건드리지 않도록 임시 DB를 가리키게 함
+_scratch = tempfile.mkdtemp()
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(_scratch, 'import.db')}")
+
+from sqlalchemy import select  # noqa: E402
+from sqlalchemy.exc import OperationalError  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import models  # noqa: E402
+from models import Base, Post  # noqa: E402
+
+SAMPLE_POST = {
+    "title": "벤치마크 채용공고",
+    "company_name": "(주)벤치",
+    "hashtags": "#벤치마크 #테스트",
+    "job_type": "개발",
+    "career": "신입",
+    "content": "벤치마크용 게시글 본문입니다. " * 20,
+    "deadline": "2024-12-31",
+    "salary": "3000~4000만원",
+    "joblocation": "서울",
+    "Education": "대졸",
+    "author_id": 1,
+}
+
+# 설정 적용 전: SQLite 기본값 (rollback journal, synchronous=FULL) + SQLAlchemy 기본 풀
+DEFAULT_PRAGMAS = {"journal_mode": "DELETE", "synchronous": "FULL"}
+
+
+def make_engine(path: str, tuned: bool):
+    url = f"sqlite:///{path}"
+    if tuned:
+        return models.create_db_engine(url)
+    return models.create_db_engine(url, pragmas=DEFAULT_PRAGMAS, pool_size=5, max_overflow=10, pool_pre_ping=False)
+
+
+def run(tuned: bool, args) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        engine = make_engine(os.path.join(workdir, "bench.db"), tuned)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        with Session() as db:
+            db.execute(Post.__table__.insert(), [SAMPLE_POST] * args.posts)
+            db.commit()
+        max_id = args.posts
+
+        lock = threading.Lock()
+        reads: list[float] = []
+        writes: list[float] = []
+        errors = 0
+        stop_at = time.monotonic() + args.duration
+
+        def worker():
+            nonlocal errors
+            local_reads, local_writes, local_errors = [], [], 0
+            while time.monotonic() < stop_at:
+                is_write = random.random() < args.write_ratio
+                started = time.perf_counter()
+                try:
+                    with Session() as db:
+                        if is_write:
+                            db.add(Post(**SAMPLE_POST))
+                            db.commit()
+                        else:
+                            db.execute(select(Post).where(Post.id == random.randint(1, max_id))).scalar()
+                except OperationalError:
+                    local_errors += 1
+                    continue
+                (local_writes if is_write else local_reads).append(time.perf_counter() - started)
+            with lock:
+                reads.extend(local_reads)
+                writes.extend(local_writes)
+                errors += local_errors
+
+        started = time.perf_counter()
+        threads = [threading.Thread(target=worker) for _ in range(args.threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+        engine.dispose()
+
+    def percentile(values, p):
+        values = sorted(values)
+        return values[min(len(values) - 1, int(len(values) * p))] * 1000 if values else float("nan")
+    return {
+        "ops": len(reads) + len(writes),
+        "errors": errors,
+        "ops_per_s": (len(reads) + len(writes)) / elapsed,
+        "read_p50_ms": percentile(reads, 0.50),
+        "read_p99_ms": percentile(reads, 0.99),
+        "write_p50_ms": percentile(writes, 0.50),
+        "write_p99_ms": percentile(writes, 0.99),
+        "read_mean_ms": statistics.fmean(reads) * 1000 if reads else float("nan"),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite engine configuration benchmark (mixed read/write)")
+    parser.add_argument("--threads", type=int, default=16, help="동시 스레드 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="설정별 측정 시간 (초)")
+    parser.add_argument("--posts", type=int, default=10000, help="미리 채울 게시글 수")
+    parser.add_argument("--write-ratio", type=float, default=0.2, help="쓰기 요청 비율 (0~1)")
+    args = parser.parse_args()
+
+    print(f"threads={args.threads} duration={args.duration}s posts={args.posts} write_ratio={args.write_ratio}")
+    print(f"{'config':<9}{'ops':>9}{'errors':>8}{'ops/s':>10}{'r p50':>9}{'r p99':>9}{'w p50':>9}{'w p99':>9}  (ms)")
+    for name, tuned in (("default", False), ("tuned", True)):
+        result = run(tuned, args)
+        print(
+            f"{name:<9}{result['ops']:>9}{result['errors']:>8}{result['ops_per_s']:>10.1f}"
+            f"{result['read_p50_ms']:>9.2f}{result['read_p99_ms']:>9.2f}"
+            f"{result['write_p50_ms']:>9.2f}{result['write_p99_ms']:>9.2f}",
+            flush=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
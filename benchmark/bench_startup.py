@@ -0,0 +1,100 @@
+# 서버 시작 시간(콜드 스타트) 벤치마크
+#
+# 사용 예:
+#   python benchmark/bench_startup.py --runs 5
+#
+# 각 앱(main:app, main_async:app)과 데이터베이스 초기화 방식마다
+#   import : 새 파이썬 프로세스에서 앱 모듈을 임포트하는 데 걸리는 시간
+#   first  : uvicorn 프로세스를 띄운 시점부터 첫 요청(GET /posts/?limit=1)이 200으로 응답할 때까지의 시간
+# 을 여러 번 측정하여 중앙값과 최솟값을 출력함.
+#
+# 초기화 방식:
+#   fresh    - 빈 데이터베이스, DB_INIT_ON_STARTUP=1 (lifespan 에서 테이블 생성/마이그레이션)
+#   existing - 초기화된 데이터베이스, DB_INIT_ON_STARTUP=1 (이미 적용된 단계는 건너뜀)
+#   skip     - 초기화된 데이터베이스, DB_INIT_ON_STARTUP=0 (운영 환경처럼 manage.py init-db 를 따로 실행)
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+from bench_async import ROOT, free_port, start_server
+
+MODES = {
+    "fresh": (False, "1"),
+    "existing": (True, "1"),
+    "skip": (True, "0"),
+}
+
+
+def child_env(init_on_startup: str) -> dict:
+    return dict(os.environ, PYTHONPATH=ROOT, DB_INIT_ON_STARTUP=init_on_startup)
+
+
+def init_db(workdir: str):
+    subprocess.run([sys.executable, os.path.join(ROOT, "manage.py"), "init-db"], cwd=workdir, env=child_env("1"),
+                   check=True, stdout=subprocess.DEVNULL)
+
+
+def measure_import(module: str, workdir: str, init_on_startup: str) -> float:
+    code = f"import time; started = time.perf_counter(); import {module}; print(time.perf_counter() - started)"
+    output = subprocess.run([sys.executable, "-c", code], cwd=workdir, env=child_env(init_on_startup),
+                            check=True, capture_output=True, text=True).stdout
+    return float(output.strip().splitlines()[-1])
+
+
+def measure_first_response(app: str, workdir: str, init_on_startup: str, timeout: float = 60.0) -> float:
+    port = free_port()
+    os.environ["DB_INIT_ON_STARTUP"] = init_on_startup  # start_server 가 현재 환경 변수를 자식 프로세스에 넘김
+    started = time.perf_counter()
+    server = start_server(app, workdir, port)
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}") as client:
+            while time.perf_counter() - started < timeout:
+                try:
+                    if client.get("/posts/?limit=1").status_code == 200:
+                        return time.perf_counter() - started
+                except httpx.TransportError:
+                    pass
+                time.sleep(0.005)
+        raise RuntimeError(f"{app} did not answer within {timeout}s")
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cold start benchmark: import and first-response latency")
+    parser.add_argument("--runs", type=int, default=5, help="조합별 측정 횟수")
+    args = parser.parse_args()
+
+    print(f"runs={args.runs} (median / min, ms)")
+    print(f"{'app':<16}{'mode':<10}{'import':>20}{'first response':>22}")
+    for app in ("main:app", "main_async:app"):
+        module = app.split(":")[0]
+        for mode, (initialized, init_on_startup) in MODES.items():
+            imports, firsts = [], []
+            for _ in range(args.runs):
+                with tempfile.TemporaryDirectory() as workdir:
+                    if initialized:
+                        init_db(workdir)
+                    imports.append(measure_import(module, workdir, init_on_startup) * 1000)
+                    firsts.append(measure_first_response(app, workdir, init_on_startup) * 1000)
+            print(
+                f"{app:<16}{mode:<10}"
+                f"{statistics.median(imports):>12.0f} / {min(imports):<5.0f}"
+                f"{statistics.median(firsts):>14.0f} / {min(firsts):<5.0f}",
+                flush=True,
+            )
+
+
+if __name__ == "__main__":
+    main()
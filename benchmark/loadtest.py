@@ -0,0 +1,472 @@
+# 엔드포인트별 부하 테스트 / 지연 시간 벤치마크
+#
+# 사용 예:
+#   python benchmark/loadtest.py                                 # 프로세스 내부(ASGI)에서 main:app 측정 후 기준값과 비교
+#   python benchmark/loadtest.py --app main_async:app --transport uvicorn
+#   python benchmark/loadtest.py --posts 50000 --concurrency 64 --duration 10
+#   python benchmark/loadtest.py --write-baseline                # 현재 결과를 기준값 파일로 저장
+#
+# 임시 디렉터리에 새 SQLite 데이터베이스를 만들고 사용자/게시글/이력서를 미리 채운 뒤,
+# 시나리오마다 동시 클라이언트 수만큼의 작업자가 정해진 시간 동안 요청을 반복하여
+# 요청별 처리량(req/s)과 p50/p95/p99 지연 시간을 측정함.
+#
+# 전송 방식:
+#   asgi    - httpx.ASGITransport 로 같은 프로세스 안에서 앱을 직접 호출함 (네트워크/서버 비용 제외, 재현성 높음)
+#   uvicorn - uvicorn 서버를 띄우고 HTTP로 요청함 (bench_async.py 와 같은 방식)
+#
+# 기준값 비교:
+#   --baseline 파일(기본: benchmark/loadtest_baseline.json, 저장소에는 올리지 않음)에 같은 요청의 기록이 있으면,
+#   처리량이 허용 비율(--tolerance)보다 많이 떨어지거나 p95 가 그만큼 늘어난 경우
+#   (p99 는 --tail-tolerance 기준) 회귀로 보고 종료 코드 1로 끝남.
+#   시나리오마다 --repeat 번 측정한 값의 중앙값을 사용함.
+#   절대값은 장비에 따라 달라지므로, 각 요청의 지연 시간/처리량을 같은 실행에서 측정한
+#   기준 요청(GET /health)의 값으로 나눈 비율끼리 비교함. 기준값 파일은 --write-baseline 으로 만듦.
+import argparse
+import asyncio
+import importlib
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+import httpx
+
+from bench_async import ROOT, free_port, start_server, wait_ready
+
+sys.path.insert(0, ROOT)
+
+# 측정 건수가 이보다 적은 요청은 백분위 값이 불안정하므로 기준값과 비교하지 않음
+MIN_SAMPLES = 50
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "loadtest_baseline.json")
+
+# 비교 기준이 되는 요청 (DB 를 사용하지 않으므로 장비 자체의 요청 처리 속도를 나타냄)
+REFERENCE_SCENARIO = "health"
+REFERENCE_REQUEST = "GET /health"
+
+PASSWORD = "loadtest-password"
+
+SAMPLE_POST = {
+    "title": "부하 테스트 채용공고",
+    "company_name": "(주)부하",
+    "hashtags": "#부하테스트 #백엔드",
+    "job_type": "개발",
+    "career": "신입",
+    "content": "부하 테스트용 게시글 본문입니다. " * 20,
+    "deadline": "2024-12-31",
+    "salary": "3000~4000만원",
+    "joblocation": "서울",
+    "Education": "대졸",
+}
+
+SAMPLE_RESUME = {
+    "title": "백엔드 개발자 지원",
+    "name": "홍길동",
+    "gender": "남",
+    "email": "hong@example.com",
+    "phonenumber": "010-0000-0000",
+    "education": "대졸",
+    "location": "서울",
+    "introduce": "자기소개 문단입니다. " * 20,
+}
+
+
+def user_payload(email: str) -> dict:
+    return {
+        "email": email,
+        "password": PASSWORD,
+        "name": "부하테스트",
+        "gender": "남",
+        "country": "대한민국",
+        "birthdate": "1990-01-01",
+    }
+
+
+def random_post(rng: random.Random, index: int) -> dict:
+    low = rng.randrange(2000, 8000, 500)
+    return dict(
+        SAMPLE_POST,
+        title=f"채용공고 {index}",
+        company_name=f"회사 {index % 500}",
+        salary=f"{low}~{low + 1000}만원",
+        deadline=f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+    )
+
+
+class Recorder:
+    # 요청 이름별 지연 시간(초), 오류 수, 과부하/속도 제한으로 거절(503/429)된 수를 모음
+    # (모든 작업자가 같은 이벤트 루프에서 실행되므로 잠금이 필요 없음)
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.shed = defaultdict(int)
+
+    async def call(self, client: httpx.AsyncClient, name: str, method: str, url: str, expect: int = 200, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.errors[name] += 1
+            return None
+        if response.status_code in (429, 503):
+            self.shed[name] += 1
+            return None
+        if response.status_code != expect:
+            self.errors[name] += 1
+            return None
+        self.latencies[name].append(time.perf_counter() - started)
+        return response
+
+
+class State:
+    # 시드 단계에서 만든 데이터 (시나리오가 조회/수정 대상으로 사용함)
+    def __init__(self, emails: list[str], post_ids: list[int], resume_ids: list[int]):
+        self.emails = emails
+        self.post_ids = post_ids
+        self.resume_ids = resume_ids
+        self.sequence = 0
+
+    def next_email(self) -> str:
+        self.sequence += 1
+        return f"load-{self.sequence}-{random.getrandbits(32):08x}@example.com"
+
+
+# 시나리오: 작업자 한 번의 반복에서 실행할 요청 묶음. 실제 사용자 흐름처럼 앞 요청의 결과를 다음 요청에 사용함.
+async def scenario_auth(client, state: State, record: Recorder, rng: random.Random):
+    # 회원가입 → 로그인 → 내 정보 조회 (비밀번호 해시 비용이 대부분)
+    email = state.next_email()
+    if await record.call(client, "POST /register", "POST", "/register", json=user_payload(email)) is None:
+        return
+    response = await record.call(client, "POST /login", "POST", "/login", json={"email": email, "password": PASSWORD})
+    if response is None:
+        return
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+    await record.call(client, "GET /users/me", "GET", "/users/me", headers=headers)
+
+
+async def scenario_login(client, state: State, record: Recorder, rng: random.Random):
+    # 이미 가입된 사용자의 로그인
+    email = rng.choice(state.emails)
+    await record.call(client, "POST /login (existing)", "POST", "/login", json={"email": email, "password": PASSWORD})
+
+
+async def scenario_post_crud(client, state: State, record: Recorder, rng: random.Random):
+    # 게시글 작성 → 상세 조회 → 수정 → 삭제
+    payload = random_post(rng, state.sequence)
+    response = await record.call(client, "POST /posts/", "POST", "/posts/", json=payload)
+    if response is None:
+        return
+    post_id = response.json()["id"]
+    await record.call(client, "GET /posts/{id}", "GET", f"/posts/{post_id}")
+    await record.call(client, "PUT /posts/{id}", "PUT", f"/posts/{post_id}", json=dict(payload, title="수정된 채용공고"))
+    await record.call(client, "DELETE /posts/{id}", "DELETE", f"/posts/{post_id}")
+
+
+async def scenario_post_read(client, state: State, record: Recorder, rng: random.Random):
+    # 시드된 게시글의 상세 조회
+    await record.call(client, "GET /posts/{id} (seeded)", "GET", f"/posts/{rng.choice(state.post_ids)}")
+
+
+async def scenario_post_list(client, state: State, record: Recorder, rng: random.Random):
+    # 첫 페이지 → 커서로 다음 페이지, 연봉 범위 조건 목록
+    response = await record.call(client, "GET /posts/", "GET", "/posts/", params={"limit": 20})
+    if response is not None and response.headers.get("X-Next-Cursor"):
+        await record.call(
+            client, "GET /posts/?cursor", "GET", "/posts/",
+            params={"limit": 20, "cursor": response.headers["X-Next-Cursor"]},
+        )
+    await record.call(
+        client, "GET /posts/?salary_min", "GET", "/posts/",
+        params={"limit": 20, "salary_min": rng.randrange(3000, 9000, 500)},
+    )
+
+
+async def scenario_resume_crud(client, state: State, record: Recorder, rng: random.Random):
+    # 이력서 작성 → 상세 조회 → 수정 → 삭제
+    response = await record.call(client, "POST /resumes/", "POST", "/resumes/", json=SAMPLE_RESUME)
+    if response is None:
+        return
+    resume_id = response.json()["id"]
+    await record.call(client, "GET /resumes/{id}", "GET", f"/resumes/{resume_id}")
+    await record.call(client, "PUT /resumes/{id}", "PUT", f"/resumes/{resume_id}", json=dict(SAMPLE_RESUME, title="수정된 이력서"))
+    await record.call(client, "DELETE /resumes/{id}", "DELETE", f"/resumes/{resume_id}")
+
+
+async def scenario_resume_list(client, state: State, record: Recorder, rng: random.Random):
+    await record.call(client, "GET /resumes/", "GET", "/resumes/", params={"limit": 20})
+    await record.call(client, "GET /resumes/{id} (seeded)", "GET", f"/resumes/{rng.choice(state.resume_ids)}")
+
+
+async def scenario_health(client, state: State, record: Recorder, rng: random.Random):
+    await record.call(client, REFERENCE_REQUEST, "GET", "/health")
+
+
+SCENARIOS = {
+    REFERENCE_SCENARIO: scenario_health,
+    "auth": scenario_auth,
+    "login": scenario_login,
+    "post_crud": scenario_post_crud,
+    "post_read": scenario_post_read,
+    "post_list": scenario_post_list,
+    "resume_crud": scenario_resume_crud,
+    "resume_list": scenario_resume_list,
+}
+
+
+async def bulk_ids(client: httpx.AsyncClient, path: str, items: list[dict], chunk: int = 5000) -> list[int]:
+    ids = []
+    for start in range(0, len(items), chunk):
+        response = await client.post(path, json=items[start:start + chunk])
+        response.raise_for_status()
+        ids.extend(result["id"] for result in response.json()["results"] if result["id"] is not None)
+    return ids
+
+
+async def seed(client: httpx.AsyncClient, args) -> State:
+    # 게시글/이력서는 묶음 등록 엔드포인트로, 사용자는 회원가입 엔드포인트로 채움
+    rng = random.Random(args.seed)
+    post_ids = await bulk_ids(client, "/posts/bulk", [random_post(rng, index) for index in range(args.posts)])
+    resume_ids = await bulk_ids(client, "/resumes/bulk", [SAMPLE_RESUME] * args.resumes)
+    emails = [f"seed-{index}@example.com" for index in range(args.users)]
+    for email in emails:
+        (await client.post("/register", json=user_payload(email))).raise_for_status()
+    return State(emails, post_ids, resume_ids)
+
+
+async def run_scenario(client: httpx.AsyncClient, scenario, state: State, concurrency: int, duration: float, seed: int) -> tuple[Recorder, float]:
+    record = Recorder()
+    stop_at = time.monotonic() + duration
+
+    async def worker(index: int):
+        rng = random.Random(seed * 1000 + index)
+        while time.monotonic() < stop_at:
+            await scenario(client, state, record, rng)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker(index) for index in range(concurrency)))
+    return record, time.perf_counter() - started
+
+
+@asynccontextmanager
+async def asgi_client(app_path: str, timeout: float):
+    # 앱 모듈을 임포트하고 lifespan(테이블 생성/마이그레이션)을 직접 실행함 (ASGITransport 는 lifespan 을 실행하지 않음)
+    module_name, attribute = app_path.split(":")
+    app = getattr(importlib.import_module(module_name), attribute)
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://loadtest", timeout=timeout) as client:
+            yield client
+
+
+@asynccontextmanager
+async def uvicorn_client(app_path: str, workdir: str, timeout: float, concurrency: int):
+    port = free_port()
+    base_url = f"http://127.0.0.1:{port}"
+    server = start_server(app_path, workdir, port)
+    try:
+        await wait_ready(base_url)
+        limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+        async with httpx.AsyncClient(base_url=base_url, timeout=timeout, limits=limits) as client:
+            yield client
+    finally:
+        server.terminate()
+        try:
+            server.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+
+def percentile(values: list[float], p: float) -> float:
+    return values[min(len(values) - 1, int(len(values) * p))] * 1000 if values else float("nan")
+
+
+def summarize(record: Recorder, elapsed: float) -> dict:
+    results = {}
+    for name in sorted(set(record.latencies) | set(record.errors) | set(record.shed)):
+        latencies = sorted(record.latencies[name])
+        results[name] = {
+            "requests": len(latencies),
+            "errors": record.errors[name],
+            "shed": record.shed[name],
+            "rps": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 0.50),
+            "p95_ms": percentile(latencies, 0.95),
+            "p99_ms": percentile(latencies, 0.99),
+        }
+    return results
+
+
+def merge_runs(runs: list[dict]) -> dict:
+    # 반복 측정한 결과를 요청/지표별 중앙값으로 합침 (한 번의 측정에서 튄 꼬리 지연 시간을 걸러냄)
+    merged = {}
+    for name in sorted({name for run in runs for name in run}):
+        values = [run[name] for run in runs if name in run]
+        merged[name] = {key: statistics.median(value[key] for value in values) for key in values[0]}
+        merged[name]["requests"] = sum(value["requests"] for value in values)
+    return merged
+
+
+async def bench(args) -> dict:
+    with tempfile.TemporaryDirectory() as workdir:
+        # 프로세스 내부 앱과 uvicorn 자식 프로세스 모두 임시 데이터베이스를 사용하게 함 (main 임포트 전에 설정해야 함)
+        os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, 'loadtest.db')}"
+        # 모든 요청이 한 클라이언트 IP 에서 오므로 클라이언트별 속도 제한은 끄고 서버 처리량만 측정함
+        os.environ.setdefault("RATE_LIMIT_ENABLED", "0")
+        if args.transport == "asgi":
+            connect = asgi_client(args.app, args.timeout)
+        else:
+            connect = uvicorn_client(args.app, workdir, args.timeout, args.concurrency)
+        results = {}
+        async with connect as client:
+            started = time.perf_counter()
+            state = await seed(client, args)
+            print(f"seeded users={args.users} posts={args.posts} resumes={args.resumes} "
+                  f"in {time.perf_counter() - started:.1f}s", flush=True)
+            # 다른 시나리오의 비교 기준이 되므로 기준 요청 시나리오는 항상 먼저 측정함
+            for name in dict.fromkeys([REFERENCE_SCENARIO, *args.scenarios]):
+                runs = []
+                for repeat in range(args.repeat):
+                    record, elapsed = await run_scenario(
+                        client, SCENARIOS[name], state, args.concurrency, args.duration, args.seed + repeat
+                    )
+                    runs.append(summarize(record, elapsed))
+                results[name] = merge_runs(runs)
+                print_scenario(name, results[name])
+        return results
+
+
+def print_scenario(name: str, results: dict):
+    print(f"\n[{name}]")
+    print(f"  {'request':<28}{'requests':>9}{'errors':>8}{'shed':>7}{'req/s':>10}{'p50':>9}{'p95':>9}{'p99':>9}  (ms)")
+    for request, result in results.items():
+        print(
+            f"  {request:<28}{result['requests']:>9}{result['errors']:>8}{result['shed']:>7}{result['rps']:>10.1f}"
+            f"{result['p50_ms']:>9.2f}{result['p95_ms']:>9.2f}{result['p99_ms']:>9.2f}",
+            flush=True,
+        )
+
+
+def config_key(args) -> str:
+    # 기준값은 앱/전송 방식/동시성/데이터 규모 조합마다 따로 저장함
+    return f"{args.app} {args.transport} c={args.concurrency} posts={args.posts}"
+
+
+def relative(results: dict) -> dict | None:
+    """
+    요청별 처리량과 지연 시간을 같은 실행의 기준 요청(GET /health) 값에 대한 비율로 바꾸는 함수.
+    기준 요청 기록이 없으면 None 을 반환함.
+
+    설명:
+    - 지연 시간은 기준 요청의 p50 으로 나누고, 처리량은 기준 요청의 처리량으로 나눔.
+      장비가 빨라지거나 느려지면 기준 요청도 같이 변하므로, 비율은 장비가 달라도 비교할 수 있음.
+    """
+    reference = results.get(REFERENCE_SCENARIO, {}).get(REFERENCE_REQUEST)
+    if reference is None or not reference["p50_ms"] or not reference["rps"]:
+        return None
+    return {
+        scenario: {
+            request: {
+                **result,
+                "rps": result["rps"] / reference["rps"],
+                **{key: result[key] / reference["p50_ms"] for key in ("p50_ms", "p95_ms", "p99_ms")},
+            }
+            for request, result in requests.items()
+        }
+        for scenario, requests in results.items()
+        if scenario != REFERENCE_SCENARIO
+    }
+
+
+def compare(results: dict, baseline: dict, tolerance: float, tail_tolerance: float) -> list[str]:
+    """
+    측정 결과를 기준값과 비교하여 회귀 내용을 문자열 목록으로 반환하는 함수 (회귀가 없으면 빈 목록).
+
+    설명:
+    - 양쪽 모두 relative() 로 기준 요청에 대한 비율로 바꾼 뒤 비교함 (출력되는 값도 비율임).
+    - 처리량은 기준값 × (1 - tolerance) 미만, p95 는 기준값 × (1 + tolerance) 초과,
+      p99 는 기준값 × (1 + tail_tolerance) 초과이면 회귀로 봄.
+    - 기준값보다 오류가 늘어난 경우에도 회귀로 봄. 과부하 거절(503)은 처리량에 반영되므로 따로 비교하지 않음.
+    - 기준값에 없거나 측정 건수가 MIN_SAMPLES 미만인 요청은 비교하지 않음.
+    """
+    results, baseline = relative(results), relative(baseline)
+    if results is None or baseline is None:
+        return [f"missing reference request '{REFERENCE_REQUEST}' (rerun with --write-baseline)"]
+    regressions = []
+    for scenario, requests in results.items():
+        for request, result in requests.items():
+            expected = baseline.get(scenario, {}).get(request)
+            if expected is None or min(expected["requests"], result["requests"]) < MIN_SAMPLES:
+                continue
+            label = f"{scenario} / {request}"
+            if result["errors"] > expected["errors"]:
+                regressions.append(f"{label}: errors {expected['errors']} -> {result['errors']}")
+            if result["rps"] < expected["rps"] * (1 - tolerance):
+                regressions.append(f"{label}: req/s ratio {expected['rps']:.3f} -> {result['rps']:.3f}")
+            for key, allowed in (("p95_ms", tolerance), ("p99_ms", tail_tolerance)):
+                if result[key] > expected[key] * (1 + allowed):
+                    regressions.append(f"{label}: {key} ratio {expected[key]:.1f} -> {result[key]:.1f}")
+    return regressions
+
+
+def load_baselines(path: str) -> dict:
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as file:
+        return json.load(file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="per-endpoint load test with baseline regression check")
+    parser.add_argument("--app", default="main:app", choices=["main:app", "main_async:app"], help="측정할 앱")
+    parser.add_argument("--transport", default="asgi", choices=["asgi", "uvicorn"], help="요청 전송 방식")
+    parser.add_argument("--scenarios", nargs="+", default=list(SCENARIOS), choices=list(SCENARIOS), help="실행할 시나리오")
+    parser.add_argument("--concurrency", type=int, default=16, help="시나리오별 동시 작업자 수")
+    parser.add_argument("--duration", type=float, default=3.0, help="시나리오별 1회 측정 시간 (초)")
+    parser.add_argument("--repeat", type=int, default=3, help="시나리오별 반복 측정 횟수 (지표별 중앙값 사용)")
+    parser.add_argument("--users", type=int, default=20, help="미리 가입시킬 사용자 수")
+    parser.add_argument("--posts", type=int, default=5000, help="미리 채울 게시글 수")
+    parser.add_argument("--resumes", type=int, default=1000, help="미리 채울 이력서 수")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청별 타임아웃 (초), 초과 시 오류로 집계")
+    parser.add_argument("--seed", type=int, default=0, help="데이터/요청 생성용 난수 시드")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="기준값 JSON 파일 경로")
+    parser.add_argument("--tolerance", type=float, default=0.3, help="처리량/p95 회귀로 판단하기 전 허용하는 변화 비율")
+    parser.add_argument("--tail-tolerance", type=float, default=1.0, help="p99 회귀로 판단하기 전 허용하는 변화 비율")
+    parser.add_argument(
+        "--write-baseline", "--save-baseline", action="store_true", help="비교 대신 현재 결과를 기준값 파일에 저장"
+    )
+    args = parser.parse_args()
+
+    print(f"app={args.app} transport={args.transport} concurrency={args.concurrency} "
+          f"duration={args.duration}s x {args.repeat}")
+    results = asyncio.run(bench(args))
+
+    baselines = load_baselines(args.baseline)
+    key = config_key(args)
+    if args.write_baseline:
+        baselines[key] = {**baselines.get(key, {}), **results}
+        with open(args.baseline, "w", encoding="utf-8") as file:
+            json.dump(baselines, file, ensure_ascii=False, indent=2, sort_keys=True)
+            file.write("\n")
+        print(f"\nsaved baseline '{key}' to {args.baseline}")
+        return
+    if key not in baselines:
+        print(f"\nno baseline for '{key}' in {args.baseline} (run with --write-baseline to create one)")
+        return
+    regressions = compare(results, baselines[key], args.tolerance, args.tail_tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) against baseline '{key}' (tolerance {args.tolerance:.0%}):")
+        for line in regressions:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nno regressions against baseline '{key}' (tolerance {args.tolerance:.0%})")
+
+
+if __name__ == "__main__":
+    main()
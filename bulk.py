@@ -0,0 +1,114 @@
+# 게시글/이력서 대량 등록 모듈
+# 요청 본문(JSON 배열 또는 NDJSON)을 항목별로 검증하고, 검증을 통과한 항목만
+# 하나의 트랜잭션 안에서 묶음(executemany) INSERT 로 저장함.
+import json
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+# 한 번의 INSERT 문에 담을 최대 행 수
+BULK_CHUNK_SIZE = 1000
+
+# 한 요청에서 받을 수 있는 최대 항목 수
+BULK_MAX_ITEMS = 100000
+
+
+class BulkError(Exception):
+    """
+    요청 본문 전체를 처리할 수 없을 때 발생하는 예외 (엔드포인트에서는 400 응답으로 변환됨).
+    """
+
+
+# NDJSON 으로 처리하는 Content-Type
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def is_ndjson(content_type: str | None, body: bytes) -> bool:
+    """
+    요청 본문이 NDJSON 형식인지 판단하는 함수.
+    Content-Type 이 NDJSON 이면 NDJSON, application/json (또는 +json) 이면 JSON 배열로 처리하고,
+    그 외(Content-Type 이 없는 경우 등)에는 본문이 '[' 로 시작하지 않을 때만 NDJSON 으로 처리함.
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    if media_type in NDJSON_MEDIA_TYPES:
+        return True
+    if media_type == "application/json" or media_type.endswith("+json"):
+        return False
+    return not body.lstrip().startswith(b"[")
+
+
+def parse_items(body: bytes, content_type: str | None) -> list:
+    """
+    요청 본문을 항목 목록으로 변환하는 함수.
+
+    Returns:
+    - list: 항목별 JSON 값. NDJSON 에서 해석할 수 없는 줄은 그 자리에 BulkError 객체가 들어감
+
+    Raises:
+    - BulkError: JSON 배열 자체가 잘못되었거나 항목 수가 한도를 넘은 경우
+    """
+    if is_ndjson(content_type, body):
+        items = []
+        for line in body.splitlines():
+            if not line.strip():
+                continue
+            try:
+                items.append(json.loads(line))
+            except ValueError as exc:
+                items.append(BulkError(f"Invalid JSON: {exc}"))
+    else:
+        try:
+            items = json.loads(body)
+        except ValueError as exc:
+            raise BulkError(f"Invalid JSON: {exc}")
+        if not isinstance(items, list):
+            raise BulkError("Request body must be a JSON array (send NDJSON as application/x-ndjson)")
+    if len(items) > BULK_MAX_ITEMS:
+        raise BulkError(f"Too many items (max {BULK_MAX_ITEMS})")
+    return items
+
+
+def validate_items(model: type[BaseModel], items: list) -> tuple[list[tuple[int, dict]], list[tuple[int, str]]]:
+    """
+    항목을 Pydantic 모델로 검증하는 함수.
+
+    Returns:
+    - tuple: ([(항목 번호, 컬럼 값 dict)], [(항목 번호, 오류 메시지)])
+    """
+    valid, errors = [], []
+    for index, item in enumerate(items):
+        if isinstance(item, BulkError):
+            errors.append((index, str(item)))
+            continue
+        try:
+            valid.append((index, model.model_validate(item).model_dump()))
+        except ValidationError as exc:
+            errors.append((index, "; ".join(
+                f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}" for error in exc.errors()
+            )))
+    return valid, errors
+
+
+def insert_rows(db: Session, model, rows: list[dict], chunk_size: int = BULK_CHUNK_SIZE) -> list[int]:
+    """
+    행 목록을 chunk_size 개씩 묶어 INSERT 하고, 입력 순서대로 발급된 ID 목록을 반환하는 함수.
+    커밋은 하지 않으므로 호출한 쪽에서 하나의 트랜잭션으로 커밋해야 함.
+    """
+    table = model.__table__
+    stmt = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+    ids: list[int] = []
+    for start in range(0, len(rows), chunk_size):
+        ids.extend(db.execute(stmt, rows[start:start + chunk_size]).scalars().all())
+    return ids
+
+
+def results(count: int, ids: dict[int, int], errors: list[tuple[int, str]]) -> list[dict]:
+    """
+    항목 번호 순서대로 {"index", "id", "error"} 결과 목록을 만드는 함수.
+    """
+    messages = dict(errors)
+    return [
+        {"index": index, "id": ids.get(index), "error": messages.get(index)}
+        for index in range(count)
+    ]
@@ -0,0 +1,300 @@
+# 개별 게시글/이력서 조회 응답 캐시 모듈
+# 직렬화된 응답(JSON bytes)을 캐시에 보관하고, 수정/삭제 시 해당 키만 정확히 무효화함.
+#
+# 백엔드 선택 (환경 변수 CACHE_BACKEND):
+#   memory (기본값) - 프로세스 내부 LRU 캐시 (CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_TTL)
+#   redis           - Redis 호환 서버 (REDIS_URL, redis 패키지 필요)
+#   fakeredis       - 프로세스 내부 FakeRedis 클라이언트 (Redis 백엔드 로컬 개발/테스트용)
+#   none            - 캐시 사용 안 함
+import os
+import threading
+import zlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+import metrics
+
+CACHE_BACKEND = os.environ.get("CACHE_BACKEND", "memory")
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "10000"))
+CACHE_MAX_BYTES = int(os.environ.get("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))
+CACHE_TTL = float(os.environ.get("CACHE_TTL", "300"))
+REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
+
+# 무효화 세대(generation) 카운터 수 (키를 해시하여 나누어 씀, 충돌하면 캐시 저장을 한 번 건너뛸 뿐임)
+GENERATION_SLOTS = 4096
+
+
+class CacheBackend(ABC):
+    """
+    캐시 백엔드 인터페이스. 값은 항상 bytes 이며, ttl은 초 단위 만료 시간임.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float):
+        ...
+
+    @abstractmethod
+    def delete(self, *keys: str):
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+
+class NullCache(CacheBackend):
+    """
+    아무것도 저장하지 않는 캐시 백엔드 (CACHE_BACKEND=none).
+    """
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value, ttl):
+        pass
+
+    def delete(self, *keys):
+        pass
+
+    def clear(self):
+        pass
+
+
+class LRUCache(CacheBackend):
+    """
+    항목 수, 전체 크기(bytes), TTL로 제한되는 프로세스 내부 LRU 캐시 백엔드.
+    evictions 는 항목 수/크기 한도 때문에 밀려난 항목 수임 (만료나 무효화로 지워진 항목은 세지 않음).
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, tuple[bytes, float]] = OrderedDict()
+        self._bytes = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[1] <= time.monotonic():
+                self._pop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def set(self, key, value, ttl):
+        if len(value) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._pop(key)
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._bytes += len(value)
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._pop(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, *keys):
+        with self._lock:
+            for key in keys:
+                if key in self._entries:
+                    self._pop(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _pop(self, key):
+        # lock을 잡은 상태에서 호출해야 함
+        value, _ = self._entries.pop(key)
+        self._bytes -= len(value)
+
+
+class RedisCache(CacheBackend):
+    """
+    Redis 호환 클라이언트를 감싸는 캐시 백엔드.
+    client는 get(key), set(key, value, ex=초), delete(*keys) 를 제공하면 됨 (redis.Redis, FakeRedis 등).
+    """
+
+    def __init__(self, client, prefix: str = "refujobs:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, value, ex=max(int(ttl), 1))
+
+    def delete(self, *keys):
+        if keys:
+            self.client.delete(*(self.prefix + key for key in keys))
+
+    def clear(self):
+        # 공유 Redis를 통째로 비우지 않도록, 접두어가 붙은 키만 삭제함
+        keys = list(self.client.scan_iter(self.prefix + "*"))
+        if keys:
+            self.client.delete(*keys)
+
+
+class FakeRedis:
+    """
+    로컬 개발/테스트용 Redis 대체 클라이언트 (RedisCache 에서 요구하는 명령만 구현함).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: dict[str, tuple[bytes, float | None]] = {}
+
+    def get(self, key):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or (entry[1] is not None and entry[1] <= time.monotonic()):
+                self._data.pop(key, None)
+                return None
+            return entry[0]
+
+    def set(self, key, value, ex=None):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + ex if ex else None)
+        return True
+
+    def delete(self, *keys):
+        with self._lock:
+            return sum(self._data.pop(key, None) is not None for key in keys)
+
+    def scan_iter(self, match="*"):
+        prefix = match.rstrip("*")
+        with self._lock:
+            return [key for key in self._data if key.startswith(prefix)]
+
+
+class ResponseCache:
+    """
+    직렬화된 응답을 캐시하고 적중/실패 횟수를 집계하는 클래스.
+
+    Attributes:
+        backend (CacheBackend): 실제 저장소
+        ttl (float): 항목 만료 시간 (초). 다른 프로세스가 공유 백엔드(Redis)의 키를 무효화하는 것과 동시에 일어난 읽기가
+            오래된 값을 다시 넣더라도 이 시간 뒤에는 사라짐.
+
+    설명:
+    - 키마다 무효화 세대(generation)를 세어, 읽기 시작 전에 받은 세대 이후 무효화가 있었으면 읽은 값을 저장하지 않음
+      (읽는 동안 커밋된 수정이 무효화한 키에 수정 전 응답이 다시 들어가지 않게 함).
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: float):
+        self.backend = backend
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._generations = [0] * GENERATION_SLOTS
+        self.hits = 0
+        self.misses = 0
+
+    def _slot(self, key: str) -> int:
+        return zlib.crc32(key.encode()) % GENERATION_SLOTS
+
+    def generation(self, key: str) -> int:
+        """
+        키의 현재 무효화 세대를 반환하는 함수 (항목을 조회하기 전에 읽어 set() 에 전달함).
+        """
+        return self._generations[self._slot(key)]
+
+    def get(self, key: str) -> bytes | None:
+        value = self.backend.get(key)
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key: str, value: bytes, generation: int | None = None) -> bool:
+        """
+        값을 캐시에 저장하는 함수. generation 이 주어지면 그 뒤로 키가 무효화되지 않았을 때만 저장함.
+
+        Returns:
+        - bool: 저장했으면 True
+        """
+        with self._lock:
+            if generation is not None and self._generations[self._slot(key)] != generation:
+                return False
+            self.backend.set(key, value, self.ttl)
+        return True
+
+    def invalidate(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._generations[self._slot(key)] += 1
+            self.backend.delete(*keys)
+
+    def clear(self):
+        with self._lock:
+            self._generations = [generation + 1 for generation in self._generations]
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        """
+        캐시 통계를 반환하는 함수 (/metrics 에서 읽음).
+
+        Returns:
+        - dict: backend(백엔드 클래스 이름), hits, misses, evictions(LRU 백엔드가 한도 때문에 밀어낸 항목 수, 그 외 백엔드는 0)
+        """
+        with self._lock:
+            return {
+                "backend": type(self.backend).__name__,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": getattr(self.backend, "evictions", 0),
+            }
+
+
+def post_key(post_id: int) -> str:
+    return f"post:{post_id}"
+
+
+def resume_key(resume_id: int) -> str:
+    return f"resume:{resume_id}"
+
+
+def create_backend(name: str) -> CacheBackend:
+    """
+    환경 변수 CACHE_BACKEND 값에 맞는 캐시 백엔드를 생성하는 함수.
+    """
+    if name == "none":
+        return NullCache()
+    if name == "redis":
+        import redis  # Redis 백엔드를 사용할 때만 필요함
+        return RedisCache(redis.Redis.from_url(REDIS_URL))
+    if name == "fakeredis":
+        return RedisCache(FakeRedis())
+    return LRUCache(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES)
+
+
+# 애플리케이션 전체에서 공유하는 응답 캐시
+response_cache = ResponseCache(create_backend(CACHE_BACKEND), CACHE_TTL)
+
+
+def _cache_lookups() -> dict:
+    stats = response_cache.stats()
+    return {("hit",): stats["hits"], ("miss",): stats["misses"]}
+
+
+metrics.register(
+    metrics.CallbackMetric(
+        "app_response_cache_requests_total", "Response cache lookups by result", "counter", _cache_lookups, ("result",)
+    ),
+    metrics.CallbackMetric(
+        "app_response_cache_evictions_total", "Response cache entries evicted by the size limits", "counter",
+        lambda: {(): response_cache.stats()["evictions"]},
+    ),
+)
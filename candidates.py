@@ -0,0 +1,407 @@
+# 게시글별 추천 지원자(이력서) 검색 모듈
+# 이력서마다 자기소개/학력/지역을 해시 특성 행(matching.document_row)으로 만들어, 지역과 학력 수준으로 나눈
+# 구획(inverted file partition)별로 연속 저장한 스냅숏을 디스크에 두고, 질의 때는 게시글 조건에 맞는 구획만 읽어 점수를 계산함.
+#
+# 스냅숏:
+#   CANDIDATES_INDEX_DIR/<이름>/ 아래에 cols.npy, vals.npy, ids.npy, df.npy, meta.json 으로 저장하고,
+#   CANDIDATES_INDEX_DIR/CURRENT 파일에 현재 스냅숏 이름을 기록함 (새 스냅숏은 다 쓴 뒤 CURRENT 를 원자적으로 교체함).
+#   배열은 np.load(mmap_mode="r") 로 열어 워커 프로세스들이 운영체제 페이지 캐시를 함께 사용하며,
+#   워커는 CURRENT 가 바뀐 것을 보고 새 스냅숏으로 옮겨 감 (부팅 때 각자 다시 만들지 않음).
+#   스냅숏이 없으면 첫 질의 때 만들며, 운영 환경에서는 `python manage.py rebuild-candidates` 를 주기적으로 실행하여 새로 만듦.
+#
+# 스냅숏 이후의 변경:
+#   - 새 이력서: 질의마다 스냅숏의 최대 ID 이후 이력서만 읽어 프로세스 메모리에 추가함 (다른 워커에서 등록한 이력서도 반영됨).
+#   - 수정/삭제: 이 프로세스에서 커밋된 변경은 바로 반영되고, 다른 워커의 수정은 다음 스냅숏부터 반영됨
+#     (삭제된 이력서는 응답을 만들 때 조회되지 않으므로 결과에서 빠짐).
+import itertools
+import json
+import os
+import shutil
+import threading
+import time
+from contextlib import contextmanager
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+import matching
+from models import Resume
+
+try:
+    import fcntl
+except ImportError:  # Windows 에서는 스냅숏 만들기 잠금 없이 동작함 (여러 프로세스가 동시에 만들 수 있음)
+    fcntl = None
+
+# 스냅숏 저장 디렉터리
+CANDIDATES_INDEX_DIR = os.environ.get("CANDIDATES_INDEX_DIR", "candidates_index")
+
+# 한 번에 요청할 수 있는 추천 결과 수 상한
+MAX_K = 200
+
+# 학력 수준 (게시글이 요구하는 수준 이상의 이력서만 후보로 봄, 목록에 없는 값과 "학력무관"은 0)
+EDUCATION_LEVELS = {"고졸": 1, "초대졸": 2, "전문대졸": 2, "대졸": 3, "학사": 3, "석사": 4, "박사": 5}
+
+# 스냅숏을 만들 때 resumes 테이블에서 한 번에 읽는 행 수
+BUILD_BATCH_SIZE = 5000
+
+# 세션에서 커밋을 기다리는 변경분을 보관하는 session.info 키
+PENDING_KEY = "candidates_pending"
+
+CURRENT_FILE = "CURRENT"
+ARRAYS = ("cols", "vals", "ids", "df")
+
+# 같은 프로세스에서 같은 밀리초에 만든 스냅숏도 이름이 겹치지 않게 붙이는 번호
+_sequence = itertools.count()
+
+
+def region(location: str | None) -> str:
+    """
+    지역 문자열의 첫 단어(시/도)를 구획 이름으로 반환하는 함수 ("서울 강남구" → "서울", 없으면 "").
+    """
+    words = matching.TOKEN_RE.findall(location.casefold()) if location else []
+    return words[0] if words else ""
+
+
+def education_level(education: str | None) -> int:
+    """
+    학력 문자열을 EDUCATION_LEVELS 의 수준으로 변환하는 함수 (알 수 없으면 0).
+    """
+    words = matching.TOKEN_RE.findall(education) if education else []
+    return max((EDUCATION_LEVELS.get(word, 0) for word in words), default=0)
+
+
+def partition_key(education: str | None, location: str | None) -> str:
+    """
+    이력서가 속하는 구획 이름("지역|학력 수준")을 반환하는 함수.
+    """
+    return f"{region(location)}|{education_level(education)}"
+
+
+def resume_features(introduce: str | None, education: str | None, location: str | None) -> tuple:
+    """
+    이력서 컬럼 값을 인덱스 행으로 변환하는 함수.
+    """
+    return matching.document_row([(introduce, 1)], [("edu", education), ("loc", location)])
+
+
+def post_query(content: str | None, hashtags: str | None, education: str | None, joblocation: str | None) -> tuple:
+    """
+    게시글 컬럼 값을 이력서 검색 질의로 변환하는 함수.
+    """
+    return matching.query_row(
+        [(content, 1), (hashtags, matching.HASHTAG_BOOST)],
+        [("edu", education, matching.EDUCATION_WEIGHT), ("loc", joblocation, matching.LOCATION_WEIGHT)],
+    )
+
+
+def probe_keys(keys, education: str | None, joblocation: str | None) -> list[str]:
+    """
+    게시글 조건에 맞는 구획 이름 목록을 반환하는 함수.
+
+    설명:
+    - 지역: 게시글 근무지와 같은 지역이거나 지역을 적지 않은 이력서 (게시글 근무지가 없으면 모든 지역).
+    - 학력: 게시글이 요구하는 수준 이상이거나 학력을 알 수 없는 이력서.
+    """
+    wanted_region = region(joblocation)
+    required = education_level(education)
+    probed = []
+    for key in keys:
+        key_region, level = key.rsplit("|", 1)
+        if wanted_region and key_region not in (wanted_region, ""):
+            continue
+        if int(level) and int(level) < required:
+            continue
+        probed.append(key)
+    return probed
+
+
+def _current_name(directory: str) -> str | None:
+    try:
+        with open(os.path.join(directory, CURRENT_FILE), encoding="utf-8") as file:
+            return file.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+@contextmanager
+def build_lock(directory: str):
+    """
+    스냅숏을 만드는 동안 다른 프로세스가 같은 디렉터리에 스냅숏을 만들지 못하게 막는 파일 잠금.
+    """
+    os.makedirs(directory, exist_ok=True)
+    with open(os.path.join(directory, ".build.lock"), "w") as lock_file:
+        if fcntl is not None:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        yield
+
+
+def build_snapshot(rows, directory: str | None = None) -> str:
+    """
+    (id, introduce, education, location) 행 목록으로 스냅숏을 만들어 디스크에 쓰고 현재 스냅숏으로 지정하는 함수.
+
+    설명:
+    - 행을 구획 순서로 정렬하여 저장하므로, 구획 하나는 배열의 연속된 구간(meta.json 의 partitions)이 됨.
+    - CURRENT 를 바꾼 뒤 이전 스냅숏 디렉터리는 지움 (이미 열어 둔 프로세스는 메모리 맵이 유지되므로 계속 읽을 수 있음).
+    - 호출하는 쪽에서 build_lock 을 잡고 있어야 함.
+
+    Returns:
+    - str: 새 스냅숏 이름
+    """
+    import numpy as np
+    directory = directory or CANDIDATES_INDEX_DIR
+    started_at = time.time()
+    capacity = 1024
+    cols = np.zeros((capacity, matching.ROW_WIDTH), dtype=np.int32)
+    vals = np.zeros((capacity, matching.ROW_WIDTH), dtype=np.float32)
+    ids = np.zeros(capacity, dtype=np.int64)
+    parts = np.zeros(capacity, dtype=np.int32)
+    df = np.zeros(matching.FEATURE_DIM, dtype=np.int32)
+    key_index: dict[str, int] = {}
+    count = 0
+    for resume_id, introduce, education, location in rows:
+        if count == capacity:
+            capacity *= 2
+            cols, vals = np.resize(cols, (capacity, matching.ROW_WIDTH)), np.resize(vals, (capacity, matching.ROW_WIDTH))
+            ids, parts = np.resize(ids, capacity), np.resize(parts, capacity)
+        row_cols, row_vals, text_len = resume_features(introduce, education, location)
+        cols[count] = 0
+        vals[count] = 0
+        cols[count, :len(row_cols)] = row_cols
+        vals[count, :len(row_vals)] = row_vals
+        df[row_cols[:text_len]] += 1
+        ids[count] = resume_id
+        parts[count] = key_index.setdefault(partition_key(education, location), len(key_index))
+        count += 1
+
+    order = np.argsort(parts[:count], kind="stable")
+    sizes = np.bincount(parts[:count], minlength=len(key_index))
+    partitions, start = {}, 0
+    for key, index in sorted(key_index.items(), key=lambda item: item[1]):
+        partitions[key] = [start, start + int(sizes[index])]
+        start += int(sizes[index])
+
+    name = f"{int(started_at * 1000)}-{os.getpid()}-{next(_sequence)}"
+    path = os.path.join(directory, name)
+    os.makedirs(path)
+    arrays = {"cols": cols[:count][order], "vals": vals[:count][order], "ids": ids[:count][order], "df": df}
+    for array_name, array in arrays.items():
+        np.save(os.path.join(path, f"{array_name}.npy"), array)
+    meta = {
+        "count": count,
+        "max_id": int(ids[:count].max()) if count else 0,
+        "started_at": started_at,
+        "partitions": partitions,
+    }
+    with open(os.path.join(path, "meta.json"), "w", encoding="utf-8") as file:
+        json.dump(meta, file, ensure_ascii=False)
+
+    temporary = os.path.join(directory, f"{CURRENT_FILE}.{os.getpid()}.tmp")
+    with open(temporary, "w", encoding="utf-8") as file:
+        file.write(name)
+    os.replace(temporary, os.path.join(directory, CURRENT_FILE))
+    for entry in os.listdir(directory):
+        if entry != name and os.path.isdir(os.path.join(directory, entry)):
+            shutil.rmtree(os.path.join(directory, entry), ignore_errors=True)
+    return name
+
+
+def _resume_rows(conn, after_id: int = 0):
+    # after_id 이후 이력서의 (id, introduce, education, location) 를 나누어 읽음 (conn 은 Connection 또는 Session)
+    statement = select(Resume.id, Resume.introduce, Resume.education, Resume.location).where(Resume.id > after_id)
+    return conn.execute(statement.order_by(Resume.id), execution_options={"yield_per": BUILD_BATCH_SIZE})
+
+
+def rebuild_candidates(db: Session):
+    """
+    resumes 테이블 전체로 새 스냅숏을 만드는 함수 (관리 명령용, 실행 중인 워커는 다음 질의 때 새 스냅숏으로 옮겨 감).
+    """
+    with build_lock(CANDIDATES_INDEX_DIR):
+        build_snapshot(_resume_rows(db), CANDIDATES_INDEX_DIR)
+
+
+class Snapshot:
+    """
+    디스크의 스냅숏 하나를 메모리 맵으로 연 객체.
+
+    Attributes:
+        name (str): 스냅숏 이름
+        cols, vals, ids, df (ndarray): 읽기 전용 메모리 맵 배열
+        count (int): 이력서 수
+        max_id (int): 스냅숏에 포함된 가장 큰 이력서 ID
+        started_at (float): 스냅숏을 만들기 시작한 시각 (이후에 커밋된 변경은 스냅숏에 없을 수 있음)
+        partitions (dict[str, list]): 구획 이름 → [시작 행, 끝 행)
+    """
+
+    def __init__(self, directory: str, name: str):
+        import numpy as np
+        self.name = name
+        path = os.path.join(directory, name)
+        with open(os.path.join(path, "meta.json"), encoding="utf-8") as file:
+            meta = json.load(file)
+        for array_name in ARRAYS:
+            setattr(self, array_name, np.load(os.path.join(path, f"{array_name}.npy"), mmap_mode="r"))
+        self.count = meta["count"]
+        self.max_id = meta["max_id"]
+        self.started_at = meta["started_at"]
+        self.partitions = meta["partitions"]
+
+
+class CandidateIndex:
+    """
+    프로세스마다 하나씩 두는 추천 지원자 검색 객체 (스냅숏 + 스냅숏 이후 변경분).
+
+    Attributes:
+        snapshot (Snapshot | None): 현재 열려 있는 스냅숏
+        extra (dict[int, tuple]): 스냅숏 이후 변경분. 이력서 ID → (인덱스 행, 구획 이름, 기록 시각), 삭제는 행과 구획이 None
+        last_scanned (int): 마지막 질의에서 점수를 계산한 이력서 수 (벤치마크/테스트용)
+    """
+
+    def __init__(self, directory: str | None = None):
+        self.directory = directory or CANDIDATES_INDEX_DIR
+        self._lock = threading.RLock()
+        self.snapshot: Snapshot | None = None
+        self.extra: dict[int, tuple] = {}
+        self.delta_max_id = 0
+        self.last_scanned = 0
+
+    def _switch(self, name: str):
+        snapshot = Snapshot(self.directory, name)
+        # 새 스냅숏을 만들기 시작한 뒤에 기록된 변경분은 스냅숏에 빠졌을 수 있으므로 남겨 둠
+        self.extra = {
+            resume_id: entry for resume_id, entry in self.extra.items()
+            if resume_id > snapshot.max_id or entry[2] >= snapshot.started_at
+        }
+        self.snapshot = snapshot
+        self.delta_max_id = max(self.delta_max_id, snapshot.max_id)
+
+    def refresh(self, bind):
+        """
+        질의 전에 스냅숏과 변경분을 최신으로 맞추는 함수.
+
+        설명:
+        - CURRENT 가 가리키는 스냅숏이 바뀌었으면 새 스냅숏을 염.
+        - 스냅숏이 없으면 파일 잠금을 잡고 만듦 (다른 프로세스가 먼저 만들었으면 그것을 씀).
+        - 스냅숏(또는 이전 질의) 이후 등록된 이력서를 읽어 변경분에 추가함.
+        """
+        with self._lock:
+            name = _current_name(self.directory)
+            if name is None:
+                name = self._build(bind)
+            if self.snapshot is None or self.snapshot.name != name:
+                self._switch(name)
+            with bind.connect() as conn:
+                for resume_id, introduce, education, location in _resume_rows(conn, self.delta_max_id):
+                    if resume_id not in self.extra:
+                        self.extra[resume_id] = (
+                            resume_features(introduce, education, location), partition_key(education, location), time.time()
+                        )
+                    self.delta_max_id = resume_id
+
+    def _build(self, bind) -> str:
+        with build_lock(self.directory):
+            name = _current_name(self.directory)
+            if name is not None:
+                return name
+            with bind.connect() as conn:
+                return build_snapshot(_resume_rows(conn), self.directory)
+
+    def apply(self, changes: dict):
+        """
+        이 프로세스에서 커밋된 이력서 수정/삭제({ID: (introduce, education, location) 또는 None})를 반영하는 함수.
+        """
+        now = time.time()
+        entries = {
+            resume_id: (None, None, now) if values is None
+            else (resume_features(*values), partition_key(values[1], values[2]), now)
+            for resume_id, values in changes.items()
+        }
+        with self._lock:
+            self.extra.update(entries)
+
+    def top_k(self, query: tuple, education: str | None, joblocation: str | None, k: int) -> list[tuple[int, float]]:
+        """
+        게시글 질의에 맞는 이력서를 점수가 높은 순서로 최대 k 개의 (이력서 ID, 점수)로 반환하는 함수.
+
+        설명:
+        - 게시글 조건에 맞는 구획(probe_keys)만 읽어 점수를 계산하고, 결과가 k 개보다 적으면 모든 구획으로 넓혀 다시 찾음.
+        - 변경분(extra)에 있는 이력서는 스냅숏의 행 대신 변경분의 행으로 점수를 계산함.
+        """
+        import numpy as np
+        with self._lock:
+            snapshot, extra = self.snapshot, dict(self.extra)
+        if snapshot is None or k <= 0:
+            return []
+        weights = matching.query_weights(query, snapshot.df, max(snapshot.count, 1))
+        masked = np.fromiter((resume_id for resume_id in extra if resume_id <= snapshot.max_id), dtype=np.int64)
+        keys = probe_keys(snapshot.partitions, education, joblocation)
+        hits = self._search(snapshot, extra, masked, weights, set(keys), k)
+        if len(hits) < k and len(keys) < len(snapshot.partitions):
+            hits = self._search(snapshot, extra, masked, weights, None, k)
+        return hits
+
+    def _search(self, snapshot: Snapshot, extra: dict, masked, weights, keys: set | None, k: int) -> list:
+        import numpy as np
+        found_ids, found_scores = [], []
+        scanned = 0
+        for key, (start, end) in snapshot.partitions.items():
+            if keys is not None and key not in keys or start == end:
+                continue
+            scores = matching.score_rows(weights, snapshot.cols[start:end], snapshot.vals[start:end])
+            ids = snapshot.ids[start:end]
+            if len(masked):
+                scores[np.isin(ids, masked)] = 0
+            top = matching.top_indices(scores, k)
+            found_ids.append(ids[top])
+            found_scores.append(scores[top])
+            scanned += end - start
+        rows = [(resume_id, entry[0]) for resume_id, entry in extra.items()
+                if entry[0] is not None and (keys is None or entry[1] in keys)]
+        if rows:
+            cols = np.zeros((len(rows), matching.ROW_WIDTH), dtype=np.int32)
+            vals = np.zeros((len(rows), matching.ROW_WIDTH), dtype=np.float32)
+            for index, (_, (row_cols, row_vals, _)) in enumerate(rows):
+                cols[index, :len(row_cols)] = row_cols
+                vals[index, :len(row_vals)] = row_vals
+            found_ids.append(np.array([resume_id for resume_id, _ in rows], dtype=np.int64))
+            found_scores.append(matching.score_rows(weights, cols, vals))
+            scanned += len(rows)
+        self.last_scanned = scanned
+        if not found_ids:
+            return []
+        ids, scores = np.concatenate(found_ids), np.concatenate(found_scores)
+        top = matching.top_indices(scores, k)
+        return list(zip(ids[top].tolist(), scores[top].tolist()))
+
+
+# 프로세스 공용 추천 지원자 검색 객체
+index = CandidateIndex()
+
+
+def track_resume(db: Session, resume: Resume):
+    """
+    수정된 이력서를 커밋 후 추천 지원자 검색에 반영하도록 세션에 기록하는 함수.
+    """
+    db.info.setdefault(PENDING_KEY, {})[resume.id] = (resume.introduce, resume.education, resume.location)
+
+
+def untrack_resume(db: Session, resume_id: int):
+    """
+    삭제된 이력서를 커밋 후 추천 지원자 검색에서 제외하도록 세션에 기록하는 함수.
+    """
+    db.info.setdefault(PENDING_KEY, {})[resume_id] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session):
+    if session.in_nested_transaction():
+        return  # SAVEPOINT 해제는 커밋이 아니므로 바깥 트랜잭션이 커밋될 때 반영함
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending and matching.is_available():
+        index.apply(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    if session.in_nested_transaction():
+        return  # SAVEPOINT 만 되돌린 경우 나머지 변경분은 그대로 커밋됨
+    session.info.pop(PENDING_KEY, None)
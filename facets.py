@@ -0,0 +1,143 @@
+# 게시글 필터(facet) 집계 모듈
+# 필터 값별 게시글 수를 facet_counts 테이블에 미리 집계해 두고, 게시글 변경 시 증감만 반영함
+from collections import Counter
+
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from models import FacetCount, Post
+from postfields import parse_salary
+
+# 게시글 컬럼 값을 그대로 집계하는 필터 목록
+FACET_COLUMNS = ("job_type", "career", "joblocation", "Education")
+
+# 연봉 필터 이름 (salary 문자열을 구간으로 나누어 집계함)
+SALARY_FACET = "salary"
+
+# 연봉 구간 경계 (단위: 만원, 최대 연봉 기준)
+SALARY_BUCKETS = (2000, 3000, 4000, 5000)
+
+
+def salary_bucket(salary: str | None) -> str:
+    """
+    연봉 문자열을 연봉 구간 이름으로 변환하는 함수.
+
+    설명:
+    - "1~2000만원", "2000~4000만원" 처럼 범위로 적힌 경우 가장 큰 값(최대 연봉)을 기준으로 구간을 정함.
+    - 금액 해석은 postfields.parse_salary 와 같음 (억 단위, 원 단위 환산 포함).
+    - 숫자를 찾을 수 없으면 "기타"로 분류함 (예: "회사내규에 따름").
+    """
+    _, amount = parse_salary(salary)
+    if amount is None:
+        return "기타"
+    for bound in SALARY_BUCKETS:
+        if amount <= bound:
+            return f"~{bound}만원"
+    return f"{SALARY_BUCKETS[-1]}만원 초과"
+
+
+def facet_values(post) -> dict[str, str]:
+    """
+    게시글(Post 객체 또는 같은 키를 가진 dict)에서 집계할 필터 값을 추출하는 함수.
+    """
+    get = post.get if isinstance(post, dict) else lambda key: getattr(post, key)
+    values = {facet: get(facet) for facet in FACET_COLUMNS}
+    values[SALARY_FACET] = salary_bucket(get("salary"))
+    return values
+
+
+def _bump(db: Session, facet: str, value: str, delta: int):
+    # (facet, value) 집계를 delta 만큼 증감함 (행이 없으면 새로 만듦)
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        stmt = insert(FacetCount).values(facet=facet, value=value, count=delta)
+        db.execute(stmt.on_conflict_do_update(
+            index_elements=[FacetCount.facet, FacetCount.value],
+            set_={"count": FacetCount.count + delta},
+        ))
+        return
+    result = db.execute(
+        update(FacetCount)
+        .where(FacetCount.facet == facet, FacetCount.value == value)
+        .values(count=FacetCount.count + delta)
+    )
+    if result.rowcount == 0:
+        db.add(FacetCount(facet=facet, value=value, count=delta))
+        db.flush()
+
+
+def apply_changes(db: Session, old: dict[str, str] | None, new: dict[str, str] | None):
+    """
+    게시글 변경 전후의 필터 값을 비교하여 달라진 집계만 증감하는 함수.
+    게시글 작성/수정/삭제와 같은 트랜잭션 안에서 호출해야 함.
+
+    Parameters:
+    - db (Session): SQLAlchemy 세션 객체
+    - old (dict | None): 변경 전 필터 값 (작성 시 None)
+    - new (dict | None): 변경 후 필터 값 (삭제 시 None)
+    """
+    deltas: Counter = Counter()
+    for facet, value in (old or {}).items():
+        deltas[(facet, value)] -= 1
+    for facet, value in (new or {}).items():
+        deltas[(facet, value)] += 1
+    for (facet, value), delta in sorted(deltas.items(), key=lambda item: (item[0][0], str(item[0][1]))):
+        if delta and value is not None:
+            _bump(db, facet, value, delta)
+
+
+def apply_new_posts(db: Session, posts: list):
+    """
+    새로 등록된 게시글 여러 개의 필터 값을 합산하여 (facet, value) 마다 한 번씩만 증가시키는 함수 (대량 등록용).
+    """
+    deltas: Counter = Counter()
+    for post in posts:
+        for facet, value in facet_values(post).items():
+            if value is not None:
+                deltas[(facet, value)] += 1
+    for (facet, value), delta in sorted(deltas.items(), key=lambda item: (item[0][0], str(item[0][1]))):
+        _bump(db, facet, value, delta)
+
+
+def rebuild_facets(db: Session):
+    """
+    facet_counts 테이블을 비우고 posts 테이블 전체로 다시 집계하는 함수 (집계 불일치 복구용).
+    """
+    counts: Counter = Counter()
+    columns = [getattr(Post, facet) for facet in FACET_COLUMNS] + [Post.salary]
+    for row in db.query(*columns).yield_per(1000):
+        values = dict(zip(FACET_COLUMNS + ("salary",), row))
+        for facet, value in facet_values(values).items():
+            if value is not None:
+                counts[(facet, value)] += 1
+    db.query(FacetCount).delete(synchronize_session=False)
+    db.add_all(FacetCount(facet=facet, value=value, count=count) for (facet, value), count in counts.items())
+
+
+def init_facets(bind):
+    """
+    facet_counts 테이블이 비어 있고 게시글이 있으면 집계를 채우는 함수.
+    """
+    with Session(bind=bind) as db:
+        if db.query(FacetCount).first() is None and db.query(Post.id).first() is not None:
+            rebuild_facets(db)
+            db.commit()
+
+
+def read_facets(db: Session) -> dict[str, list[tuple[str, int]]]:
+    """
+    필터별 (값, 게시글 수) 목록을 게시글 수가 많은 순서로 반환하는 함수.
+    미리 집계된 facet_counts 테이블만 읽으므로 비용은 필터 값의 개수에만 비례함.
+    """
+    result: dict[str, list[tuple[str, int]]] = {facet: [] for facet in FACET_COLUMNS + (SALARY_FACET,)}
+    rows = (
+        db.query(FacetCount.facet, FacetCount.value, FacetCount.count)
+        .filter(FacetCount.count > 0)
+        .order_by(FacetCount.facet, FacetCount.count.desc(), FacetCount.value)
+        .all()
+    )
+    for facet, value, count in rows:
+        result.setdefault(facet, []).append((value, count))
+    return result
@@ -0,0 +1,27 @@
+# 응답 JSON 직렬화 모듈
+# 목록 응답은 행(tuple)을 Pydantic 모델로 다시 검증/변환하지 않고 곧바로 JSON bytes 로 만듦.
+# orjson 이 설치되어 있으면 사용하고, 없으면 표준 json 으로 같은 형식(공백 없음, 한글 등은 이스케이프하지 않음)을 만듦.
+import json
+
+try:
+    import orjson
+except ImportError:  # orjson 은 선택 의존성임
+    orjson = None
+
+
+def dumps(value) -> bytes:
+    """
+    값을 FastAPI 기본 JSON 응답과 같은 형식의 bytes 로 직렬화하는 함수.
+    JSON 으로 표현할 수 없는 값(date 등 orjson 이 지원하지 않는 타입)은 str() 로 변환함.
+    """
+    if orjson is not None:
+        return orjson.dumps(value, default=str)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=str).encode()
+
+
+def rows(names: list[str], items) -> bytes:
+    """
+    (컬럼 이름 목록, 행 목록)을 객체 배열 JSON bytes 로 직렬화하는 함수.
+    객체의 키 순서는 names 순서를 따르므로, names 를 응답 모델의 필드 순서로 주면 response_model 을 거친 응답과 같은 bytes 가 됨.
+    """
+    return dumps([dict(zip(names, row)) for row in items])
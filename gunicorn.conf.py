@@ -0,0 +1,19 @@
+# gunicorn 설정 파일 (워커 프로세스 여러 개로 실행할 때 사용, gunicorn 과 uvicorn-worker 패키지가 필요함)
+# 실행: gunicorn main:app -c gunicorn.conf.py   (비동기 모드: gunicorn main_async:app -c gunicorn.conf.py)
+#
+# preload_app 으로 마스터가 앱을 한 번 임포트하고 on_starting 에서 serving.preload() 를 실행한 뒤 워커를 fork 함.
+# 워커는 스키마 준비/스냅숏/인덱스 만들기를 반복하지 않고, change_log 로 다른 워커가 커밋한 변경을 자신의 캐시에 반영함.
+import os
+
+# 앱 모듈을 임포트하기 전에 설정해야 함 (마스터와 모든 워커가 같은 값을 사용함)
+os.environ.setdefault("WORKER_SYNC_ENABLED", "1")
+
+bind = os.environ.get("BIND", "0.0.0.0:8000")
+workers = int(os.environ.get("WEB_CONCURRENCY", os.cpu_count() or 1))
+worker_class = "uvicorn_worker.UvicornWorker"
+preload_app = True
+
+
+def on_starting(server):
+    import serving
+    serving.preload()
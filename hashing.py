@@ -0,0 +1,247 @@
+# 비밀번호 해시 전용 프로세스 풀 모듈
+# bcrypt 해시/검증은 호출당 수백 ms의 CPU를 사용하므로 요청 스레드나 이벤트 루프에서 직접 실행하지 않고,
+# 크기가 정해진 별도 프로세스 풀에서 실행함. 대기 중인 작업 수가 한도를 넘으면 바로 거절(503)함.
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, TimeoutError
+
+import metrics
+
+# 해시 작업 프로세스 수 (0이면 프로세스 풀 없이 호출한 스레드에서 직접 계산함)
+HASH_POOL_WORKERS = int(os.environ.get("HASH_POOL_WORKERS", os.cpu_count() or 1))
+
+# 실행 중 + 대기 중인 해시 작업의 최대 개수 (초과 시 HashPoolSaturated 예외 발생)
+HASH_POOL_MAX_PENDING = int(os.environ.get("HASH_POOL_MAX_PENDING", max(HASH_POOL_WORKERS, 1) * 4))
+
+# 해시 작업 하나를 기다리는 최대 시간 (초)
+HASH_POOL_TIMEOUT = float(os.environ.get("HASH_POOL_TIMEOUT", "5"))
+
+
+class HashPoolSaturated(Exception):
+    """
+    해시 프로세스 풀의 대기열이 가득 찼거나 작업이 제한 시간 안에 끝나지 않았을 때 발생하는 예외.
+    엔드포인트에서는 503 응답으로 변환됨.
+    """
+
+
+# 프로세스별 CryptContext (passlib 임포트 비용이 크므로 처음 사용할 때 생성함)
+_pwd_context = None
+
+
+def _context():
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    return _pwd_context
+
+
+def _hash(password: str) -> str:
+    # 작업 프로세스에서 실행되는 비밀번호 해시 함수
+    return _context().hash(password)
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    # 작업 프로세스에서 실행되는 비밀번호 검증 함수
+    return _context().verify(plain_password, hashed_password)
+
+
+class HashPool:
+    """
+    크기와 대기열 길이가 제한된 bcrypt 전용 프로세스 풀 클래스.
+
+    Attributes:
+        workers (int): 작업 프로세스 수
+        max_pending (int): 실행 중 + 대기 중인 작업의 최대 개수
+        timeout (float): 작업 하나를 기다리는 최대 시간 (초)
+    """
+
+    def __init__(self, workers: int, max_pending: int, timeout: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._submitted = 0
+        self._completed = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._busy_seconds = 0.0
+
+    def _get_executor(self):
+        # 프로세스 풀은 처음 사용할 때 생성함 (spawn 방식이므로 부모의 DB 연결/스레드를 물려받지 않음)
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+        return self._executor
+
+    def _reserve(self):
+        # 대기열에 자리가 있으면 예약하고, 없으면 바로 거절함
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                metrics.shed_requests.inc(1, "hash_pool_saturated")
+                raise HashPoolSaturated("password hashing pool is saturated")
+            self._pending += 1
+            self._submitted += 1
+
+    def _release(self, started: float):
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+            self._busy_seconds += time.perf_counter() - started
+
+    def submit(self, fn, *args) -> Future:
+        """
+        해시 작업을 풀에 제출하고 Future를 반환하는 함수.
+
+        Raises:
+        - HashPoolSaturated: 대기열이 가득 찬 경우
+        """
+        self._reserve()
+        started = time.perf_counter()
+        if self.workers <= 0:
+            future: Future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as exc:
+                future.set_exception(exc)
+            finally:
+                self._release(started)
+            return future
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._release(started)
+            raise
+        future.add_done_callback(lambda _: self._release(started))
+        return future
+
+    def run(self, fn, *args):
+        """
+        해시 작업을 실행하고 결과를 기다리는 함수 (동기 엔드포인트용).
+        """
+        started = time.perf_counter()
+        future = self.submit(fn, *args)
+        try:
+            return future.result(timeout=self.timeout)
+        except TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            metrics.shed_requests.inc(1, "hash_pool_timeout")
+            raise HashPoolSaturated("password hashing timed out")
+        finally:
+            # 대기열에서 기다린 시간을 포함한 해시 작업 시간 (거절된 요청은 기록하지 않음)
+            metrics.record_phase("bcrypt", time.perf_counter() - started)
+
+    async def run_async(self, fn, *args):
+        """
+        해시 작업을 실행하고 이벤트 루프를 막지 않고 결과를 기다리는 함수 (비동기 엔드포인트용).
+        """
+        started = time.perf_counter()
+        future = self.submit(fn, *args)
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            metrics.shed_requests.inc(1, "hash_pool_timeout")
+            raise HashPoolSaturated("password hashing timed out")
+        finally:
+            metrics.record_phase("bcrypt", time.perf_counter() - started)
+
+    def stats(self) -> dict:
+        """
+        풀 사용률 통계를 반환하는 함수 (/metrics 의 app_hash_pool_* 지표로 내보냄).
+
+        Returns:
+        - dict: workers, max_pending, pending(실행 중 + 대기 중), busy(실행 중인 작업 수), utilisation(0~1),
+          submitted, completed, rejected, timed_out, busy_seconds(누적 작업 시간)
+        """
+        with self._lock:
+            busy = min(self._pending, max(self.workers, 1))
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "busy": busy,
+                "utilisation": busy / max(self.workers, 1),
+                "submitted": self._submitted,
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "busy_seconds": self._busy_seconds,
+            }
+
+    def reset_after_fork(self):
+        """
+        fork 로 만든 자식 프로세스에서 부모의 작업 프로세스와 잠금 상태를 버리는 함수 (처음 사용할 때 새 풀을 만듦).
+        """
+        self._executor = None
+        self._lock = threading.Lock()
+        self._pending = 0
+
+    def shutdown(self):
+        """
+        작업 프로세스를 모두 종료하는 함수.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+# 애플리케이션 전체에서 공유하는 해시 풀
+pool = HashPool(HASH_POOL_WORKERS, HASH_POOL_MAX_PENDING, HASH_POOL_TIMEOUT)
+os.register_at_fork(after_in_child=pool.reset_after_fork)
+
+
+def hash_password(password: str) -> str:
+    return pool.run(_hash, password)
+
+
+def check_password(plain_password: str, hashed_password: str) -> bool:
+    return pool.run(_verify, plain_password, hashed_password)
+
+
+async def hash_password_async(password: str) -> str:
+    return await pool.run_async(_hash, password)
+
+
+async def check_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await pool.run_async(_verify, plain_password, hashed_password)
+
+
+def stats() -> dict:
+    """
+    애플리케이션 해시 풀의 사용률 통계를 반환하는 함수.
+    """
+    return pool.stats()
+
+
+def _pool_jobs() -> dict:
+    stats = pool.stats()
+    return {(outcome,): stats[outcome] for outcome in ("submitted", "completed", "rejected", "timed_out")}
+
+
+metrics.register(
+    metrics.CallbackMetric(
+        "app_hash_pool_jobs_total", "Password hashing jobs by outcome (rejected jobs were answered with 503)", "counter",
+        _pool_jobs, ("outcome",),
+    ),
+    metrics.CallbackMetric("app_hash_pool_pending", "Password hashing jobs running or queued", "gauge", lambda: {(): pool.stats()["pending"]}),
+    metrics.CallbackMetric(
+        "app_hash_pool_utilisation", "Share of hash pool workers busy (0-1)", "gauge", lambda: {(): pool.stats()["utilisation"]}
+    ),
+    metrics.CallbackMetric(
+        "app_hash_pool_busy_seconds_total", "Time spent in password hashing jobs", "counter", lambda: {(): pool.stats()["busy_seconds"]}
+    ),
+)
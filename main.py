@@ -1,19 +1,59 @@
-from fastapi import FastAPI, Depends, HTTPException, status  # FastAPI 관련 모듈 임포트
-from sqlalchemy.orm import Session  # SQLAlchemy ORM 세션 관련 모듈 임포트
-from passlib.context import CryptContext  # PassLib 패스워드 해싱 관련 모듈 임포트
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response, status  # FastAPI 관련 모듈 임포트
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload  # SQLAlchemy ORM 세션 관련 모듈 임포트
 from pydantic import BaseModel, EmailStr  # Pydantic 모듈에서 BaseModel, EmailStr 임포트
 from datetime import date, datetime, timedelta  # 날짜 및 시간 관련 모듈 임포트
-from jose import JWTError, jwt  # JWT 관련 모듈 임포트
 from fastapi.security import OAuth2PasswordBearer  # FastAPI OAuth2 비밀번호 베어러 임포트
-from models import Resume, User, Post, SessionLocal, engine, Base  # 데이터베이스 모델 및 세션 관련 임포트
+from models import Resume, User, Post, SessionLocal, engine, warm_up_pool  # 데이터베이스 모델 및 세션 관련 임포트
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from contextlib import asynccontextmanager
+import os
+import math
+import base64  # 커서 인코딩/디코딩용 모듈 임포트
+import fastjson  # 목록/필드 선택 응답 직렬화 모듈 임포트
+import search  # 게시글 전문 검색(FTS5) 모듈 임포트
+import tags  # 게시글 해시태그 정규화 모듈 임포트
+import facets  # 게시글 필터 집계 모듈 임포트
+import hashing  # 비밀번호 해시 전용 프로세스 풀 모듈 임포트
+import ratelimit  # 인증 요청 속도 제한 모듈 임포트
+from auth import principal_cache  # 인증 사용자 캐시 임포트
+from cache import response_cache, post_key, resume_key  # 개별 조회 응답 캐시 임포트
+import versions  # 테이블 버전 카운터 및 ETag 모듈 임포트
+import bulk  # 대량 등록 모듈 임포트
+import postfields  # 게시글 연봉 범위/마감일 컬럼 모듈 임포트
+import migrations  # 스키마 마이그레이션 모듈 임포트
+import export  # 전체 내보내기 모듈 임포트
+import metrics  # 요청별 계측(/metrics, Server-Timing) 모듈 임포트
+import matching  # 이력서-게시글 매칭 인덱스 모듈 임포트
+import candidates  # 게시글별 추천 지원자 검색 모듈 임포트
+import writebatch  # 작성/수정 묶음 커밋 모듈 임포트
+import serving  # 멀티 프로세스 실행(preload, 워커 간 변경 반영) 모듈 임포트
 
 
+# 앱 시작 시 테이블 생성/마이그레이션 실행 여부 (운영 환경에서 `python manage.py init-db` 를 따로 실행한다면 0으로 설정)
+DB_INIT_ON_STARTUP = os.environ.get("DB_INIT_ON_STARTUP", "1") == "1"
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+# 앱 시작/종료 처리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 시작 시 데이터베이스를 초기화하고 연결 풀을 미리 채우며, 종료 시 변경 확인/묶음 커밋 스레드와 해시 작업 프로세스를 정리하는 함수.
+    모듈 임포트 시에는 데이터베이스에 접근하지 않으므로, 테스트나 도구에서 main 을 임포트하는 비용이 작음.
+    """
+    if DB_INIT_ON_STARTUP and not serving.preloaded:  # 마스터 프로세스에서 preload 했으면 워커마다 반복하지 않음
+        await run_in_threadpool(migrations.init_db, engine)
+    await run_in_threadpool(warm_up_pool, engine)
+    if serving.WORKER_SYNC_ENABLED:
+        await run_in_threadpool(serving.listener.start, engine)  # 인덱스를 만들기 전에 시작해야 그 사이의 변경도 반영됨
+    if matching.MATCHING_PRELOAD and matching.is_available():
+        await run_in_threadpool(matching.index.load, engine)
+    yield
+    await run_in_threadpool(serving.listener.stop)
+    await run_in_threadpool(writebatch.writer.stop)  # 대기 중인 묶음 커밋을 마치고 쓰기 스레드를 종료함
+    hashing.pool.shutdown()
 
-app = FastAPI()  # FastAPI 애플리케이션 객체 생성
+app = FastAPI(lifespan=lifespan)  # FastAPI 애플리케이션 객체 생성
 
 app.add_middleware(
     CORSMiddleware,
@@ -21,16 +61,18 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],  # 모든 HTTP 메서드 허용
     allow_headers=["*"],  # 모든 헤더 허용
+    expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],  # 브라우저 클라이언트가 다음 페이지 커서와 ETag를 읽을 수 있도록 노출
 )
-
-# 비밀번호 해시 알고리즘 설정
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+app.add_middleware(metrics.MetricsMiddleware)  # 라우트별 응답 시간, 요청별 SQL 수/DB 시간 기록 (가장 바깥에서 실행됨)
 
 # JWT 설정
 SECRET_KEY = "your_secret_key"  # JWT 서명을 위한 비밀 키
 ALGORITHM = "HS256"  # JWT 알고리즘
 ACCESS_TOKEN_EXPIRE_MINUTES = 30  # 액세스 토큰 만료 시간 (분)
 
+# Authorization: Bearer 헤더에서 액세스 토큰을 꺼내는 OAuth2 스킴
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login")
+
 # Pydantic 모델 정의
 class UserBase(BaseModel):
     email: EmailStr  # 사용자 이메일 주소
@@ -42,6 +84,12 @@ class UserBase(BaseModel):
 class UserCreate(UserBase):
     password: str  # 사용자 비밀번호
 
+class UserResponse(UserBase):
+    id: int  # 사용자 ID
+
+    class Config:
+        from_attributes = True
+
 class UserLogin(BaseModel):
     email: EmailStr  # 사용자 로그인 이메일 주소
     password: str  # 사용자 로그인 비밀번호
@@ -81,6 +129,40 @@ class PostResponse2(BaseModel):
     hashtags : str
     author_id: int
 
+class PostAuthor(BaseModel):
+    id: int  # 작성자 ID
+    name: str | None = None  # 작성자 이름
+
+    class Config:
+        from_attributes = True
+
+class PostWithAuthor(PostResponse):
+    author: PostAuthor | None = None  # 작성자 정보 (?include=author, 탈퇴 등으로 없으면 None)
+
+class PostSearchResult(PostResponse2):
+    score: float  # 검색 관련도 점수 (높을수록 관련도 높음)
+
+class PostMatch(PostResponse2):
+    score: float  # 이력서와의 매칭 점수 (높을수록 잘 맞음)
+
+class TagFrequency(BaseModel):
+    name: str  # 태그 이름
+    count: int  # 태그가 붙은 게시글 수
+
+class FacetValue(BaseModel):
+    value: str  # 필터 값 (salary는 연봉 구간 이름)
+    count: int  # 해당 값을 가진 게시글 수
+
+class BulkItemResult(BaseModel):
+    index: int  # 요청 본문에서의 항목 번호 (0부터 시작)
+    id: int | None = None  # 저장된 항목 ID (실패 시 None)
+    error: str | None = None  # 검증 실패 사유 (성공 시 None)
+
+class BulkResponse(BaseModel):
+    inserted: int  # 저장된 항목 수
+    failed: int  # 검증에 실패한 항목 수
+    results: list[BulkItemResult]  # 항목별 결과 (요청 순서와 같음)
+
 class ResumeBase(BaseModel):
     title : str
     name : str
@@ -104,6 +186,9 @@ class ResumeResponse(ResumeBase):
     class Config:
         from_attributes = True
 
+class ResumeCandidate(ResumeResponse):
+    score: float  # 게시글과의 매칭 점수 (높을수록 잘 맞음)
+
 # 데이터베이스 세션을 가져오는 의존성 함수
 def get_db():
     """
@@ -116,20 +201,421 @@ def get_db():
     finally:
         db.close()  # 데이터베이스 세션을 닫음
 
+# 목록 조회 한 페이지의 최대 행 개수
+MAX_PAGE_SIZE = 100
+
+# 페이지 커서 인코딩 함수
+def encode_cursor(last_id: int) -> str:
+    """
+    마지막으로 반환한 행의 ID를 클라이언트에 전달할 불투명(opaque) 커서 문자열로 변환하는 함수.
+    """
+    return base64.urlsafe_b64encode(f"id:{last_id}".encode()).decode().rstrip("=")
+
+# 페이지 커서 디코딩 함수
+def decode_cursor(cursor: str) -> int:
+    """
+    클라이언트가 보낸 커서 문자열을 마지막 행의 ID로 되돌리는 함수.
+
+    Raises:
+    - HTTPException: 커서 형식이 올바르지 않을 경우 400 예외를 발생시킴
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        prefix, value = raw.split(":", 1)
+        if prefix != "id":
+            raise ValueError(raw)
+        return int(value)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+# 키셋(커서) 페이지네이션 함수
+def paginate(query, id_column, response: Response, skip: int, limit: int, cursor: str | None):
+    """
+    ID 기준 키셋 페이지네이션으로 한 페이지를 조회하는 함수.
+
+    Parameters:
+    - query: 페이지를 조회할 SQLAlchemy 쿼리
+    - id_column: 정렬 및 커서 기준이 되는 기본 키 컬럼 또는 식 (Post.id, Resume.id, Post.id + 0)
+    - response (Response): 다음 페이지 커서를 담을 응답 객체
+    - skip (int): 기존 클라이언트용 오프셋 (cursor가 없을 때만 사용)
+    - limit (int): 조회할 행 개수 (MAX_PAGE_SIZE 보다 크면 MAX_PAGE_SIZE 개만 조회함)
+    - cursor (str | None): 이전 페이지 응답의 X-Next-Cursor 값
+
+    Returns:
+    - list: 조회된 행 목록
+
+    설명:
+    - cursor가 주어지면 "id > 마지막 ID" 조건으로 기본 키 인덱스를 바로 탐색하므로,
+      페이지 깊이와 상관없이 페이지당 비용이 일정함.
+    - cursor가 없으면 기존처럼 skip 만큼 건너뜀 (skip=0이면 첫 페이지를 키셋으로 조회함).
+    - 다음 페이지가 있는지 확인하기 위해 limit + 1개를 조회하고,
+      다음 페이지가 있으면 X-Next-Cursor 응답 헤더에 커서를 담음.
+    """
+    limit = min(limit, MAX_PAGE_SIZE)  # 예전처럼 큰 limit 을 보내는 클라이언트도 오류 없이 다음 커서로 이어서 읽을 수 있음
+    query = query.order_by(id_column)
+    if cursor is not None:
+        query = query.filter(id_column > decode_cursor(cursor))
+    elif skip:
+        query = query.offset(skip)
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        if rows:
+            response.headers["X-Next-Cursor"] = encode_cursor(rows[-1].id)
+    return rows
+
+# 목록 조회 시 기본으로 읽는 게시글 컬럼 (PostResponse2 필드)
+POST_LIST_FIELDS = list(PostResponse2.model_fields)
+
+# 이력서 목록 조회 시 읽는 컬럼 (ResumeResponse 필드, 응답 JSON 의 키 순서와 같음)
+RESUME_LIST_FIELDS = list(ResumeResponse.model_fields)
+
+# 목록 응답을 행에서 곧바로 JSON bytes 로 만들지 여부 (0이면 response_model 로 검증/직렬화하는 기존 경로를 사용함)
+FAST_LIST_RESPONSES = os.environ.get("FAST_LIST_RESPONSES", "1") == "1"
+
+# 필드 선택(?fields=) 파라미터 해석 함수
+def select_fields(model, fields: str | None, default: list[str] | None = None) -> list[str] | None:
+    """
+    ?fields=id,title,company_name 형식의 파라미터를 조회할 컬럼 이름 목록으로 변환하는 함수.
+
+    Parameters:
+    - model: 조회할 SQLAlchemy 모델 (Post, Resume)
+    - fields (str | None): 쉼표로 구분된 필드 이름 목록
+    - default (list[str] | None): fields가 없을 때 사용할 컬럼 목록 (None이면 모델 전체를 조회함)
+
+    Returns:
+    - list[str] | None: 조회할 컬럼 이름 목록 (id는 페이지 커서에 필요하므로 항상 포함함)
+
+    Raises:
+    - HTTPException: 테이블에 없는 필드가 있으면 400 예외를 발생시킴
+    """
+    if not fields:
+        return default
+    names = list(dict.fromkeys(["id", *(name.strip() for name in fields.split(",") if name.strip())]))
+    unknown = [name for name in names if name not in model.__table__.columns]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(unknown)}")
+    return names
+
+# 선택한 컬럼만 조회하는 쿼리 생성 함수
+def projection_query(db: Session, model, names: list[str], *extra):
+    """
+    선택한 컬럼만 SELECT 하는 쿼리를 만드는 함수.
+    ORM 객체를 만들지 않고 필요한 컬럼만 읽으므로, 본문처럼 큰 컬럼은 디스크에서 읽지도 직렬화하지도 않음.
+    """
+    return db.query(*(getattr(model, name) for name in names), *extra)
+
+# 필드 선택 응답 직렬화 함수
+def serialize_fields(names: list[str], row) -> bytes:
+    return fastjson.dumps(dict(zip(names, row)))
+
+# 필드 선택 목록 응답 생성 함수
+def projected_list_response(names: list[str], rows, response: Response) -> Response:
+    """
+    행 목록을 JSON 목록 응답으로 만드는 함수 (페이지 커서와 ETag 헤더를 함께 담음).
+
+    설명:
+    - 행을 Pydantic 모델로 검증/변환하지 않고 곧바로 JSON bytes 로 직렬화함.
+      엔드포인트가 Response 를 반환하므로 FastAPI 의 response_model 검증/직렬화도 건너뜀 (OpenAPI 스키마는 그대로임).
+    - names 가 응답 모델의 필드 순서와 같으면 response_model 을 거친 응답과 같은 bytes 가 됨.
+    """
+    body = fastjson.rows(names, rows)
+    headers = {name: response.headers[name] for name in ("ETag", "X-Next-Cursor") if name in response.headers}
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# 함께 담을 연관 데이터 (?include=) 목록
+INCLUDE_OPTIONS = ("author",)
+
+# 연관 데이터 포함(?include=) 파라미터 해석 함수
+def parse_include(include: str | None) -> set[str]:
+    """
+    ?include=author 형식의 파라미터를 연관 데이터 이름 집합으로 변환하는 함수.
+
+    Raises:
+    - HTTPException: 지원하지 않는 이름이 있으면 400 예외를 발생시킴
+    """
+    if not include:
+        return set()
+    names = {name.strip() for name in include.split(",") if name.strip()}
+    unknown = sorted(names.difference(INCLUDE_OPTIONS))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include: {', '.join(unknown)}")
+    return names
+
+# 작성자를 함께 읽는 게시글 조회 옵션 생성 함수
+def author_options(names: list[str] | None, loader=selectinload) -> list:
+    """
+    게시글과 작성자(id, name)를 함께 읽는 ORM 조회 옵션을 만드는 함수.
+
+    Parameters:
+    - names (list[str] | None): 읽을 게시글 컬럼 (None이면 전체 컬럼)
+    - loader: 작성자 로딩 방식. 목록은 selectinload (페이지의 작성자를 IN 조회 한 번으로 읽음),
+      개별 조회는 joinedload (게시글과 같은 SELECT 문에서 JOIN 으로 읽음)
+
+    설명:
+    - 작성자를 지연 로딩(lazy)으로 읽으면 게시글마다 SELECT 가 한 번씩 더 실행되므로(N+1) 미리 함께 읽음.
+    - 컬럼을 선택한 경우에도 작성자를 찾는 데 필요한 author_id 는 함께 읽음 (응답에는 선택한 컬럼만 담김).
+    """
+    options = [loader(Post.author).load_only(User.id, User.name)]
+    if names is not None:
+        options.append(load_only(*(getattr(Post, name) for name in dict.fromkeys([*names, "author_id"]))))
+    return options
+
+# 작성자를 포함한 게시글 행 생성 함수
+def post_with_author_row(names: list[str], db_post: Post) -> list:
+    """
+    게시글 객체에서 names 컬럼 값과 작성자({id, name} 또는 None)를 차례로 담은 행을 만드는 함수 ([*names, "author"] 순서).
+    """
+    author = db_post.author
+    values = [getattr(db_post, name) for name in names]
+    values.append({"id": author.id, "name": author.name} if author is not None else None)
+    return values
+
+# 게시글 파생 데이터 동기화 함수 (작성/수정)
+def on_post_saved(db: Session, db_post: Post, old_facets: dict | None = None):
+    """
+    게시글 작성/수정 후 같은 트랜잭션 안에서 검색 인덱스, 태그, 필터 집계, 테이블 버전을 갱신하는 함수.
+    매칭 인덱스(메모리)는 커밋된 뒤에 반영됨.
+
+    Parameters:
+    - db (Session): SQLAlchemy 세션 객체
+    - db_post (Post): 저장된 게시글 객체 (post.id가 필요하므로 flush 이후에 호출해야 함)
+    - old_facets (dict | None): 수정 전 필터 값 (작성 시 None)
+    """
+    search.index_post(db, db_post)
+    tags.set_post_tags(db, db_post.id, db_post.hashtags)
+    facets.apply_changes(db, old_facets, facets.facet_values(db_post))
+    matching.track_post(db, db_post)
+    versions.bump(db, versions.POSTS)
+
+# 게시글 파생 데이터 동기화 함수 (삭제)
+def on_post_deleted(db: Session, db_post: Post):
+    """
+    게시글 삭제와 같은 트랜잭션 안에서 검색 인덱스, 태그, 필터 집계에서 게시글을 제거하고 테이블 버전을 갱신하는 함수.
+    """
+    search.unindex_post(db, db_post.id)
+    tags.remove_post_tags(db, db_post.id)
+    facets.apply_changes(db, facets.facet_values(db_post), None)
+    matching.untrack_post(db, db_post.id)
+    versions.bump(db, versions.POSTS)
+
+# 게시글 파생 데이터 동기화 함수 (대량 등록)
+def on_posts_created(db: Session, rows: list[dict]):
+    """
+    대량 등록된 게시글을 같은 트랜잭션 안에서 검색 인덱스, 태그, 필터 집계에 한 번에 반영하고 테이블 버전을 갱신하는 함수.
+
+    Parameters:
+    - db (Session): SQLAlchemy 세션 객체
+    - rows (list[dict]): id 가 채워진 게시글 컬럼 값 목록
+    """
+    search.index_new_posts(db, rows)
+    tags.add_new_posts_tags(db, [(row["id"], row["hashtags"]) for row in rows])
+    facets.apply_new_posts(db, rows)
+    matching.track_new_posts(db, rows)
+    versions.bump(db, versions.POSTS)
+
+# 대량 등록 처리 함수
+def bulk_create(db: Session, items: list, schema, model, name: str, extra: dict | None = None, after_insert=None, prepare_row=None) -> dict:
+    """
+    항목 목록을 검증하고, 통과한 항목을 하나의 트랜잭션 안에서 묶음 INSERT 로 저장하는 함수.
+
+    Parameters:
+    - db (Session): SQLAlchemy 세션 객체
+    - items (list): bulk.parse_items() 로 해석한 항목 목록
+    - schema: 항목 검증에 사용할 Pydantic 모델 (PostCreate, ResumeCreate)
+    - model: 저장할 SQLAlchemy 모델 (Post, Resume)
+    - name (str): 테이블 이름 (versions.POSTS, versions.RESUMES)
+    - extra (dict | None): 모든 행에 공통으로 넣을 컬럼 값
+    - after_insert: (db, id가 채워진 행 목록)을 받아 파생 데이터를 갱신하는 함수. 없으면 테이블 버전만 갱신함
+    - prepare_row: INSERT 전에 행 dict 하나를 받아 파생 컬럼 값을 채우는 함수
+
+    Returns:
+    - dict: BulkResponse 형식의 결과
+
+    설명:
+    - 검증에 실패한 항목은 저장하지 않고 결과에 오류로 표시하며, 나머지 항목은 그대로 저장함.
+    - 커밋은 마지막에 한 번만 수행하므로, 저장 중 오류가 나면 모든 항목이 롤백됨.
+    """
+    valid, errors = bulk.validate_items(schema, items)
+    rows = [{**values, **(extra or {})} for _, values in valid]
+    if prepare_row is not None:
+        for row in rows:
+            prepare_row(row)
+    ids: dict[int, int] = {}
+    if rows:
+        new_ids = bulk.insert_rows(db, model, rows)
+        for row, new_id in zip(rows, new_ids):
+            row["id"] = new_id
+        ids = {index: new_id for (index, _), new_id in zip(valid, new_ids)}
+        if after_insert is not None:
+            after_insert(db, rows)
+        else:
+            versions.bump(db, name)
+        db.commit()
+    return {"inserted": len(ids), "failed": len(errors), "results": bulk.results(len(items), ids, errors)}
+
+# 대량 등록 요청 본문 해석 함수
+async def read_bulk_items(request: Request) -> list:
+    """
+    대량 등록 요청 본문(JSON 배열 또는 NDJSON)을 항목 목록으로 해석하는 함수.
+    본문 전체를 해석할 수 없으면 HTTP 400 예외를 발생시킴.
+    """
+    try:
+        return bulk.parse_items(await request.body(), request.headers.get("content-type"))
+    except bulk.BulkError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+# 게시글 응답 직렬화 함수
+def serialize_post(db_post: Post) -> bytes:
+    """
+    게시글을 PostResponse JSON bytes로 직렬화하는 함수 (응답 캐시에 그대로 저장됨).
+    """
+    return PostResponse.model_validate(db_post).model_dump_json().encode()
+
+# 이력서 응답 직렬화 함수
+def serialize_resume(db_resume: Resume) -> bytes:
+    """
+    이력서를 ResumeResponse JSON bytes로 직렬화하는 함수 (응답 캐시에 그대로 저장됨).
+    """
+    return ResumeResponse.model_validate(db_resume).model_dump_json().encode()
+
+# 304 Not Modified 응답 생성 함수
+def not_modified(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+# 캐시를 거치는 개별 항목 조회 함수
+def read_cached_item(request: Request, name: str, item_id: int, key: str | None, current_version, load_item, variant: str = "") -> Response:
+    """
+    ETag와 응답 캐시를 적용하여 개별 게시글/이력서를 조회하는 함수.
+
+    Parameters:
+    - request (Request): If-None-Match 헤더를 읽을 요청 객체
+    - name (str): 테이블 이름 (versions.POSTS, versions.RESUMES)
+    - item_id (int): 조회할 항목 ID
+    - key (str | None): 응답 캐시 키 (None이면 캐시를 사용하지 않음)
+    - current_version: 테이블의 현재 버전을 반환하는 함수
+    - load_item: (버전, 직렬화된 본문)을 반환하는 함수. 항목과 버전을 같은 SELECT 문으로 읽어야 하며,
+      항목이 없으면 404 예외를 발생시켜야 함
+    - variant (str): 응답 형태 구분 값 (필드 선택 시 필드 목록), ETag에 반영됨
+
+    Returns:
+    - Response: JSON 응답 또는 304 응답
+
+    설명:
+    - 캐시에는 ETag와 본문을 함께 저장하므로, 캐시 적중 시에는 DB 조회 없이 304 또는 본문을 반환함.
+    - 캐시에 없으면 테이블 버전만 먼저 읽어 ETag가 일치하면 항목 조회와 직렬화 없이 304를 반환함.
+    - 조회한 응답은 조회 후 다시 읽은 테이블 버전이 같고, 조회를 시작한 뒤 키가 무효화되지 않았을 때만 캐시에 저장함.
+      (다른 요청의 수정 커밋/무효화와 겹친 조회가 수정 전 응답을 캐시에 다시 넣지 않게 함)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    cached = response_cache.get(key) if key is not None else None
+    if cached is not None:
+        etag, body = versions.unpack(cached)
+    else:
+        if if_none_match:
+            etag = versions.item_etag(name, item_id, current_version(), variant)
+            if versions.etag_matches(if_none_match, etag):
+                return not_modified(etag)
+        generation = response_cache.generation(key) if key is not None else None
+        version, body = load_item()
+        etag = versions.item_etag(name, item_id, version, variant)
+        # 조회하는 동안 수정이 커밋되었으면(테이블 버전이 바뀌었거나 키가 무효화되었으면) 수정 전 응답을 캐시에 넣지 않음
+        if key is not None and current_version() == (version or 0):
+            response_cache.set(key, versions.pack(etag, body), generation)  # ETag와 직렬화된 응답을 함께 캐시에 저장함
+    if versions.etag_matches(if_none_match, etag):
+        return not_modified(etag)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+# 개별 항목 조회 함수
+def read_item(request: Request, db: Session, model, name: str, item_id: int, key: str, serialize, fields: str | None) -> Response:
+    """
+    개별 게시글/이력서 조회 엔드포인트의 공통 처리 함수.
+
+    Parameters:
+    - model: 조회할 SQLAlchemy 모델 (Post, Resume)
+    - name (str): 테이블 이름 (versions.POSTS, versions.RESUMES)
+    - key (str): 응답 캐시 키
+    - serialize: ORM 객체를 응답 JSON bytes로 직렬화하는 함수
+    - fields (str | None): ?fields= 파라미터
+
+    설명:
+    - fields가 없으면 전체 응답을 응답 캐시와 함께 사용함.
+    - fields가 있으면 선택한 컬럼만 SELECT 하며, 응답 형태가 다르므로 캐시를 사용하지 않고 ETag도 따로 만듦.
+    """
+    names = select_fields(model, fields)
+
+    def load_item():
+        # 항목과 테이블 버전을 같은 SELECT 문으로 함께 조회함
+        version = versions.version_subquery(name)
+        if names is None:
+            row = db.query(model, version).filter(model.id == item_id).first()
+        else:
+            row = projection_query(db, model, names, version).filter(model.id == item_id).first()
+        if not row:
+            raise HTTPException(status_code=404, detail=f"{model.__name__} not found")  # 항목이 존재하지 않으면 HTTP 404 예외를 발생시킴
+        return row[-1], serialize(row[0]) if names is None else serialize_fields(names, row)
+
+    return read_cached_item(
+        request, name, item_id, key if names is None else None,
+        lambda: versions.current(db, name), load_item, ",".join(names or ()),
+    )
+
+# 목록 페이지 ETag 확인 함수
+def check_list_etag(request: Request, response: Response, db: Session, name: str, *related: str) -> Response | None:
+    """
+    목록 페이지의 ETag를 만들어 응답 헤더에 담고, If-None-Match와 일치하면 304 응답을 반환하는 함수.
+    목록 조회보다 먼저 버전을 읽으므로, 그 사이에 쓰기가 있었다면 다음 요청에서 ETag가 달라져 새로 받게 됨.
+    related 로 다른 테이블(예: 작성자를 담을 때 versions.USERS)을 주면 그 테이블의 버전도 ETag 에 반영함.
+    """
+    version = versions.combined(db, name, *related) if related else versions.current(db, name)
+    etag = versions.list_etag(name, version, request.url.query)
+    if versions.etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag)
+    response.headers["ETag"] = etag
+    return None
+
 # 비밀번호 해시화 함수
 def get_password_hash(password):
     """
     비밀번호를 해시화하여 저장하기 위한 함수.
     passlib의 CryptContext를 사용하여 bcrypt 해시 알고리즘을 적용함.
+    계산은 해시 전용 프로세스 풀에서 실행되며, 풀이 포화 상태이면 HashPoolSaturated 예외가 발생함.
     """
-    return pwd_context.hash(password)
+    return hashing.hash_password(password)
 
 # 비밀번호 검증 함수
 def verify_password(plain_password, hashed_password):
     """
     입력된 평문 비밀번호와 저장된 해시화된 비밀번호를 비교하여 일치 여부를 확인하는 함수.
+    계산은 해시 전용 프로세스 풀에서 실행되며, 풀이 포화 상태이면 HashPoolSaturated 예외가 발생함.
+    """
+    return hashing.check_password(plain_password, hashed_password)
+
+# 해시 풀 포화 예외 처리 함수
+def hash_pool_saturated_handler(request, exc: hashing.HashPoolSaturated):
+    """
+    해시 풀이 포화 상태일 때 요청을 오래 기다리게 하지 않고 바로 503 응답을 반환하는 예외 처리 함수.
+    """
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry later"},
+        headers={"Retry-After": "1"},
+    )
+
+app.add_exception_handler(hashing.HashPoolSaturated, hash_pool_saturated_handler)
+
+# 속도 제한 예외 처리 함수
+def rate_limited_handler(request, exc: ratelimit.RateLimited):
+    """
+    클라이언트 IP 또는 이메일의 허용 속도를 넘은 요청에 429 응답과 다시 시도할 시각(Retry-After, 초)을 반환하는 예외 처리 함수.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many requests, please retry later"},
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+    )
+
+app.add_exception_handler(ratelimit.RateLimited, rate_limited_handler)
 
 # 사용자 인증 함수
 def authenticate_user(db: Session, email: str, password: str):
@@ -179,18 +665,82 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None):
     else:
         expire = datetime.utcnow() + timedelta(minutes=15)  # 기본적인 만료 시간 설정 (15분 후)
     to_encode.update({"exp": expire})  # to_encode 딕셔너리에 만료 시간(exp)을 추가함
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)  # JWT를 생성하여 encoded_jwt에 저장함
+    from jose import jwt  # 임포트 비용이 크므로 처음 토큰을 만들 때 임포트함
+    with metrics.timed("jwt"):
+        encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)  # JWT를 생성하여 encoded_jwt에 저장함
     return encoded_jwt  # 생성된 JWT 액세스 토큰을 반환함
 
+# 인증 예외 생성 함수
+def credentials_exception():
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+# 액세스 토큰 검증 함수
+def decode_access_token(token: str) -> tuple[TokenData, int]:
+    """
+    액세스 토큰의 서명과 만료 시간을 검증하고 토큰 데이터를 반환하는 함수.
+
+    Returns:
+    - tuple[TokenData, int]: 토큰에 담긴 이메일(sub)과 만료 시각(exp, Unix timestamp)
+
+    Raises:
+    - HTTPException: 서명이 올바르지 않거나, 만료되었거나, sub가 없는 경우 401 예외를 발생시킴
+    """
+    from jose import JWTError, jwt  # 임포트 비용이 크므로 처음 토큰을 검증할 때 임포트함
+    try:
+        with metrics.timed("jwt"):
+            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        raise credentials_exception()
+    email = payload.get("sub")
+    if email is None:
+        raise credentials_exception()
+    return TokenData(email=email), payload["exp"]
+
+# 현재 로그인한 사용자를 가져오는 의존성 함수
+def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
+    """
+    Authorization 헤더의 액세스 토큰으로 현재 사용자를 조회하는 의존성 함수.
+
+    Parameters:
+    - token (str): Bearer 액세스 토큰
+
+    Returns:
+    - User: 현재 사용자 객체 (세션에 연결되지 않은 읽기 전용 객체)
+
+    Raises:
+    - HTTPException: 토큰이 올바르지 않거나 사용자가 없는 경우 401 예외를 발생시킴
+
+    설명:
+    - 검증이 끝난 토큰은 인증 사용자 캐시에 토큰의 만료 시각까지 보관되므로,
+      같은 토큰으로 들어오는 요청은 JWT 검증과 DB 조회 없이 처리됨.
+    - 캐시에 없을 때만 토큰을 검증하고 users 테이블을 조회함.
+    """
+    user = principal_cache.get(token)
+    if user is not None:
+        return user
+    token_data, expires_at = decode_access_token(token)
+    with SessionLocal() as db:
+        user = db.query(User).filter(User.email == token_data.email).first()
+        if user is None:
+            raise credentials_exception()
+        principal_cache.put(token, user, expires_at)
+        db.expunge(user)
+    return user
+
 # 회원가입 엔드포인트
 @app.post("/register", response_model=dict)
-def register(user: UserCreate, db: Session = Depends(get_db)):
+def register(user: UserCreate, request: Request, db: Session = Depends(get_db)):
     """
     사용자 회원가입을 처리하는 엔드포인트.
     입력된 사용자 정보를 데이터베이스에 저장하고, 성공 메시지를 반환함.
     
     Parameters:
     - user (UserCreate): 회원가입을 위한 사용자 정보를 담은 Pydantic 모델
+    - request (Request): 클라이언트 IP 를 확인하기 위한 요청 객체
     - db (Session): SQLAlchemy 세션 객체
     
     Returns:
@@ -198,7 +748,9 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
     
     Raises:
     - HTTPException: 이미 등록된 이메일 주소를 사용하여 회원가입을 시도했을 경우 400 예외를 발생시킴
+    - RateLimited: 클라이언트 IP 또는 이메일의 허용 속도를 넘은 경우 (429 응답으로 변환됨)
     """
+    ratelimit.check_auth(request, user.email)  # DB 조회와 해시 계산 전에 속도 제한을 검사함
     db_user = db.query(User).filter(User.email == user.email).first()  # 데이터베이스에서 이메일로 사용자를 조회함
     if db_user:
         raise HTTPException(
@@ -215,19 +767,21 @@ def register(user: UserCreate, db: Session = Depends(get_db)):
         birthdate=user.birthdate
     )  # 입력된 사용자 정보로 새로운 User 객체를 생성함
     db.add(new_user)  # 데이터베이스에 새로운 사용자 정보를 추가함
+    versions.bump(db, versions.USERS)  # 작성자 정보를 담은 게시글 응답의 ETag 가 바뀌도록 users 테이블 버전을 증가시킴
     db.commit()  # 데이터베이스의 변경 사항을 커밋함
     db.refresh(new_user)  # 데이터베이스에서 최신 상태로 사용자 정보를 새로고침함
     return {"message": "User registered successfully"}  # 회원가입 성공 메시지를 반환함
 
 # 로그인 엔드포인트
 @app.post("/login", response_model=Token)
-def login(user: UserLogin, db: Session = Depends(get_db)):
+def login(user: UserLogin, request: Request, db: Session = Depends(get_db)):
     """
     사용자 로그인을 처리하는 엔드포인트.
     입력된 이메일 주소와 비밀번호를 검증하여, 액세스 토큰을 발급함.
     
     Parameters:
     - user (UserLogin): 사용자 로그인 정보를 담은 Pydantic 모델
+    - request (Request): 클라이언트 IP 를 확인하기 위한 요청 객체
     - db (Session): SQLAlchemy 세션 객체
     
     Returns:
@@ -235,7 +789,9 @@ def login(user: UserLogin, db: Session = Depends(get_db)):
     
     Raises:
     - HTTPException: 잘못된 이메일 주소 또는 비밀번호로 로그인 시도했을 경우 401 예외를 발생시킴
+    - RateLimited: 클라이언트 IP 또는 이메일의 허용 속도를 넘은 경우 (429 응답으로 변환됨)
     """
+    ratelimit.check_auth(request, user.email)  # DB 조회와 해시 계산 전에 속도 제한을 검사함
     db_user = authenticate_user(db, user.email, user.password)  # 사용자 로그인 인증을 수행함
     if not db_user:
         raise HTTPException(
@@ -250,6 +806,26 @@ def login(user: UserLogin, db: Session = Depends(get_db)):
     )  # 인증된 사용자 정보를 바탕으로 액세스 토큰을 생성함
     return {"access_token": access_token, "token_type": "bearer"}  # 발급된 액세스 토큰을 반환함
 
+# 현재 사용자 조회 엔드포인트
+@app.get("/users/me", response_model=UserResponse)
+def read_current_user(current_user: User = Depends(get_current_user)):
+    """
+    액세스 토큰으로 인증된 현재 사용자 정보를 반환하는 엔드포인트.
+    """
+    return current_user
+
+# 새 게시글을 세션에 추가하는 함수
+def save_new_post(db: Session, post: PostCreate) -> Post:
+    """
+    새 게시글을 추가하고 검색 인덱스, 태그, 필터 집계에 같은 트랜잭션으로 반영하는 함수 (커밋은 호출한 쪽에서 함).
+    """
+    db_post = Post(**post.dict(), author_id=1)  # 입력된 게시글 정보로 Post 객체를 생성함
+    postfields.apply(db_post)  # 연봉/마감일 문자열로 범위 검색용 컬럼 값을 채움
+    db.add(db_post)  # 데이터베이스에 새로운 게시글 정보를 추가함
+    db.flush()  # 게시글 ID를 발급받기 위해 INSERT를 먼저 실행함
+    on_post_saved(db, db_post)  # 같은 트랜잭션에서 검색 인덱스, 태그, 필터 집계에 게시글을 반영함
+    return db_post
+
 # 게시글 작성 엔드포인트
 @app.post("/posts/", response_model=PostResponse)
 def create_post(post: PostCreate, db: Session = Depends(get_db)):
@@ -264,54 +840,275 @@ def create_post(post: PostCreate, db: Session = Depends(get_db)):
     Returns:
     - PostResponse: 작성된 게시글 정보를 담은 Pydantic 모델
     """
-    db_post = Post(**post.dict(), author_id=1)  # 입력된 게시글 정보로 Post 객체를 생성함
-    db.add(db_post)  # 데이터베이스에 새로운 게시글 정보를 추가함
+    if writebatch.WRITE_BATCH_ENABLED:
+        # 묶음 커밋 모드에서는 쓰기 스레드가 다른 작성/수정 요청과 함께 커밋함
+        return writebatch.writer.run(lambda session: PostResponse.model_validate(save_new_post(session, post)))
+    db_post = save_new_post(db, post)  # 게시글과 파생 데이터를 세션에 추가함
     db.commit()  # 데이터베이스의 변경 사항을 커밋함
     db.refresh(db_post)  # 데이터베이스에서 최신 상태로 게시글 정보를 새로고침함
     return db_post  # 작성된 게시글 정보를 반환함
 
+# 게시글 대량 등록 엔드포인트
+@app.post("/posts/bulk", response_model=BulkResponse)
+async def create_posts_bulk(request: Request, db: Session = Depends(get_db)):
+    """
+    여러 게시글을 한 번에 등록하는 엔드포인트 (제휴 채용 사이트 수집 작업용).
+
+    Parameters:
+    - request (Request): JSON 배열 또는 NDJSON(한 줄에 게시글 하나) 본문을 담은 요청 객체
+    - db (Session): SQLAlchemy 세션 객체
+
+    Returns:
+    - BulkResponse: 저장/실패 항목 수와 항목별 ID 또는 오류
+
+    설명:
+    - 각 항목은 PostCreate 모델로 검증하며, 실패한 항목만 제외하고 나머지를 저장함.
+    - 게시글은 묶음 INSERT 로 저장하고, 검색 인덱스/태그/필터 집계도 한 번에 반영한 뒤 한 번만 커밋함.
+    """
+    items = await read_bulk_items(request)
+    return await run_in_threadpool(
+        bulk_create, db, items, PostCreate, Post, versions.POSTS, {"author_id": 1}, on_posts_created, postfields.apply
+    )  # DB 작업은 스레드풀에서 실행함
+
 # 게시글 목록 조회 엔드포인트
 @app.get("/posts/", response_model=list[PostResponse2])
-def read_posts(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
+def read_posts(
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1),
+    cursor: str | None = None,
+    fields: str | None = None,
+    salary_min: int | None = None,
+    salary_max: int | None = None,
+    deadline_from: date | None = None,
+    deadline_to: date | None = None,
+    include: str | None = None,
+    db: Session = Depends(get_db),
+):
     """
     게시글 목록을 조회하는 엔드포인트.
     입력된 페이징 파라미터에 따라 데이터베이스에서 게시글을 조회하고, 조회된 게시글 목록을 반환함.
     
     Parameters:
-    - skip (int): 건너뛸 게시글 개수
+    - skip (int): 건너뛸 게시글 개수 (기존 클라이언트 호환용, cursor 사용 권장)
     - limit (int): 조회할 게시글 개수
+    - cursor (str | None): 이전 응답의 X-Next-Cursor 헤더 값
+    - fields (str | None): 응답에 담을 필드 목록 (쉼표로 구분, 예: "id,title,company_name")
+    - salary_min (int | None): 연봉 상한이 이 값(만원) 이상인 게시글만 조회 (예: 4000 → 연봉 4000만원 이상 가능)
+    - salary_max (int | None): 연봉 하한이 이 값(만원) 이하인 게시글만 조회
+    - deadline_from (date | None): 마감일이 이 날짜 이후인 게시글만 조회 (예: 오늘 날짜 → 마감되지 않은 게시글)
+    - deadline_to (date | None): 마감일이 이 날짜 이전인 게시글만 조회 (예: 7일 뒤 날짜 → 7일 안에 마감)
+    - include (str | None): "author" 이면 게시글마다 작성자 정보(author: {id, name})를 함께 담음
     - db (Session): SQLAlchemy 세션 객체
     
     Returns:
     - list[PostResponse]: 조회된 게시글 목록을 담은 리스트
+      (다음 페이지가 있으면 X-Next-Cursor 응답 헤더에 다음 커서를 담음)
+      If-None-Match가 현재 ETag와 일치하면 목록을 조회하지 않고 304를 반환함
+
+    설명:
+    - 필요한 컬럼만 SELECT 하므로 게시글 본문(content)처럼 큰 컬럼은 읽지 않음.
+    - fields가 주어지면 해당 컬럼만 조회하여 그대로 반환함 (id는 항상 포함됨).
+    - 연봉/마감일 조건은 (컬럼, id) 복합 인덱스의 범위 검색으로 처리되므로 테이블 전체를 읽지 않음.
+    - 작성자를 포함하면 페이지의 작성자를 IN 조회 한 번으로 함께 읽으므로, 페이지 크기와 관계없이 SELECT 수가 일정함.
+    - 조회한 행은 PostResponse2 로 다시 검증하지 않고 곧바로 JSON 으로 직렬화함 (응답 bytes 는 같음).
     """
-    posts = db.query(Post).offset(skip).limit(limit).all()  # 데이터베이스에서 게시글을 조회함
+    with_author = "author" in parse_include(include)
+    unchanged = check_list_etag(request, response, db, versions.POSTS, *([versions.USERS] if with_author else []))
+    if unchanged is not None:
+        return unchanged
+    names = select_fields(Post, fields, POST_LIST_FIELDS)
+    if with_author:
+        query = db.query(Post).options(*author_options(names, selectinload))
+    else:
+        query = projection_query(db, Post, names)
+    query, id_column = postfields.filter_posts(query, salary_min, salary_max, deadline_from, deadline_to)
+    posts = paginate(query, id_column, response, skip, limit, cursor)  # 데이터베이스에서 게시글을 조회함
+    if with_author:
+        return projected_list_response([*names, "author"], [post_with_author_row(names, post) for post in posts], response)
+    if fields or FAST_LIST_RESPONSES:
+        return projected_list_response(names, posts, response)
+    return [post._asdict() for post in posts]
+
+# 게시글 검색 엔드포인트 (/posts/{post_id} 보다 먼저 등록해야 함)
+@app.get("/posts/search", response_model=list[PostSearchResult])
+def search_posts(
+    q: str,
+    job_type: str | None = None,
+    career: str | None = None,
+    joblocation: str | None = None,
+    Education: str | None = None,
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    검색어로 게시글을 검색하는 엔드포인트.
+    제목, 회사 이름, 본문, 해시태그를 대상으로 전문 검색을 수행하고, 관련도(bm25) 순으로 반환함.
+
+    Parameters:
+    - q (str): 검색어 (공백으로 구분된 단어는 모두 포함되어야 함, 단어 앞부분만 입력해도 검색됨)
+    - job_type, career, joblocation, Education (str | None): 결과를 좁히는 동등 조건 필터
+    - limit (int): 조회할 게시글 개수
+    - db (Session): SQLAlchemy 세션 객체
+
+    Returns:
+    - list[PostSearchResult]: 관련도 순으로 정렬된 게시글 목록
+    """
+    filters = {"job_type": job_type, "career": career, "joblocation": joblocation, "Education": Education}
+    rows = search.search_posts(db, q, filters, limit)
+    return [
+        PostSearchResult(id=id, company_name=company_name, title=title, hashtags=hashtags, author_id=author_id, score=score)
+        for id, company_name, title, hashtags, author_id, score in rows
+    ]
+
+# 태그 조합 게시글 조회 엔드포인트 (/posts/{post_id} 보다 먼저 등록해야 함)
+@app.get("/posts/by-tags", response_model=list[PostResponse2])
+def read_posts_by_tags(
+    all_tags: str | None = Query(None, alias="all"),
+    any_tags: str | None = Query(None, alias="any"),
+    limit: int = Query(10, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    """
+    해시태그 조합으로 게시글을 조회하는 엔드포인트.
+
+    Parameters:
+    - all (str | None): 모두 포함해야 하는 태그 목록 (쉼표로 구분, 예: "python,remote")
+    - any (str | None): 하나 이상 포함해야 하는 태그 목록 (쉼표로 구분)
+    - limit (int): 조회할 게시글 개수
+    - db (Session): SQLAlchemy 세션 객체
+
+    Returns:
+    - list[PostResponse2]: 조건에 맞는 게시글 목록 (최신순)
+    """
+    post_ids = tags.find_post_ids(db, tags.parse_hashtags(all_tags), tags.parse_hashtags(any_tags), limit)
+    if not post_ids:
+        return []
+    posts = db.query(Post).filter(Post.id.in_(post_ids)).order_by(Post.id.desc()).all()
     return [
         PostResponse2(id=post.id,company_name=post.company_name,hashtags=post.hashtags, title=post.title, author_id=post.author_id)
         for post in posts
     ]
 
+# 게시글 필터 집계 조회 엔드포인트 (/posts/{post_id} 보다 먼저 등록해야 함)
+@app.get("/posts/facets", response_model=dict[str, list[FacetValue]])
+def read_post_facets(db: Session = Depends(get_db)):
+    """
+    목록 화면의 필터 옆에 표시할 필터 값별 게시글 수를 조회하는 엔드포인트.
+
+    Returns:
+    - dict[str, list[FacetValue]]: job_type, career, joblocation, Education, salary 별 (값, 게시글 수) 목록
+
+    설명:
+    - 게시글 작성/수정/삭제 시 함께 갱신되는 facet_counts 테이블만 읽으므로 게시글 수와 무관하게 빠름.
+    - 집계가 어긋난 경우 `python manage.py rebuild-facets` 로 다시 만들 수 있음.
+    """
+    return {
+        facet: [FacetValue(value=value, count=count) for value, count in values]
+        for facet, values in facets.read_facets(db).items()
+    }
+
+# 태그 빈도 조회 엔드포인트
+@app.get("/tags/", response_model=list[TagFrequency])
+def read_tag_frequencies(limit: int = Query(50, ge=1, le=MAX_PAGE_SIZE), db: Session = Depends(get_db)):
+    """
+    게시글이 많이 달린 순서대로 해시태그와 게시글 수를 조회하는 엔드포인트.
+    """
+    return [TagFrequency(name=name, count=count) for name, count in tags.tag_frequencies(db, limit)]
+
+# 게시글 전체 내보내기 엔드포인트
+@app.get("/posts/export")
+def export_posts(format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    """
+    게시글 전체를 NDJSON 또는 CSV 로 내보내는 엔드포인트 (분석용).
+
+    Parameters:
+    - format (str): 내보내기 형식 ("ndjson" 또는 "csv")
+
+    Returns:
+    - StreamingResponse: 게시글을 ID 순서로 조금씩 읽어 바로 전송하는 스트리밍 응답
+    """
+    return StreamingResponse(
+        export.stream_table(Post, format), media_type=export.MEDIA_TYPES[format], headers=export.headers("posts", format)
+    )
+
 # 개별 게시글 조회 엔드포인트
 @app.get("/posts/{post_id}", response_model=PostResponse)
-def read_post(post_id: int, db: Session = Depends(get_db)):
+def read_post(post_id: int, request: Request, fields: str | None = None, include: str | None = None, db: Session = Depends(get_db)):
     """
     특정 게시글을 조회하는 엔드포인트.
     입력된 게시글 ID를 사용하여 데이터베이스에서 게시글을 조회하고, 조회된 게시글을 반환함.
     
     Parameters:
     - post_id (int): 조회할 게시글의 ID
+    - fields (str | None): 응답에 담을 필드 목록 (쉼표로 구분, 선택한 컬럼만 조회함)
+    - include (str | None): "author" 이면 작성자 정보(author: {id, name})를 함께 담음
     - db (Session): SQLAlchemy 세션 객체
     
     Returns:
     - PostResponse: 조회된 게시글 정보를 담은 Pydantic 모델
     
+    Raises:
+    - HTTPException: 해당 게시글 ID가 존재하지 않을 경우 404 예외를 발생시킴
+
+    설명:
+    - 직렬화된 응답을 응답 캐시에 보관하므로, 캐시에 있는 게시글은 DB 조회와 직렬화 없이 반환됨.
+    - 게시글이 수정/삭제되면 해당 캐시 항목이 무효화됨.
+    - posts 테이블 버전으로 만든 ETag를 함께 반환하며, If-None-Match가 일치하면 304를 반환함.
+    """
+    if "author" in parse_include(include):
+        return read_post_with_author(request, db, post_id, fields)
+    return read_item(request, db, Post, versions.POSTS, post_id, post_key(post_id), serialize_post, fields)  # 조회된 게시글 정보를 반환함
+
+# 작성자를 포함한 개별 게시글 조회 함수
+def read_post_with_author(request: Request, db: Session, post_id: int, fields: str | None) -> Response:
+    """
+    게시글과 작성자를 JOIN 하여 SELECT 문 한 번으로 읽는 함수 (?include=author).
+
+    설명:
+    - 응답에 users 테이블의 데이터가 들어가므로 ETag 에 posts 와 users 의 버전을 함께 반영하고, 응답 캐시는 사용하지 않음.
+    """
+    names = select_fields(Post, fields)
+
+    def load_item():
+        row = (
+            db.query(Post, versions.version_subquery(versions.POSTS), versions.version_subquery(versions.USERS))
+            .options(*author_options(names, joinedload))
+            .filter(Post.id == post_id)
+            .first()
+        )
+        if not row:
+            raise HTTPException(status_code=404, detail="Post not found")
+        db_post, posts_version, users_version = row
+        if names is None:
+            body = PostWithAuthor.model_validate(db_post).model_dump_json().encode()
+        else:
+            body = serialize_fields([*names, "author"], post_with_author_row(names, db_post))
+        return f"{posts_version or 0}.{users_version or 0}", body
+
+    return read_cached_item(
+        request, versions.POSTS, post_id, None,
+        lambda: versions.combined(db, versions.POSTS, versions.USERS), load_item, "author;" + ",".join(names or ()),
+    )
+
+# 게시글 수정 내용을 세션에 반영하는 함수
+def apply_post_update(db: Session, post_id: int, post: PostCreate) -> Post:
+    """
+    게시글 수정 내용과 검색 인덱스, 태그, 필터 집계 변경분을 같은 트랜잭션에 반영하는 함수 (커밋은 호출한 쪽에서 함).
+
     Raises:
     - HTTPException: 해당 게시글 ID가 존재하지 않을 경우 404 예외를 발생시킴
     """
-    post = db.query(Post).filter(Post.id == post_id).first()  # 게시글 ID를 사용하여 데이터베이스에서 게시글을 조회함
-    if not post:
+    db_post = db.query(Post).filter(Post.id == post_id).first()  # 게시글 ID를 사용하여 데이터베이스에서 게시글을 조회함
+    if not db_post:
         raise HTTPException(status_code=404, detail="Post not found")  # 게시글이 존재하지 않으면 HTTP 404 예외를 발생시킴
-    return post  # 조회된 게시글 정보를 반환함
+    old_facets = facets.facet_values(db_post)  # 수정 전 필터 값을 기록함
+    for key, value in post.dict().items():
+        setattr(db_post, key, value)  # 입력된 수정 정보로 게시글 객체를 업데이트함
+    postfields.apply(db_post)  # 연봉/마감일 문자열로 범위 검색용 컬럼 값을 다시 채움
+    on_post_saved(db, db_post, old_facets)  # 같은 트랜잭션에서 검색 인덱스, 태그, 필터 집계 변경분을 반영함
+    return db_post
 
 # 게시글 수정 엔드포인트
 @app.put("/posts/{post_id}", response_model=PostResponse)
@@ -331,12 +1128,14 @@ def update_post(post_id: int, post: PostCreate, db: Session = Depends(get_db)):
     Raises:
     - HTTPException: 해당 게시글 ID가 존재하지 않을 경우 404 예외를 발생시킴
     """
-    db_post = db.query(Post).filter(Post.id == post_id).first()  # 게시글 ID를 사용하여 데이터베이스에서 게시글을 조회함
-    if not db_post:
-        raise HTTPException(status_code=404, detail="Post not found")  # 게시글이 존재하지 않으면 HTTP 404 예외를 발생시킴
-    for key, value in post.dict().items():
-        setattr(db_post, key, value)  # 입력된 수정 정보로 게시글 객체를 업데이트함
+    if writebatch.WRITE_BATCH_ENABLED:
+        # 묶음 커밋 모드에서는 쓰기 스레드가 다른 작성/수정 요청과 함께 커밋함
+        updated = writebatch.writer.run(lambda session: PostResponse.model_validate(apply_post_update(session, post_id, post)))
+        response_cache.invalidate(post_key(post_id))  # 커밋 후 캐시된 응답을 무효화함
+        return updated
+    db_post = apply_post_update(db, post_id, post)  # 수정 내용과 파생 데이터 변경분을 세션에 반영함
     db.commit()  # 데이터베이스의 변경 사항을 커밋함
+    response_cache.invalidate(post_key(post_id))  # 커밋 후 캐시된 응답을 무효화함
     db.refresh(db_post)  # 데이터베이스에서 최신 상태로 게시글 정보를 새로고침함
     return db_post  # 수정된 게시글 정보를 반환함
 
@@ -361,7 +1160,9 @@ def delete_post(post_id: int, db: Session = Depends(get_db)):
     if not db_post:
         raise HTTPException(status_code=404, detail="Post not found")  # 게시글이 존재하지 않으면 HTTP 404 예외를 발생시킴
     db.delete(db_post)  # 데이터베이스에서 게시글을 삭제함
+    on_post_deleted(db, db_post)  # 같은 트랜잭션에서 검색 인덱스, 태그, 필터 집계에서도 제거함
     db.commit()  # 데이터베이스의 변경 사항을 커밋함
+    response_cache.invalidate(post_key(post_id))  # 커밋 후 캐시된 응답을 무효화함
     return {"message": "Post deleted successfully"}  # 게시글 삭제 성공 메시지를 반환함
 
 @app.post("/resume")
@@ -370,38 +1171,163 @@ def resume_create():
 
 # main.py (계속)
 
+# 새 이력서를 세션에 추가하는 함수 (커밋은 호출한 쪽에서 함)
+def save_new_resume(db: Session, resume: ResumeCreate) -> Resume:
+    db_resume = Resume(**resume.dict())
+    db.add(db_resume)
+    versions.bump(db, versions.RESUMES)
+    db.flush()
+    return db_resume
+
 # 이력서 작성 엔드포인트
 @app.post("/resumes/", response_model=ResumeResponse)
 def create_resume(resume: ResumeCreate, db: Session = Depends(get_db)):
-    db_resume = Resume(**resume.dict())
-    db.add(db_resume)
+    if writebatch.WRITE_BATCH_ENABLED:
+        return writebatch.writer.run(lambda session: ResumeResponse.model_validate(save_new_resume(session, resume)))
+    db_resume = save_new_resume(db, resume)
     db.commit()
     db.refresh(db_resume)
     return db_resume
 
+# 이력서 대량 등록 엔드포인트
+@app.post("/resumes/bulk", response_model=BulkResponse)
+async def create_resumes_bulk(request: Request, db: Session = Depends(get_db)):
+    items = await read_bulk_items(request)
+    return await run_in_threadpool(bulk_create, db, items, ResumeCreate, Resume, versions.RESUMES)
+
 # 이력서 목록 조회 엔드포인트
 @app.get("/resumes/", response_model=list[ResumeResponse])
-def read_resumes(skip: int = 0, limit: int = 10, db: Session = Depends(get_db)):
-    resumes = db.query(Resume).offset(skip).limit(limit).all()
-    return resumes
+def read_resumes(request: Request, response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1), cursor: str | None = None, fields: str | None = None, db: Session = Depends(get_db)):
+    unchanged = check_list_etag(request, response, db, versions.RESUMES)
+    if unchanged is not None:
+        return unchanged
+    names = select_fields(Resume, fields)
+    if names is None and not FAST_LIST_RESPONSES:
+        return paginate(db.query(Resume), Resume.id, response, skip, limit, cursor)
+    names = names or RESUME_LIST_FIELDS
+    resumes = paginate(projection_query(db, Resume, names), Resume.id, response, skip, limit, cursor)
+    return projected_list_response(names, resumes, response)
+
+# 이력서 전체 내보내기 엔드포인트
+@app.get("/resumes/export")
+def export_resumes(format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    return StreamingResponse(
+        export.stream_table(Resume, format), media_type=export.MEDIA_TYPES[format], headers=export.headers("resumes", format)
+    )
 
 # 개별 이력서 조회 엔드포인트
 @app.get("/resumes/{resume_id}", response_model=ResumeResponse)
-def read_resume(resume_id: int, db: Session = Depends(get_db)):
-    resume = db.query(Resume).filter(Resume.id == resume_id).first()
-    if not resume:
+def read_resume(resume_id: int, request: Request, fields: str | None = None, db: Session = Depends(get_db)):
+    return read_item(request, db, Resume, versions.RESUMES, resume_id, resume_key(resume_id), serialize_resume, fields)
+
+# 매칭 결과 게시글 조회 함수
+def match_results(db: Session, hits: list[tuple[int, float]]) -> list[PostMatch]:
+    """
+    매칭 인덱스가 고른 (게시글 ID, 점수) 목록을 점수 순서 그대로 PostMatch 목록으로 만드는 함수.
+    인덱스에 반영된 뒤 삭제된 게시글은 결과에서 빠짐.
+    """
+    if not hits:
+        return []
+    rows = db.query(Post.id, Post.company_name, Post.title, Post.hashtags, Post.author_id).filter(
+        Post.id.in_([post_id for post_id, _ in hits])
+    )
+    found = {row.id: row for row in rows}
+    return [PostMatch(**found[post_id]._asdict(), score=score) for post_id, score in hits if post_id in found]
+
+# 이력서 매칭 게시글 조회 엔드포인트
+@app.get("/resumes/{resume_id}/matches", response_model=list[PostMatch])
+def match_resume(resume_id: int, k: int = Query(20, ge=1, le=matching.MAX_K), db: Session = Depends(get_db)):
+    """
+    이력서와 잘 맞는 게시글을 매칭 점수 순으로 반환하는 엔드포인트.
+    이력서의 자기소개(introduce)를 게시글 본문/해시태그와, 학력(education)과 지역(location)을 게시글의 Education/joblocation 과 비교함.
+
+    Parameters:
+    - resume_id (int): 이력서 ID
+    - k (int): 반환할 게시글 수 (최대 matching.MAX_K)
+    - db (Session): SQLAlchemy 세션 객체
+
+    Returns:
+    - list[PostMatch]: 매칭 점수가 높은 순서의 게시글 목록 (겹치는 특성이 없는 게시글은 제외됨)
+
+    Raises:
+    - HTTPException: 이력서가 없으면 404, numpy 가 설치되지 않았으면 503 예외를 발생시킴
+    """
+    if not matching.is_available():
+        raise HTTPException(status_code=503, detail="Matching is not available")
+    db_resume = db.get(Resume, resume_id)
+    if not db_resume:
         raise HTTPException(status_code=404, detail="Resume not found")
-    return resume
+    matching.index.load(engine)  # 프로세스에서 처음 호출될 때만 posts 테이블로 인덱스를 만듦
+    query = matching.resume_query(db_resume.introduce, db_resume.education, db_resume.location)
+    return match_results(db, matching.index.top_k(query, k))
 
-# 이력서 수정 엔드포인트
-@app.put("/resumes/{resume_id}", response_model=ResumeResponse)
-def update_resume(resume_id: int, resume: ResumeUpdate, db: Session = Depends(get_db)):
+# 추천 지원자 이력서 조회 함수
+def candidate_results(db: Session, hits: list[tuple[int, float]]) -> list[ResumeCandidate]:
+    """
+    추천 지원자 검색이 고른 (이력서 ID, 점수) 목록을 점수 순서 그대로 ResumeCandidate 목록으로 만드는 함수.
+    스냅숏 이후 다른 워커에서 삭제된 이력서는 여기서 조회되지 않아 결과에서 빠짐.
+    """
+    if not hits:
+        return []
+    found = {resume.id: resume for resume in db.query(Resume).filter(Resume.id.in_([resume_id for resume_id, _ in hits]))}
+    return [
+        ResumeCandidate(**{name: getattr(found[resume_id], name) for name in RESUME_LIST_FIELDS}, score=score)
+        for resume_id, score in hits if resume_id in found
+    ]
+
+# 게시글 추천 지원자 조회 엔드포인트
+@app.get("/posts/{post_id}/candidates", response_model=list[ResumeCandidate])
+def read_post_candidates(post_id: int, k: int = Query(50, ge=1, le=candidates.MAX_K), db: Session = Depends(get_db)):
+    """
+    게시글과 잘 맞는 이력서를 매칭 점수 순으로 반환하는 엔드포인트.
+    게시글 본문/해시태그를 이력서 자기소개(introduce)와, Education/joblocation 을 학력(education)/지역(location)과 비교함.
+
+    Parameters:
+    - post_id (int): 게시글 ID
+    - k (int): 반환할 이력서 수 (최대 candidates.MAX_K)
+    - db (Session): SQLAlchemy 세션 객체
+
+    Returns:
+    - list[ResumeCandidate]: 매칭 점수가 높은 순서의 이력서 목록
+
+    설명:
+    - 게시글 근무지와 같은 지역, 요구 학력 이상의 이력서 구획만 먼저 찾고, k 개가 안 되면 모든 구획으로 넓힘.
+
+    Raises:
+    - HTTPException: 게시글이 없으면 404, numpy 가 설치되지 않았으면 503 예외를 발생시킴
+    """
+    if not matching.is_available():
+        raise HTTPException(status_code=503, detail="Matching is not available")
+    db_post = db.get(Post, post_id)
+    if not db_post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    candidates.index.refresh(engine)  # 새 스냅숏으로 옮기고, 스냅숏 이후 등록된 이력서를 읽음
+    query = candidates.post_query(db_post.content, db_post.hashtags, db_post.Education, db_post.joblocation)
+    return candidate_results(db, candidates.index.top_k(query, db_post.Education, db_post.joblocation, k))
+
+# 이력서 수정 내용을 세션에 반영하는 함수 (커밋은 호출한 쪽에서 함)
+def apply_resume_update(db: Session, resume_id: int, resume: ResumeUpdate) -> Resume:
     db_resume = db.query(Resume).filter(Resume.id == resume_id).first()
     if not db_resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     for key, value in resume.dict().items():
         setattr(db_resume, key, value)
+    versions.bump(db, versions.RESUMES)
+    candidates.track_resume(db, db_resume)  # 커밋 후 추천 지원자 검색에 반영함
+    return db_resume
+
+# 이력서 수정 엔드포인트
+@app.put("/resumes/{resume_id}", response_model=ResumeResponse)
+def update_resume(resume_id: int, resume: ResumeUpdate, db: Session = Depends(get_db)):
+    if writebatch.WRITE_BATCH_ENABLED:
+        updated = writebatch.writer.run(
+            lambda session: ResumeResponse.model_validate(apply_resume_update(session, resume_id, resume))
+        )
+        response_cache.invalidate(resume_key(resume_id))
+        return updated
+    db_resume = apply_resume_update(db, resume_id, resume)
     db.commit()
+    response_cache.invalidate(resume_key(resume_id))
     db.refresh(db_resume)
     return db_resume
 
@@ -412,6 +1338,26 @@ def delete_resume(resume_id: int, db: Session = Depends(get_db)):
     if not db_resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     db.delete(db_resume)
+    versions.bump(db, versions.RESUMES)
+    candidates.untrack_resume(db, resume_id)  # 커밋 후 추천 지원자 검색에서 제외함
     db.commit()
+    response_cache.invalidate(resume_key(resume_id))
     return {"message": "Resume deleted successfully"}
 
+
+# 계측 지표 조회 엔드포인트 (Prometheus 수집용)
+@app.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """
+    라우트별 응답 시간 히스토그램, 요청별 SQL 수/DB 시간, bcrypt/JWT 처리 시간을 Prometheus 텍스트 형식으로 반환하는 엔드포인트.
+    """
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4")
+
+# 상태 확인 엔드포인트 (로드 밸런서/부하 테스트 기준 요청용)
+@app.get("/health", include_in_schema=False)
+def health():
+    """
+    데이터베이스를 사용하지 않고 바로 응답하는 엔드포인트.
+    부하 테스트에서는 이 요청의 지연 시간을 기준으로 다른 엔드포인트의 지연 시간을 비교함.
+    """
+    return {"status": "ok"}
@@ -0,0 +1,379 @@
+# 비동기 모드 애플리케이션
+# 실행: uvicorn main_async:app
+# 동기 모드(main.py)와 같은 API를 async def 엔드포인트와 AsyncSession 으로 제공함.
+# 요청이 DB 응답을 기다리는 동안 스레드풀 슬롯을 점유하지 않으므로, 동시 접속이 많을 때 처리량이 높음.
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response, status
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+import main  # 동기 모드의 Pydantic 모델과 공용 함수를 재사용함
+from main import (
+    ACCESS_TOKEN_EXPIRE_MINUTES,
+    BulkResponse,
+    FacetValue,
+    PostCreate,
+    PostResponse,
+    PostResponse2,
+    PostMatch,
+    PostSearchResult,
+    ResumeCandidate,
+    ResumeCreate,
+    ResumeResponse,
+    ResumeUpdate,
+    TagFrequency,
+    Token,
+    UserCreate,
+    UserLogin,
+    UserResponse,
+    bulk_create,
+    create_access_token,
+    credentials_exception,
+    decode_access_token,
+    hash_pool_saturated_handler,
+    on_post_deleted,
+    on_posts_created,
+    rate_limited_handler,
+    read_bulk_items,
+)
+import candidates
+import export
+import hashing
+import matching
+import metrics
+import migrations
+import postfields
+import ratelimit
+from auth import principal_cache
+from cache import response_cache, post_key, resume_key
+import versions
+import serving
+import writebatch
+from models import AsyncSessionLocal, Post, Resume, User, engine, get_async_engine, warm_up_async_pool
+
+# 앱 시작/종료 처리
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    앱 시작 시 데이터베이스를 초기화하고 비동기 연결 풀을 미리 채우는 함수 (동기 모드와 같은 DB_INIT_ON_STARTUP 설정을 따름).
+    """
+    if main.DB_INIT_ON_STARTUP and not serving.preloaded:
+        await run_in_threadpool(migrations.init_db, engine)
+    await warm_up_async_pool()
+    if serving.WORKER_SYNC_ENABLED:
+        await run_in_threadpool(serving.listener.start, engine)
+    if matching.MATCHING_PRELOAD and matching.is_available():
+        await run_in_threadpool(matching.index.load, engine)
+    yield
+    await run_in_threadpool(serving.listener.stop)
+    await run_in_threadpool(writebatch.writer.stop)
+    hashing.pool.shutdown()
+    await get_async_engine().dispose()
+
+app = FastAPI(lifespan=lifespan)  # 비동기 모드 FastAPI 애플리케이션 객체 생성
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Server-Timing"],
+)
+app.add_middleware(metrics.MetricsMiddleware)
+
+app.add_exception_handler(hashing.HashPoolSaturated, hash_pool_saturated_handler)
+app.add_exception_handler(ratelimit.RateLimited, rate_limited_handler)
+
+# 비동기 데이터베이스 세션을 가져오는 의존성 함수
+async def get_db():
+    """
+    비동기 데이터베이스 세션(AsyncSession)을 가져오는 의존성 함수.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 현재 로그인한 사용자를 가져오는 의존성 함수
+async def get_current_user(token: str = Depends(main.oauth2_scheme)) -> User:
+    """
+    Authorization 헤더의 액세스 토큰으로 현재 사용자를 조회하는 의존성 함수 (비동기 버전).
+    동기 모드와 같은 인증 사용자 캐시를 사용하므로, 캐시에 있는 토큰은 DB 조회 없이 처리됨.
+    """
+    user = principal_cache.get(token)
+    if user is not None:
+        return user
+    token_data, expires_at = decode_access_token(token)
+    async with AsyncSessionLocal() as db:
+        user = await db.scalar(select(User).where(User.email == token_data.email))
+        if user is None:
+            raise credentials_exception()
+        principal_cache.put(token, user, expires_at)
+        db.expunge(user)
+    return user
+
+# 회원가입 엔드포인트
+@app.post("/register", response_model=dict)
+async def register(user: UserCreate, request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    사용자 회원가입을 처리하는 엔드포인트 (비동기 버전).
+    bcrypt 해시 계산은 CPU 작업이므로 이벤트 루프를 막지 않도록 해시 전용 프로세스 풀에서 실행함.
+    """
+    ratelimit.check_auth(request, user.email)
+    db_user = await db.scalar(select(User).where(User.email == user.email))
+    if db_user:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Email already registered"
+        )
+    hashed_password = await hashing.hash_password_async(user.password)
+    new_user = User(
+        email=user.email,
+        hashed_password=hashed_password,
+        name=user.name,
+        gender=user.gender,
+        country=user.country,
+        birthdate=user.birthdate
+    )
+    db.add(new_user)
+    await db.run_sync(lambda session: versions.bump(session, versions.USERS))
+    await db.commit()
+    return {"message": "User registered successfully"}
+
+# 로그인 엔드포인트
+@app.post("/login", response_model=Token)
+async def login(user: UserLogin, request: Request, db: AsyncSession = Depends(get_db)):
+    """
+    사용자 로그인을 처리하는 엔드포인트 (비동기 버전).
+    """
+    ratelimit.check_auth(request, user.email)
+    db_user = await db.scalar(select(User).where(User.email == user.email))
+    if not db_user or not await hashing.check_password_async(user.password, db_user.hashed_password):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+    access_token = create_access_token(
+        data={"sub": db_user.email},
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    )
+    return {"access_token": access_token, "token_type": "bearer"}
+
+# 현재 사용자 조회 엔드포인트
+@app.get("/users/me", response_model=UserResponse)
+async def read_current_user(current_user: User = Depends(get_current_user)):
+    return current_user
+
+# 게시글 작성 엔드포인트
+@app.post("/posts/", response_model=PostResponse)
+async def create_post(post: PostCreate, db: AsyncSession = Depends(get_db)):
+    if writebatch.WRITE_BATCH_ENABLED:
+        # 묶음 커밋 모드에서는 동기 엔진의 쓰기 스레드가 다른 작성/수정 요청과 함께 커밋함
+        return await writebatch.writer.run_async(lambda session: PostResponse.model_validate(main.save_new_post(session, post)))
+    db_post = await db.run_sync(lambda session: main.save_new_post(session, post))  # 동기 앱과 같은 저장 경로를 사용함
+    await db.commit()
+    return db_post
+
+# 게시글 대량 등록 엔드포인트
+@app.post("/posts/bulk", response_model=BulkResponse)
+async def create_posts_bulk(request: Request, db: AsyncSession = Depends(get_db)):
+    items = await read_bulk_items(request)
+    return await db.run_sync(
+        lambda session: bulk_create(
+            session, items, PostCreate, Post, versions.POSTS, {"author_id": 1}, on_posts_created, postfields.apply
+        )
+    )
+
+# 게시글 목록 조회 엔드포인트
+@app.get("/posts/", response_model=list[PostResponse2])
+async def read_posts(
+    request: Request,
+    response: Response,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(10, ge=1),
+    cursor: str | None = None,
+    fields: str | None = None,
+    salary_min: int | None = None,
+    salary_max: int | None = None,
+    deadline_from: date | None = None,
+    deadline_to: date | None = None,
+    include: str | None = None,
+    db: AsyncSession = Depends(get_db),
+):
+    return await db.run_sync(lambda session: main.read_posts(
+        request, response, skip, limit, cursor, fields, salary_min, salary_max, deadline_from, deadline_to, include, session
+    ))
+
+# 게시글 검색 엔드포인트
+@app.get("/posts/search", response_model=list[PostSearchResult])
+async def search_posts(
+    q: str,
+    job_type: str | None = None,
+    career: str | None = None,
+    joblocation: str | None = None,
+    Education: str | None = None,
+    limit: int = Query(10, ge=1, le=main.MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+):
+    return await db.run_sync(
+        lambda session: main.search_posts(q, job_type, career, joblocation, Education, limit, session)
+    )
+
+# 태그 조합 게시글 조회 엔드포인트
+@app.get("/posts/by-tags", response_model=list[PostResponse2])
+async def read_posts_by_tags(
+    all_tags: str | None = Query(None, alias="all"),
+    any_tags: str | None = Query(None, alias="any"),
+    limit: int = Query(10, ge=1, le=main.MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db),
+):
+    return await db.run_sync(lambda session: main.read_posts_by_tags(all_tags, any_tags, limit, session))
+
+# 게시글 필터 집계 조회 엔드포인트
+@app.get("/posts/facets", response_model=dict[str, list[FacetValue]])
+async def read_post_facets(db: AsyncSession = Depends(get_db)):
+    return await db.run_sync(main.read_post_facets)
+
+# 태그 빈도 조회 엔드포인트
+@app.get("/tags/", response_model=list[TagFrequency])
+async def read_tag_frequencies(limit: int = Query(50, ge=1, le=main.MAX_PAGE_SIZE), db: AsyncSession = Depends(get_db)):
+    return await db.run_sync(lambda session: main.read_tag_frequencies(limit, session))
+
+# 게시글 전체 내보내기 엔드포인트
+@app.get("/posts/export")
+async def export_posts(format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    return StreamingResponse(
+        export.stream_table_async(Post, format), media_type=export.MEDIA_TYPES[format], headers=export.headers("posts", format)
+    )
+
+# 개별 게시글 조회 엔드포인트
+@app.get("/posts/{post_id}", response_model=PostResponse)
+async def read_post(post_id: int, request: Request, fields: str | None = None, include: str | None = None, db: AsyncSession = Depends(get_db)):
+    return await db.run_sync(lambda session: main.read_post(post_id, request, fields, include, session))
+
+# 게시글 수정 엔드포인트
+@app.put("/posts/{post_id}", response_model=PostResponse)
+async def update_post(post_id: int, post: PostCreate, db: AsyncSession = Depends(get_db)):
+    if writebatch.WRITE_BATCH_ENABLED:
+        updated = await writebatch.writer.run_async(
+            lambda session: PostResponse.model_validate(main.apply_post_update(session, post_id, post))
+        )
+        response_cache.invalidate(post_key(post_id))
+        return updated
+    db_post = await db.run_sync(lambda session: main.apply_post_update(session, post_id, post))
+    await db.commit()
+    response_cache.invalidate(post_key(post_id))
+    return db_post
+
+# 게시글 삭제 엔드포인트
+@app.delete("/posts/{post_id}", response_model=dict)
+async def delete_post(post_id: int, db: AsyncSession = Depends(get_db)):
+    db_post = await db.get(Post, post_id)
+    if not db_post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    await db.delete(db_post)
+    await db.run_sync(lambda session: on_post_deleted(session, db_post))
+    await db.commit()
+    response_cache.invalidate(post_key(post_id))
+    return {"message": "Post deleted successfully"}
+
+# 이력서 작성 엔드포인트
+@app.post("/resumes/", response_model=ResumeResponse)
+async def create_resume(resume: ResumeCreate, db: AsyncSession = Depends(get_db)):
+    if writebatch.WRITE_BATCH_ENABLED:
+        return await writebatch.writer.run_async(lambda session: ResumeResponse.model_validate(main.save_new_resume(session, resume)))
+    db_resume = await db.run_sync(lambda session: main.save_new_resume(session, resume))
+    await db.commit()
+    return db_resume
+
+# 이력서 대량 등록 엔드포인트
+@app.post("/resumes/bulk", response_model=BulkResponse)
+async def create_resumes_bulk(request: Request, db: AsyncSession = Depends(get_db)):
+    items = await read_bulk_items(request)
+    return await db.run_sync(lambda session: bulk_create(session, items, ResumeCreate, Resume, versions.RESUMES))
+
+# 이력서 목록 조회 엔드포인트
+@app.get("/resumes/", response_model=list[ResumeResponse])
+async def read_resumes(request: Request, response: Response, skip: int = Query(0, ge=0), limit: int = Query(10, ge=1), cursor: str | None = None, fields: str | None = None, db: AsyncSession = Depends(get_db)):
+    return await db.run_sync(lambda session: main.read_resumes(request, response, skip, limit, cursor, fields, session))
+
+# 이력서 전체 내보내기 엔드포인트
+@app.get("/resumes/export")
+async def export_resumes(format: str = Query("ndjson", pattern="^(ndjson|csv)$")):
+    return StreamingResponse(
+        export.stream_table_async(Resume, format), media_type=export.MEDIA_TYPES[format], headers=export.headers("resumes", format)
+    )
+
+# 개별 이력서 조회 엔드포인트
+@app.get("/resumes/{resume_id}", response_model=ResumeResponse)
+async def read_resume(resume_id: int, request: Request, fields: str | None = None, db: AsyncSession = Depends(get_db)):
+    return await db.run_sync(lambda session: main.read_resume(resume_id, request, fields, session))
+
+# 이력서 매칭 게시글 조회 엔드포인트
+@app.get("/resumes/{resume_id}/matches", response_model=list[PostMatch])
+async def match_resume(resume_id: int, k: int = Query(20, ge=1, le=matching.MAX_K), db: AsyncSession = Depends(get_db)):
+    # 인덱스 만들기와 점수 계산은 CPU 작업이므로 이벤트 루프를 막지 않도록 스레드에서 실행함
+    if not matching.is_available():
+        raise HTTPException(status_code=503, detail="Matching is not available")
+    db_resume = await db.get(Resume, resume_id)
+    if not db_resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    await run_in_threadpool(matching.index.load, engine)
+    query = matching.resume_query(db_resume.introduce, db_resume.education, db_resume.location)
+    hits = await run_in_threadpool(matching.index.top_k, query, k)
+    return await db.run_sync(lambda session: main.match_results(session, hits))
+
+# 게시글 추천 지원자 조회 엔드포인트
+@app.get("/posts/{post_id}/candidates", response_model=list[ResumeCandidate])
+async def read_post_candidates(post_id: int, k: int = Query(50, ge=1, le=candidates.MAX_K), db: AsyncSession = Depends(get_db)):
+    if not matching.is_available():
+        raise HTTPException(status_code=503, detail="Matching is not available")
+    db_post = await db.get(Post, post_id)
+    if not db_post:
+        raise HTTPException(status_code=404, detail="Post not found")
+    await run_in_threadpool(candidates.index.refresh, engine)
+    query = candidates.post_query(db_post.content, db_post.hashtags, db_post.Education, db_post.joblocation)
+    hits = await run_in_threadpool(candidates.index.top_k, query, db_post.Education, db_post.joblocation, k)
+    return await db.run_sync(lambda session: main.candidate_results(session, hits))
+
+# 이력서 수정 엔드포인트
+@app.put("/resumes/{resume_id}", response_model=ResumeResponse)
+async def update_resume(resume_id: int, resume: ResumeUpdate, db: AsyncSession = Depends(get_db)):
+    if writebatch.WRITE_BATCH_ENABLED:
+        updated = await writebatch.writer.run_async(
+            lambda session: ResumeResponse.model_validate(main.apply_resume_update(session, resume_id, resume))
+        )
+        response_cache.invalidate(resume_key(resume_id))
+        return updated
+    db_resume = await db.run_sync(lambda session: main.apply_resume_update(session, resume_id, resume))
+    await db.commit()
+    response_cache.invalidate(resume_key(resume_id))
+    return db_resume
+
+# 이력서 삭제 엔드포인트
+@app.delete("/resumes/{resume_id}", response_model=dict)
+async def delete_resume(resume_id: int, db: AsyncSession = Depends(get_db)):
+    db_resume = await db.get(Resume, resume_id)
+    if not db_resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    await db.delete(db_resume)
+    await db.run_sync(lambda session: versions.bump(session, versions.RESUMES))
+    await db.run_sync(lambda session: candidates.untrack_resume(session, resume_id))
+    await db.commit()
+    response_cache.invalidate(resume_key(resume_id))
+    return {"message": "Resume deleted successfully"}
+
+# 계측 지표 조회 엔드포인트 (Prometheus 수집용)
+@app.get("/metrics", include_in_schema=False)
+async def read_metrics():
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4")
+
+# 상태 확인 엔드포인트
+@app.get("/health", include_in_schema=False)
+async def health():
+    return {"status": "ok"}
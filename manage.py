@@ -0,0 +1,54 @@
+# 운영용 관리 명령 모듈
+# 사용 예: python manage.py rebuild-facets
+import argparse
+
+import candidates
+import facets
+import migrations
+import search
+import serving
+import tags
+from models import SessionLocal, engine
+
+
+def rebuild(rebuild_fn):
+    """
+    관리 명령 하나를 새 세션에서 실행하고 커밋하는 함수.
+    """
+    db = SessionLocal()
+    try:
+        rebuild_fn(db)
+        db.commit()
+    finally:
+        db.close()
+
+
+# 명령 이름 → (설명, 실행 함수)
+COMMANDS = {
+    "rebuild-candidates": ("추천 지원자 검색 스냅숏(CANDIDATES_INDEX_DIR)을 resumes 테이블로부터 새로 만듦", candidates.rebuild_candidates),
+    "rebuild-facets": ("필터별 게시글 수 집계(facet_counts)를 posts 테이블로부터 다시 만듦", facets.rebuild_facets),
+    "rebuild-search": ("게시글 전문 검색 인덱스(posts_fts)를 다시 만듦", search.rebuild_search_index),
+    "rebuild-tags": ("게시글 태그 연결(post_tags)과 태그별 게시글 수를 다시 만듦", tags.rebuild_tags),
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="RefuJobs 서버 관리 명령")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("init-db", help="테이블 생성, 마이그레이션, 파생 데이터 초기화 (DB_INIT_ON_STARTUP=0 인 배포에서 사용)")
+    subparsers.add_parser("prepare", help="init-db 와 추천 지원자 스냅숏 만들기 (uvicorn --workers 로 워커를 여러 개 띄우기 전에 실행)")
+    for name, (help_text, _) in COMMANDS.items():
+        subparsers.add_parser(name, help=help_text)
+    args = parser.parse_args(argv)
+
+    if args.command == "init-db":
+        migrations.init_db(engine)
+    elif args.command == "prepare":
+        serving.prepare(engine)
+    else:
+        rebuild(COMMANDS[args.command][1])
+    print(f"{args.command}: done")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,404 @@
+# 이력서-채용 공고 매칭 모듈
+# 게시글마다 본문/해시태그/학력/근무지를 해시 특성(hashed feature) 벡터로 만들어 메모리 안의 NumPy 배열에 보관하고,
+# 이력서 하나에 대한 모든 게시글의 점수를 배열 연산 한 번으로 계산한 뒤 argpartition 으로 상위 k 개만 골라냄.
+#
+# 행렬 형식:
+#   scipy 없이 NumPy 만으로 희소 행렬-벡터 곱을 하기 위해 ELLPACK 형식을 사용함.
+#   게시글(행)마다 최대 ROW_WIDTH 개의 (특성 번호, 값) 쌍을 cols/vals 배열에 고정 폭으로 저장하고 (빈 칸은 값 0),
+#   점수는 sum(vals * query[cols], axis=1) 한 번으로 계산됨 (query 는 특성 차원 크기의 밀집 벡터).
+#
+# 점수 구성:
+#   본문/해시태그 단어: 게시글 쪽은 로그 TF 를 단위 길이로 정규화하고, IDF 는 질의(이력서) 쪽에만 곱함.
+#                       문서 빈도(df)가 바뀌어도 저장된 행을 다시 계산할 필요가 없으므로 증분 갱신이 가능함.
+#   학력/근무지: 이력서의 education/location 단어가 게시글의 Education/joblocation 단어와 같으면 가중치만큼 더함.
+#
+# 인덱스는 프로세스마다 따로 있으며, 첫 매칭 요청 때(또는 MATCHING_PRELOAD=1 이면 앱 시작 시) posts 테이블로부터 만들어짐.
+# 이후 게시글 작성/수정/삭제는 트랜잭션이 커밋된 뒤에 반영되므로, 롤백된 변경은 인덱스에 들어가지 않음.
+import importlib.util
+import math
+import os
+import re
+import threading
+import zlib
+from collections import Counter
+
+from sqlalchemy import event, select
+from sqlalchemy.orm import Session
+
+from models import Post
+
+# 앱 시작 시 매칭 인덱스를 미리 만들지 여부 (0이면 첫 매칭 요청 때 만듦)
+MATCHING_PRELOAD = os.environ.get("MATCHING_PRELOAD", "0") == "1"
+
+# 해시 특성 차원 수 (2의 거듭제곱, 클수록 서로 다른 단어가 같은 특성으로 겹칠 확률이 낮음)
+FEATURE_DIM = 1 << 18
+
+# 게시글 하나에서 저장하는 본문/해시태그 특성 수 상한 (TF 가 높은 순서로 남김)
+MAX_TEXT_FEATURES = 32
+
+# 학력, 근무지 각각에서 저장하는 특성 수 상한
+MAX_FIELD_FEATURES = 4
+
+# 게시글 행의 고정 폭 (본문/해시태그 + 학력 + 근무지)
+ROW_WIDTH = MAX_TEXT_FEATURES + 2 * MAX_FIELD_FEATURES
+
+# 해시태그 단어를 본문 단어보다 몇 번 더 센 것으로 볼지
+HASHTAG_BOOST = 2
+
+# 점수 가중치 (본문 유사도는 0~1, 학력/근무지는 모두 일치하면 각 가중치만큼 더해짐)
+TEXT_WEIGHT = 1.0
+EDUCATION_WEIGHT = 0.3
+LOCATION_WEIGHT = 0.3
+
+# 한 번에 요청할 수 있는 매칭 결과 수 상한
+MAX_K = 100
+
+# 인덱스를 만들 때 posts 테이블에서 한 번에 읽는 행 수
+LOAD_BATCH_SIZE = 2000
+
+# 단어 추출 정규식 (search.py 와 같음)
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# 세션에서 커밋을 기다리는 인덱스 변경분을 보관하는 session.info 키
+PENDING_KEY = "matching_pending"
+
+# numpy 설치 여부 (is_available() 을 처음 호출할 때 확인함)
+_numpy_available = None
+
+
+def is_available() -> bool:
+    """
+    매칭에 필요한 numpy 가 설치되어 있는지 확인하는 함수.
+    numpy 는 선택 의존성이며 임포트 비용이 크므로 여기서는 임포트하지 않고, 배열을 다루는 함수에서 처음 사용할 때 임포트함.
+    (없으면 매칭/추천 지원자 엔드포인트가 503 을 반환함)
+    """
+    global _numpy_available
+    if _numpy_available is None:
+        _numpy_available = importlib.util.find_spec("numpy") is not None
+    return _numpy_available
+
+
+def _hash(feature: str) -> int:
+    # 프로세스가 달라도 같은 값이 나오도록 내장 hash() 대신 crc32 를 사용함
+    return zlib.crc32(feature.encode()) & (FEATURE_DIM - 1)
+
+
+def text_tokens(text: str | None) -> list[str]:
+    """
+    문자열을 매칭용 단어 목록으로 변환하는 함수.
+
+    설명:
+    - 단어는 소문자로 변환함.
+    - 세 글자 이상인 한글 단어는 조사가 붙어도 겹치도록 두 글자씩 자른 조각(바이그램)도 함께 추가함
+      ("개발자로" → "개발자로", "~개발", "~발자", "~자로").
+    """
+    if not text:
+        return []
+    tokens = []
+    for word in TOKEN_RE.findall(text.casefold()):
+        tokens.append(word)
+        if len(word) > 2 and "가" <= word[0] <= "힣":
+            tokens.extend(["~" + word[i:i + 2] for i in range(len(word) - 1)])
+    return tokens
+
+
+def _text_counts(*weighted_texts: tuple[str | None, int]) -> Counter:
+    # (문자열, 반복 횟수) 목록을 특성 번호별 등장 횟수로 변환함 (같은 단어는 한 번만 해시함)
+    tokens = Counter()
+    for text, repeat in weighted_texts:
+        if repeat == 1:
+            tokens.update(text_tokens(text))
+        else:
+            for token in text_tokens(text):
+                tokens[token] += repeat
+    counts = Counter()
+    for token, count in tokens.items():
+        counts[_hash(token)] += count
+    return counts
+
+
+def _field_features(prefix: str, value: str | None, weight: float) -> list[tuple[int, float]]:
+    # 학력/근무지 값의 단어마다 (특성 번호, weight / 단어 수) 를 만듦 (단어가 모두 일치하면 합이 weight 가 됨)
+    words = list(dict.fromkeys(TOKEN_RE.findall(value.casefold())))[:MAX_FIELD_FEATURES] if value else []
+    return [(_hash(f"{prefix}:{word}"), weight / len(words)) for word in words]
+
+
+def document_row(texts: list[tuple[str | None, int]], fields: list[tuple[str, str | None]]) -> tuple:
+    """
+    문서(인덱스에 저장되는 쪽)의 문자열 값을 인덱스 행(특성 번호 목록, 값 목록, 본문 특성 수)으로 변환하는 함수.
+
+    Parameters:
+    - texts (list): (문자열, 반복 횟수) 목록 (본문/해시태그 등 단어 단위로 비교하는 값)
+    - fields (list): (접두어, 값) 목록 (학력/근무지 등 같은 접두어끼리만 비교하는 값)
+
+    설명:
+    - 본문 특성은 1 + log(TF) 중 큰 순서로 MAX_TEXT_FEATURES 개를 남기고 단위 길이로 정규화함.
+    - 본문 특성이 앞쪽, 필드 특성이 뒤쪽에 오며, 문서 빈도(df)는 앞쪽 본문 특성에 대해서만 셈.
+    """
+    counts = _text_counts(*texts)
+    text = [(col, 1.0 + math.log(count)) for col, count in counts.most_common(MAX_TEXT_FEATURES)]
+    norm = math.sqrt(sum(value * value for _, value in text)) or 1.0
+    field_values = [feature for prefix, value in fields for feature in _field_features(prefix, value, 1.0)]
+    cols = [col for col, _ in text] + [col for col, _ in field_values]
+    vals = [value / norm for _, value in text] + [value for _, value in field_values]
+    return cols, vals, len(text)
+
+
+def query_row(texts: list[tuple[str | None, int]], fields: list[tuple[str, str | None, float]]) -> tuple:
+    """
+    질의 쪽 문자열 값을 (특성 번호 목록, 값 목록, 본문 특성 수)로 변환하는 함수.
+    본문 특성 값은 1 + log(TF) 이며, IDF 곱셈과 정규화는 query_weights 에서 문서 빈도를 보고 함.
+    필드는 (접두어, 값, 가중치) 목록이며, 값의 단어가 모두 일치하면 가중치만큼 점수에 더해짐.
+    """
+    counts = _text_counts(*texts)
+    field_values = [feature for prefix, value, weight in fields for feature in _field_features(prefix, value, weight)]
+    cols = list(counts) + [col for col, _ in field_values]
+    vals = [1.0 + math.log(count) for count in counts.values()] + [value for _, value in field_values]
+    return cols, vals, len(counts)
+
+
+def post_features(content: str | None, hashtags: str | None, education: str | None, joblocation: str | None) -> tuple:
+    """
+    게시글 컬럼 값을 매칭 인덱스 행으로 변환하는 함수.
+    """
+    return document_row([(content, 1), (hashtags, HASHTAG_BOOST)], [("edu", education), ("loc", joblocation)])
+
+
+def resume_query(introduce: str | None, education: str | None, location: str | None) -> tuple:
+    """
+    이력서 컬럼 값을 게시글 매칭 질의로 변환하는 함수.
+    """
+    return query_row([(introduce, 1)], [("edu", education, EDUCATION_WEIGHT), ("loc", location, LOCATION_WEIGHT)])
+
+
+def query_weights(query: tuple, df, documents: int):
+    """
+    질의를 특성 차원 크기의 밀집 가중치 벡터로 만드는 함수.
+
+    설명:
+    - 본문 특성에는 IDF(log((N + 1) / (df + 1)) + 1)를 곱한 뒤 단위 길이로 정규화하여 TEXT_WEIGHT 를 곱함.
+    - 같은 특성 번호가 여러 번 나오면 값을 더함 (해시 충돌).
+    """
+    import numpy as np
+    cols, vals, text_len = query
+    cols = np.asarray(cols, dtype=np.int64)
+    vals = np.asarray(vals, dtype=np.float32)
+    text = vals[:text_len] * (np.log((documents + 1) / (df[cols[:text_len]] + 1)) + 1)
+    norm = np.linalg.norm(text)
+    if norm:
+        vals[:text_len] = text * (TEXT_WEIGHT / norm)
+    weights = np.zeros(FEATURE_DIM, dtype=np.float32)
+    np.add.at(weights, cols, vals)
+    return weights
+
+
+def score_rows(weights, cols, vals):
+    """
+    ELLPACK 행(cols, vals)마다 가중치 벡터와의 내적을 계산하는 함수 (sum(vals * weights[cols], axis=1)).
+    """
+    import numpy as np
+    scores = np.take(weights, cols)
+    scores *= vals
+    return scores.sum(axis=1)
+
+
+def top_indices(scores, k: int):
+    """
+    점수 배열에서 점수가 0 보다 큰 상위 k 개의 위치를 점수가 높은 순서로 반환하는 함수.
+    전체 정렬 대신 argpartition 으로 상위 k 개를 고른 뒤 그 k 개만 정렬함.
+    """
+    import numpy as np
+    count = len(scores)
+    if k < count:
+        top = np.argpartition(scores, count - k)[count - k:]
+    else:
+        top = np.arange(count)
+    top = top[np.argsort(-scores[top], kind="stable")]
+    return top[scores[top] > 0]
+
+
+class MatchIndex:
+    """
+    게시글 특성 행렬(ELLPACK 형식)과 문서 빈도를 메모리에 보관하는 매칭 인덱스 클래스.
+
+    Attributes:
+        loaded (bool): posts 테이블로부터 인덱스를 만들었는지 여부 (만들기 전의 변경분은 무시됨)
+        cols (ndarray): 행별 특성 번호 (capacity x ROW_WIDTH, int32)
+        vals (ndarray): 행별 특성 값 (capacity x ROW_WIDTH, float32, 빈 칸은 0)
+        ids (ndarray): 행별 게시글 ID (빈 행은 -1)
+        df (ndarray): 특성별 본문 문서 빈도 (FEATURE_DIM, int32)
+
+    설명:
+    - 삭제된 행은 비워 두고 다음 추가 때 다시 사용하며, 행이 부족하면 배열 크기를 두 배로 늘림.
+    - 모든 변경과 점수 계산은 하나의 잠금 안에서 실행됨 (점수 계산은 NumPy 가 GIL 을 놓은 상태로 실행함).
+    """
+
+    def __init__(self, capacity: int = 1024):
+        self._lock = threading.RLock()
+        self.loaded = False
+        self._capacity = capacity
+        self.cols = self.vals = self.ids = self.text_len = self.df = None  # 배열은 인덱스를 만들 때 할당함
+        self.rows: dict[int, int] = {}
+        self.free: list[int] = []
+        self.size = 0
+
+    def _reset(self):
+        import numpy as np
+        self.cols = np.zeros((self._capacity, ROW_WIDTH), dtype=np.int32)
+        self.vals = np.zeros((self._capacity, ROW_WIDTH), dtype=np.float32)
+        self.ids = np.full(self._capacity, -1, dtype=np.int64)
+        self.text_len = np.zeros(self._capacity, dtype=np.int16)
+        self.df = np.zeros(FEATURE_DIM, dtype=np.int32)
+        self.rows: dict[int, int] = {}  # 게시글 ID → 행 번호
+        self.free: list[int] = []  # 삭제로 비워진 행 번호
+        self.size = 0  # 한 번이라도 사용된 행 수 (점수는 앞쪽 size 개 행에 대해서만 계산함)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def _grow(self):
+        import numpy as np
+        capacity = len(self.ids) * 2
+        for name, fill in (("cols", 0), ("vals", 0), ("ids", -1), ("text_len", 0)):
+            old = getattr(self, name)
+            new = np.full((capacity, *old.shape[1:]), fill, dtype=old.dtype)
+            new[:len(old)] = old
+            setattr(self, name, new)
+
+    def _clear_row(self, row: int):
+        self.df[self.cols[row, :self.text_len[row]]] -= 1
+        self.cols[row] = 0
+        self.vals[row] = 0
+        self.text_len[row] = 0
+
+    def _put(self, post_id: int, features: tuple):
+        cols, vals, text_len = features
+        row = self.rows.get(post_id)
+        if row is not None:
+            self._clear_row(row)
+        else:
+            if self.free:
+                row = self.free.pop()
+            else:
+                if self.size == len(self.ids):
+                    self._grow()
+                row = self.size
+                self.size += 1
+            self.rows[post_id] = row
+            self.ids[row] = post_id
+        self.cols[row, :len(cols)] = cols
+        self.vals[row, :len(vals)] = vals
+        self.text_len[row] = text_len
+        self.df[cols[:text_len]] += 1  # 본문 특성 번호는 행 안에서 중복되지 않음 (Counter 로 모았음)
+
+    def _drop(self, post_id: int):
+        row = self.rows.pop(post_id, None)
+        if row is None:
+            return
+        self._clear_row(row)
+        self.ids[row] = -1
+        self.free.append(row)
+
+    def build(self, posts):
+        """
+        (id, content, hashtags, Education, joblocation) 행 목록으로 인덱스 전체를 새로 만드는 함수.
+        """
+        with self._lock:
+            self._reset()
+            for post_id, *values in posts:
+                self._put(post_id, post_features(*values))
+            self.loaded = True
+
+    def load(self, bind):
+        """
+        posts 테이블 전체를 읽어 인덱스를 만드는 함수 (이미 만들어져 있으면 아무 작업도 하지 않음).
+
+        Parameters:
+        - bind: SQLAlchemy 엔진 (비동기 모드에서도 이벤트 루프를 막지 않도록 동기 엔진을 스레드에서 사용함)
+
+        설명:
+        - 만드는 동안 잠금을 잡고 있으므로, 그 사이에 커밋된 변경분은 인덱스가 완성된 뒤에 반영됨.
+        """
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded:
+                return
+            statement = select(Post.id, Post.content, Post.hashtags, Post.Education, Post.joblocation)
+            with bind.connect() as conn:
+                result = conn.execution_options(yield_per=LOAD_BATCH_SIZE).execute(statement)
+                self.build(result)
+
+    def apply(self, changes: dict):
+        """
+        커밋된 게시글 변경분({게시글 ID: (content, hashtags, Education, joblocation) 또는 삭제 시 None})을 반영하는 함수.
+        인덱스를 아직 만들지 않았으면 무시함 (나중에 만들 때 posts 테이블에서 읽음).
+        """
+        with self._lock:  # 인덱스를 만드는 중이면 끝날 때까지 기다림
+            if not self.loaded:
+                return
+        features = {post_id: post_features(*values) for post_id, values in changes.items() if values is not None}
+        with self._lock:
+            for post_id, values in changes.items():
+                if values is None:
+                    self._drop(post_id)
+                else:
+                    self._put(post_id, features[post_id])
+
+    def top_k(self, query: tuple, k: int) -> list[tuple[int, float]]:
+        """
+        질의와 모든 게시글의 점수를 계산하여 점수가 높은 순서로 최대 k 개의 (게시글 ID, 점수)를 반환하는 함수.
+        점수가 0 인 게시글(겹치는 특성이 없음)은 결과에서 제외함.
+        """
+        with self._lock:
+            count = self.size
+            if not self.rows or k <= 0:
+                return []
+            weights = query_weights(query, self.df, len(self.rows))
+            scores = score_rows(weights, self.cols[:count], self.vals[:count])
+            ids = self.ids[:count].copy()
+        top = top_indices(scores, k)
+        return list(zip(ids[top].tolist(), scores[top].tolist()))
+
+
+# 프로세스 공용 매칭 인덱스
+index = MatchIndex()
+
+
+def track_post(db: Session, post: Post):
+    """
+    작성/수정된 게시글을 커밋 후 매칭 인덱스에 반영하도록 세션에 기록하는 함수.
+    """
+    db.info.setdefault(PENDING_KEY, {})[post.id] = (post.content, post.hashtags, post.Education, post.joblocation)
+
+
+def track_new_posts(db: Session, rows: list[dict]):
+    """
+    대량 등록된 게시글(id 가 채워진 컬럼 값 목록)을 커밋 후 매칭 인덱스에 반영하도록 세션에 기록하는 함수.
+    """
+    pending = db.info.setdefault(PENDING_KEY, {})
+    for row in rows:
+        pending[row["id"]] = (row.get("content"), row.get("hashtags"), row.get("Education"), row.get("joblocation"))
+
+
+def untrack_post(db: Session, post_id: int):
+    """
+    삭제된 게시글을 커밋 후 매칭 인덱스에서 제거하도록 세션에 기록하는 함수.
+    """
+    db.info.setdefault(PENDING_KEY, {})[post_id] = None
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending(session):
+    if session.in_nested_transaction():
+        return  # SAVEPOINT 해제는 커밋이 아니므로 바깥 트랜잭션이 커밋될 때 반영함
+    pending = session.info.pop(PENDING_KEY, None)
+    if pending:
+        index.apply(pending)  # 인덱스를 만들지 않았으면(numpy 가 없는 경우 포함) 무시됨
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pending(session):
+    if session.in_nested_transaction():
+        return  # SAVEPOINT 만 되돌린 경우 나머지 변경분은 그대로 커밋됨
+    session.info.pop(PENDING_KEY, None)
@@ -0,0 +1,327 @@
+# 요청별 계측 모듈
+# 라우트별 응답 시간 히스토그램, 요청마다 실행된 SQL 수/DB 시간, 비밀번호 해시(bcrypt)와 JWT 처리 시간을 모아
+# Prometheus 텍스트 형식(/metrics)으로 내보내고, 설정 시 Server-Timing 응답 헤더로도 알려줌.
+#
+# 요청 처리 중의 값은 contextvars 로 요청마다 따로 모음. 동기 엔드포인트/의존성은 스레드풀에서 실행되지만
+# 컨텍스트가 복사되어 같은 RequestStats 객체를 가리키므로, 스레드에서 실행된 SQL 도 해당 요청에 집계됨.
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from sqlalchemy import event
+
+# 계측 사용 여부 (0이면 미들웨어가 아무것도 기록하지 않음)
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "1") == "1"
+
+# 응답에 Server-Timing 헤더를 붙일지 여부 (브라우저 개발자 도구에서 DB/bcrypt/JWT 시간을 볼 수 있음)
+SERVER_TIMING = os.environ.get("METRICS_SERVER_TIMING", "0") == "1"
+
+# 응답 시간 히스토그램 구간 (초, Prometheus 클라이언트 기본값과 같음)
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 요청당 SQL 실행 수 히스토그램 구간
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+# 묶음 커밋 한 번에 커밋한 쓰기 작업 수 히스토그램 구간
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: tuple, values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    """
+    레이블 조합별로 누적되는 카운터 클래스.
+
+    Attributes:
+        name (str): 지표 이름
+        help (str): 지표 설명
+        labelnames (tuple): 레이블 이름 목록
+    """
+
+    def __init__(self, name: str, help: str, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self._values: dict[tuple, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, *labels):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def value(self, *labels) -> float:
+        return self._values.get(labels, 0)
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """
+    레이블 조합별 구간 개수/합계/건수를 모으는 히스토그램 클래스 (Prometheus histogram 형식으로 출력됨).
+
+    Attributes:
+        name (str): 지표 이름
+        help (str): 지표 설명
+        labelnames (tuple): 레이블 이름 목록
+        buckets (tuple): 구간 상한 목록 (오름차순, +Inf 는 자동으로 추가됨)
+    """
+
+    def __init__(self, name: str, help: str, labelnames: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        self.buckets = buckets
+        self._series: dict[tuple, list] = {}  # 레이블 값 → [구간별 개수(누적 아님), 합계, 건수]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, *labels) -> int:
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, ([*counts], total, count)) for labels, (counts, total, count) in self._series.items())
+        for labels, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                le = 'le="+Inf"' if bound == "+Inf" else f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {count}")
+        return lines
+
+
+class CallbackMetric:
+    """
+    /metrics 를 만들 때마다 callback 을 호출하여 값을 읽어 오는 지표 클래스.
+    다른 모듈이 이미 세고 있는 값(캐시 적중 수, 해시 풀 사용률 등)을 따로 복사해 두지 않고 그대로 내보낼 때 사용함.
+
+    Attributes:
+        name (str): 지표 이름
+        help (str): 지표 설명
+        type (str): Prometheus 지표 형식 (counter 또는 gauge)
+        labelnames (tuple): 레이블 이름 목록
+        callback (Callable): {레이블 값 tuple: 값} dict 를 반환하는 함수
+    """
+
+    def __init__(self, name: str, help: str, type: str, callback, labelnames: tuple = ()):
+        self.name = name
+        self.help = help
+        self.type = type
+        self.labelnames = labelnames
+        self.callback = callback
+
+    def render(self) -> list[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.type}"]
+        for labels, value in sorted(self.callback().items()):
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+REQUEST_LABELS = ("method", "route", "status")
+
+request_duration = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route", REQUEST_LABELS
+)
+request_queries = Histogram(
+    "http_request_db_queries", "SQL statements executed per request", REQUEST_LABELS, QUERY_COUNT_BUCKETS
+)
+db_queries = Counter("db_queries_total", "SQL statements executed, by route", REQUEST_LABELS)
+db_seconds = Counter("db_query_seconds_total", "Time spent executing SQL, by route", REQUEST_LABELS)
+phase_duration = Histogram(
+    "app_phase_duration_seconds", "Time spent in expensive request phases (bcrypt, jwt, write_batch)", ("phase",)
+)
+
+shed_requests = Counter(
+    "app_shed_requests_total",
+    "Requests rejected before doing expensive work (rate limits, password hashing pool saturation)",
+    ("reason",),
+)
+
+write_batch_size = Histogram(
+    "db_write_batch_size", "Create/update requests committed together per group-commit transaction", (), BATCH_SIZE_BUCKETS
+)
+
+REGISTRY = [request_duration, request_queries, db_queries, db_seconds, phase_duration, shed_requests, write_batch_size]
+
+
+def register(*collected):
+    """
+    다른 모듈에서 만든 지표를 /metrics 출력에 추가하는 함수.
+    """
+    REGISTRY.extend(collected)
+
+
+class RequestStats:
+    """
+    요청 하나를 처리하는 동안 모은 값을 담는 클래스.
+
+    Attributes:
+        queries (int): 실행된 SQL 수
+        db_seconds (float): SQL 실행에 걸린 시간 합계 (초)
+        phases (dict[str, float]): 구간 이름(bcrypt, jwt, write_batch)별 시간 합계 (초)
+    """
+
+    __slots__ = ("queries", "db_seconds", "phases")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+        self.phases: dict[str, float] = {}
+
+
+# 현재 처리 중인 요청의 RequestStats (요청 밖에서 실행되는 코드에서는 None)
+_current: ContextVar[RequestStats | None] = ContextVar("request_stats", default=None)
+
+
+def current() -> RequestStats | None:
+    return _current.get()
+
+
+def record_phase(phase: str, seconds: float):
+    """
+    구간(phase) 처리 시간을 기록하는 함수. 요청 처리 중이면 해당 요청의 Server-Timing 에도 반영됨.
+    """
+    phase_duration.observe(seconds, phase)
+    stats = _current.get()
+    if stats is not None:
+        stats.phases[phase] = stats.phases.get(phase, 0.0) + seconds
+
+
+@contextmanager
+def timed(phase: str):
+    """
+    with 블록의 실행 시간을 구간(phase) 시간으로 기록하는 함수.
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, time.perf_counter() - started)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if context is not None and _current.get() is not None:
+        context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _current.get()
+    started = getattr(context, "_metrics_started", None)
+    if stats is None or started is None:
+        return
+    stats.queries += 1
+    stats.db_seconds += time.perf_counter() - started
+
+
+def instrument_engine(target_engine):
+    """
+    엔진에 SQL 실행 이벤트를 등록하여, 요청 처리 중 실행된 SQL 수와 실행 시간을 해당 요청에 집계하는 함수.
+    (AsyncEngine 은 sync_engine 을 넘겨야 함)
+    """
+    event.listen(target_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(target_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# 요청 처리가 끝날 때마다 (method, route, status, RequestStats) 로 호출되는 함수 목록
+# (테스트에서 라우트별 SQL 실행 수 상한을 검사하는 데 사용함)
+request_hooks: list = []
+
+
+def route_label(scope) -> str:
+    # 경로 템플릿(/posts/{post_id})으로 집계하여 레이블 조합 수가 늘어나지 않게 함
+    route = scope.get("route")
+    return getattr(route, "path", None) or "unmatched"
+
+
+def server_timing(stats: RequestStats, total: float) -> str:
+    parts = [f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.queries} queries"']
+    for phase, seconds in stats.phases.items():
+        parts.append(f"{phase};dur={seconds * 1000:.2f}")
+    parts.append(f"total;dur={total * 1000:.2f}")
+    return ", ".join(parts)
+
+
+class MetricsMiddleware:
+    """
+    요청마다 RequestStats 를 만들고, 응답이 끝나면 라우트별 응답 시간/SQL 수/DB 시간을 기록하는 ASGI 미들웨어 클래스.
+
+    설명:
+    - 스트리밍 응답이 본문을 보내는 동안 막히지 않도록 BaseHTTPMiddleware 대신 ASGI 미들웨어로 구현함.
+    - Server-Timing 헤더는 응답 헤더를 보내는 시점까지의 값으로 만들어짐.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not METRICS_ENABLED:
+            await self.app(scope, receive, send)
+            return
+        stats = RequestStats()
+        token = _current.set(stats)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                if SERVER_TIMING:
+                    header = server_timing(stats, time.perf_counter() - started)
+                    message["headers"] = [*message.get("headers", []), (b"server-timing", header.encode("latin-1"))]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            _current.reset(token)
+            labels = (scope["method"], route_label(scope), str(status_code))
+            request_duration.observe(time.perf_counter() - started, *labels)
+            request_queries.observe(stats.queries, *labels)
+            if stats.queries:
+                db_queries.inc(stats.queries, *labels)
+                db_seconds.inc(stats.db_seconds, *labels)
+            for hook in request_hooks:
+                hook(*labels, stats)
+
+
+def render() -> str:
+    """
+    모든 지표를 Prometheus 텍스트 형식(text/plain; version=0.0.4)으로 만드는 함수.
+    """
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
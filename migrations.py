@@ -0,0 +1,113 @@
+# 스키마 마이그레이션 모듈
+# Base.metadata.create_all 은 새 테이블만 만들고 기존 테이블에 컬럼/인덱스를 추가하지 않으므로,
+# 이미 운영 중인 데이터베이스에 필요한 스키마 변경을 번호 순서대로 한 번씩 적용함.
+# 적용된 마지막 번호는 schema_version 테이블에 기록됨.
+from sqlalchemy import inspect, select, update
+from sqlalchemy.orm import Session
+
+import facets
+import postfields
+import search
+import tags
+from models import Base, Post, SchemaVersion
+
+# 컬럼마다 index=True 를 지정하던 시절에 만들어진 단일 컬럼 인덱스 (이름, 테이블, 컬럼)
+# 실제 조회에 쓰이지 않으면서 INSERT/UPDATE 마다 갱신 비용만 들었으므로 마이그레이션 2에서 삭제함
+LEGACY_INDEXES = [
+    ("ix_users_id", "users", "id"),
+    *((f"ix_posts_{column}", "posts", column) for column in (
+        "id", "title", "company_name", "hashtags", "job_type", "career", "deadline", "salary", "joblocation", "Education",
+    )),
+    *((f"ix_resumes_{column}", "resumes", column) for column in (
+        "id", "title", "name", "gender", "email", "phonenumber", "education", "location", "introduce",
+    )),
+]
+
+
+def _add_missing_columns(db: Session, model, names: list[str]):
+    # 테이블에 없는 컬럼만 ALTER TABLE ... ADD COLUMN 으로 추가함 (create_all 로 새로 만든 테이블이면 아무것도 하지 않음)
+    table = model.__table__
+    existing = {column["name"] for column in inspect(db.connection()).get_columns(table.name)}
+    for name in names:
+        if name not in existing:
+            column = table.c[name]
+            column_type = column.type.compile(dialect=db.get_bind().dialect)
+            db.connection().exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN "{name}" {column_type}')
+
+
+def _create_missing_indexes(db: Session, model):
+    # 모델에 선언된 인덱스 중 데이터베이스에 없는 인덱스를 만듦
+    for index in model.__table__.indexes:
+        index.create(db.connection(), checkfirst=True)
+
+
+def _post_typed_columns(db: Session):
+    # 1: posts 에 연봉 범위/마감일 컬럼과 범위 검색용 복합 인덱스를 추가하고, 기존 게시글의 값을 채움
+    _add_missing_columns(db, Post, ["salary_min", "salary_max", "deadline_date"])
+    _create_missing_indexes(db, Post)
+    rows = db.execute(select(Post.id, Post.salary, Post.deadline)).all()
+    if rows:
+        db.execute(
+            update(Post),
+            [{"id": post_id, **postfields.typed_values(salary, deadline)} for post_id, salary, deadline in rows],
+        )
+
+
+def _query_driven_indexes(db: Session):
+    # 2: 사용하지 않는 단일 컬럼 인덱스를 삭제하고, 조회 형태에 맞춘 인덱스(작성자 FK, 목록 커버링 인덱스)를 만듦
+    for name, _, _ in LEGACY_INDEXES:
+        db.connection().exec_driver_sql(f'DROP INDEX IF EXISTS "{name}"')
+    _create_missing_indexes(db, Post)
+
+
+# (번호, 설명, 적용 함수) 목록. 번호는 1부터 순서대로 증가해야 하며, 한 번 배포한 항목은 수정하지 않음.
+MIGRATIONS = [
+    (1, "posts salary_min/salary_max/deadline_date", _post_typed_columns),
+    (2, "query-driven index set", _query_driven_indexes),
+]
+
+
+def current_version(db: Session) -> int:
+    """
+    데이터베이스에 적용된 마지막 마이그레이션 번호를 반환하는 함수 (없으면 0).
+    """
+    return db.execute(select(SchemaVersion.version)).scalar() or 0
+
+
+def migrate(bind) -> list[int]:
+    """
+    아직 적용되지 않은 마이그레이션을 순서대로 적용하는 함수.
+    각 마이그레이션은 schema_version 갱신과 함께 하나의 트랜잭션으로 커밋됨.
+
+    Returns:
+    - list[int]: 이번에 적용한 마이그레이션 번호 목록
+    """
+    applied = []
+    with Session(bind=bind) as db:
+        version = current_version(db)
+        for number, _, apply in MIGRATIONS:
+            if number <= version:
+                continue
+            apply(db)
+            if version == 0:
+                db.add(SchemaVersion(version=number))
+            else:
+                db.execute(update(SchemaVersion).values(version=number))
+            db.commit()
+            version = number
+            applied.append(number)
+    return applied
+
+
+def init_db(bind):
+    """
+    데이터베이스를 사용할 수 있는 상태로 만드는 함수 (앱 시작 시 또는 `python manage.py init-db` 로 실행).
+
+    설명:
+    - 새 테이블 생성 → 마이그레이션 → 검색 인덱스/태그/필터 집계 초기화 순서로 실행하며, 여러 번 실행해도 안전함.
+    """
+    Base.metadata.create_all(bind=bind)
+    migrate(bind)  # 기존 데이터베이스에 새 컬럼/인덱스를 추가함
+    search.init_search_index(bind)  # 게시글 검색용 FTS5 인덱스 생성
+    tags.init_tags(bind)  # 기존 게시글의 해시태그를 태그 테이블로 채움
+    facets.init_facets(bind)  # 기존 게시글의 필터별 게시글 수를 집계함
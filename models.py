@@ -1,12 +1,42 @@
 # SQLAlchemy 모듈 임포트
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Text, DateTime
+from sqlalchemy import Column, Integer, String, Date, ForeignKey, Text, DateTime, Float, Index
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, relationship
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from datetime import datetime  # datetime 모듈에서 datetime 클래스 import
+import os  # 환경 변수 조회용 모듈 임포트
+import metrics  # 요청별 SQL 수/DB 시간 계측 모듈 임포트
 
-# SQLite 데이터베이스 파일 경로
-DATABASE_URL = "sqlite:///./test.db"
+# 데이터베이스 URL (기본값은 SQLite 파일, 운영 환경에서는 postgresql://... 형식으로 지정)
+DATABASE_URL = os.environ.get("DATABASE_URL", "sqlite:///./test.db")
+
+# 비동기 모드용 데이터베이스 URL (지정하지 않으면 DATABASE_URL 의 드라이버를 ASYNC_DRIVERS 의 비동기 드라이버로 바꿔 사용함)
+ASYNC_DATABASE_URL = os.environ.get("ASYNC_DATABASE_URL", DATABASE_URL)
+
+# 데이터베이스 종류별 기본 비동기 드라이버 (sqlite:// → sqlite+aiosqlite://, postgresql:// → postgresql+asyncpg:// 등)
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg", "mysql": "aiomysql"}
+
+# URL 에 지정되어 있으면 그대로 사용하는 비동기 드라이버
+ASYNC_CAPABLE_DRIVERS = {"aiosqlite", "asyncpg", "psycopg", "aiomysql", "asyncmy"}
+
+# 연결 풀 설정 (SQLite 메모리 DB를 제외한 모든 데이터베이스에 적용됨)
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "20"))  # 항상 유지하는 연결 수
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "20"))  # 풀이 가득 찼을 때 추가로 여는 연결 수
+DB_POOL_TIMEOUT = float(os.environ.get("DB_POOL_TIMEOUT", "30"))  # 연결을 기다리는 최대 시간 (초)
+DB_POOL_RECYCLE = int(os.environ.get("DB_POOL_RECYCLE", "1800"))  # 연결을 다시 여는 주기 (초), 서버 측 유휴 연결 종료 대비
+DB_POOL_PRE_PING = os.environ.get("DB_POOL_PRE_PING", "1") == "1"  # 풀에서 꺼낼 때 연결이 살아 있는지 확인함
+DB_POOL_WARMUP = int(os.environ.get("DB_POOL_WARMUP", "4"))  # 앱 시작 시 미리 열어 둘 연결 수
+
+# SQLite 연결마다 적용하는 PRAGMA 설정
+SQLITE_PRAGMAS = {
+    "journal_mode": os.environ.get("SQLITE_JOURNAL_MODE", "WAL"),  # 읽기가 쓰기에 막히지 않도록 WAL 모드 사용
+    "synchronous": os.environ.get("SQLITE_SYNCHRONOUS", "NORMAL"),  # WAL 에서는 NORMAL 이어도 손상되지 않음 (체크포인트 때만 fsync)
+    "mmap_size": int(os.environ.get("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))),  # 읽기를 메모리 매핑으로 처리 (bytes)
+    "cache_size": int(os.environ.get("SQLITE_CACHE_SIZE", "-65536")),  # 연결별 페이지 캐시 (음수는 KiB 단위, 64MiB)
+    "busy_timeout": int(os.environ.get("SQLITE_BUSY_TIMEOUT", "5000")),  # 잠금 대기 시간 (ms)
+    "temp_store": os.environ.get("SQLITE_TEMP_STORE", "MEMORY"),  # 임시 테이블/정렬을 메모리에서 처리
+}
 
 # SQLAlchemy의 기본 모델 클래스를 선언
 Base = declarative_base()
@@ -18,7 +48,7 @@ class User(Base):
 
     Attributes:
         __tablename__ (str): 데이터베이스 테이블 이름 "users"
-        id (int): 사용자 고유 식별자, 기본 키 및 인덱스
+        id (int): 사용자 고유 식별자, 기본 키
         email (str): 사용자 이메일 주소, 고유하고 인덱싱됨
         hashed_password (str): 해시된 사용자 비밀번호
         name (str): 사용자 이름
@@ -27,7 +57,7 @@ class User(Base):
         birthdate (Date): 사용자 생년월일
     """
     __tablename__ = "users"
-    id = Column(Integer, primary_key=True, index=True)  # 기본 키 및 인덱스 역할을 수행하는 정수형 컬럼
+    id = Column(Integer, primary_key=True)  # 기본 키 역할을 수행하는 정수형 컬럼 (기본 키 자체가 인덱스이므로 별도 인덱스를 두지 않음)
     email = Column(String, unique=True, index=True)  # 고유한 이메일 주소를 저장하는 문자열 컬럼
     hashed_password = Column(String)  # 해시된 비밀번호를 저장하는 문자열 컬럼
     name = Column(String)  # 사용자 이름을 저장하는 문자열 컬럼
@@ -44,7 +74,7 @@ class Post(Base):
 
     Attributes:
         __tablename__ (str): 데이터베이스 테이블 이름 "posts"
-        id (int): 게시글 고유 식별자, 기본 키 및 인덱스
+        id (int): 게시글 고유 식별자, 기본 키
         title (str): 게시글 제목
         company_name (str): 회사 이름
         content (Text): 게시글 내용
@@ -52,44 +82,295 @@ class Post(Base):
         job_type (str): 직종
         career (str): 경력
         author_id (int): 작성자 고유 식별자, 외래 키
+        salary_min (int): salary 문자열에서 추출한 최소 연봉 (만원, 알 수 없으면 NULL)
+        salary_max (int): salary 문자열에서 추출한 최대 연봉 (만원, 알 수 없으면 NULL)
+        deadline_date (Date): deadline 문자열에서 추출한 마감일 (알 수 없으면 NULL)
     """
     __tablename__ = "posts"
-    id = Column(Integer, primary_key=True, index=True)  # 기본 키 및 인덱스 역할을 수행하는 정수형 컬럼.
-    title = Column(String, index=True)  # 게시글 제목을 저장하는 문자열 컬럼
-    company_name = Column(String, index=True)  # 회사 이름을 저장하는 문자열 컬럼
+    __table_args__ = (
+        # 연봉/마감일 범위 조건을 인덱스 범위 검색으로 처리하기 위한 복합 인덱스 (id는 같은 값 안에서의 정렬용)
+        Index("ix_posts_salary_max_id", "salary_max", "id"),
+        Index("ix_posts_salary_min_id", "salary_min", "id"),
+        Index("ix_posts_deadline_date_id", "deadline_date", "id"),
+        # 작성자별 게시글 조회(User.posts) 및 사용자 삭제 시 외래 키 확인용 인덱스
+        Index("ix_posts_author_id", "author_id"),
+        # 목록 조회(PostResponse2 필드)를 본문(content)이 있는 테이블 행을 읽지 않고 처리하기 위한 커버링 인덱스
+        Index("ix_posts_list", "id", "title", "company_name", "hashtags", "author_id"),
+    )
+    id = Column(Integer, primary_key=True)  # 기본 키 역할을 수행하는 정수형 컬럼.
+    title = Column(String)  # 게시글 제목을 저장하는 문자열 컬럼
+    company_name = Column(String)  # 회사 이름을 저장하는 문자열 컬럼
     content = Column(Text)  # 게시글 내용을 저장하는 텍스트형 컬럼
-    hashtags = Column(String, index=True)  # 해시태그를 저장하는 문자열 컬럼
-    job_type = Column(String, index=True)  # 직종을 저장하는 문자열 컬럼
-    career = Column(String, index=True)  # 경력을 저장하는 문자열 컬럼
-    deadline = Column(String, index=True)
-    salary = Column(String, index=True)
-    joblocation= Column(String, index=True)
-    Education= Column(String,index=True)
+    hashtags = Column(String)  # 해시태그를 저장하는 문자열 컬럼
+    job_type = Column(String)  # 직종을 저장하는 문자열 컬럼
+    career = Column(String)  # 경력을 저장하는 문자열 컬럼
+    deadline = Column(String)
+    salary = Column(String)
+    joblocation= Column(String)
+    Education= Column(String)
     author_id = Column(Integer, ForeignKey("users.id"))  # 작성자 고유 식별자를 저장하는 정수형 외래 키 컬럼
+    salary_min = Column(Integer)  # 최소 연봉 (만원)
+    salary_max = Column(Integer)  # 최대 연봉 (만원)
+    deadline_date = Column(Date)  # 마감일
     
 
 
     author = relationship("User", back_populates="posts")  # 게시글과 작성자 간의 일대다 관계 설정
 
+# 해시태그 정보를 저장하는 데이터베이스 모델 클래스
+class Tag(Base):
+    """
+    게시글 해시태그를 정규화하여 저장하는 데이터베이스 모델 클래스.
+
+    Attributes:
+        __tablename__ (str): 데이터베이스 테이블 이름 "tags"
+        id (int): 태그 고유 식별자, 기본 키
+        name (str): 정규화된 태그 이름 (# 제거, 소문자), 고유하고 인덱싱됨
+        post_count (int): 이 태그가 붙은 게시글 수 (게시글 작성/수정/삭제 시 함께 갱신됨)
+    """
+    __tablename__ = "tags"
+    id = Column(Integer, primary_key=True)  # 기본 키 역할을 수행하는 정수형 컬럼
+    name = Column(String, unique=True, index=True)  # 정규화된 태그 이름을 저장하는 문자열 컬럼
+    post_count = Column(Integer, nullable=False, default=0)  # 태그가 붙은 게시글 수를 저장하는 정수형 컬럼
+
+# 게시글과 해시태그의 연결 정보를 저장하는 데이터베이스 모델 클래스
+class PostTag(Base):
+    """
+    게시글과 태그의 다대다 관계를 저장하는 연결 테이블 모델 클래스.
+
+    Attributes:
+        __tablename__ (str): 데이터베이스 테이블 이름 "post_tags"
+        tag_id (int): 태그 고유 식별자, 외래 키
+        post_id (int): 게시글 고유 식별자, 외래 키
+
+    설명:
+        기본 키가 (tag_id, post_id) 순서이므로 태그 하나에 대한 게시글 ID 목록(posting list)을
+        인덱스 범위 스캔 한 번으로 정렬된 상태로 읽을 수 있음.
+    """
+    __tablename__ = "post_tags"
+    tag_id = Column(Integer, ForeignKey("tags.id"), primary_key=True)  # 태그 고유 식별자를 저장하는 외래 키 컬럼
+    post_id = Column(Integer, ForeignKey("posts.id"), primary_key=True)  # 게시글 고유 식별자를 저장하는 외래 키 컬럼
+
+    __table_args__ = (
+        Index("ix_post_tags_post_id", "post_id"),  # 게시글 수정/삭제 시 해당 게시글의 태그를 찾기 위한 인덱스
+    )
+
+# 게시글 필터별 집계 정보를 저장하는 데이터베이스 모델 클래스
+class FacetCount(Base):
+    """
+    목록 화면의 필터 옆에 표시할 필터 값별 게시글 수를 미리 집계해 두는 모델 클래스.
+
+    Attributes:
+        __tablename__ (str): 데이터베이스 테이블 이름 "facet_counts"
+        facet (str): 필터 이름 (job_type, career, joblocation, Education, salary)
+        value (str): 필터 값 (salary는 연봉 구간 이름)
+        count (int): 해당 값을 가진 게시글 수 (게시글 작성/수정/삭제와 같은 트랜잭션에서 갱신됨)
+    """
+    __tablename__ = "facet_counts"
+    facet = Column(String, primary_key=True)  # 필터 이름을 저장하는 문자열 컬럼
+    value = Column(String, primary_key=True)  # 필터 값을 저장하는 문자열 컬럼
+    count = Column(Integer, nullable=False, default=0)  # 게시글 수를 저장하는 정수형 컬럼
+
+# 테이블별 데이터 버전을 저장하는 데이터베이스 모델 클래스
+class SchemaVersion(Base):
+    """
+    적용된 스키마 마이그레이션 번호를 기록하는 데이터베이스 모델 클래스 (migrations.py 참고).
+
+    Attributes:
+        __tablename__ (str): 데이터베이스 테이블 이름 "schema_version"
+        version (int): 적용된 마이그레이션 번호
+    """
+    __tablename__ = "schema_version"
+    version = Column(Integer, primary_key=True)  # 적용된 마이그레이션 번호
+
+class TableVersion(Base):
+    """
+    테이블의 데이터가 바뀔 때마다 1씩 증가하는 버전 카운터 모델 클래스 (ETag 생성에 사용).
+
+    Attributes:
+        __tablename__ (str): 데이터베이스 테이블 이름 "table_versions"
+        name (str): 대상 테이블 이름 (posts, resumes)
+        version (int): 현재 버전 (해당 테이블에 쓰기가 커밋될 때마다 증가함)
+    """
+    __tablename__ = "table_versions"
+    name = Column(String, primary_key=True)  # 대상 테이블 이름을 저장하는 문자열 컬럼
+    version = Column(Integer, nullable=False, default=0)  # 버전 번호를 저장하는 정수형 컬럼
+
+# 워커 간 변경 알림을 저장하는 데이터베이스 모델 클래스
+class ChangeLog(Base):
+    """
+    커밋된 게시글/이력서 변경을 기록하여 다른 워커 프로세스가 자신의 캐시/인덱스에 반영하게 하는 모델 클래스 (serving.py 참고).
+
+    Attributes:
+        __tablename__ (str): 데이터베이스 테이블 이름 "change_log"
+        seq (int): 기록 순서 (AUTOINCREMENT, 오래된 행을 지워도 다시 쓰지 않음)
+        topic (str): 바뀐 항목 종류 (posts, resumes)
+        item_id (int): 바뀐 항목 ID
+        origin (str): 변경을 커밋한 프로세스 식별자 (자신이 기록한 변경은 건너뜀)
+        created_at (float): 기록 시각 (UNIX 시간, 오래된 행 정리에 사용)
+    """
+    __tablename__ = "change_log"
+    __table_args__ = {"sqlite_autoincrement": True}
+    seq = Column(Integer, primary_key=True)  # 기록 순서를 저장하는 정수형 컬럼
+    topic = Column(String, nullable=False)  # 항목 종류를 저장하는 문자열 컬럼
+    item_id = Column(Integer, nullable=False)  # 항목 ID를 저장하는 정수형 컬럼
+    origin = Column(String, nullable=False)  # 프로세스 식별자를 저장하는 문자열 컬럼
+    created_at = Column(Float, nullable=False)  # 기록 시각을 저장하는 실수형 컬럼
+
 class Resume(Base):
     __tablename__ = "resumes"
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String, index=True)
-    name= Column(String,index=True)
-    gender= Column(String,index=True)
-    email= Column(String,index=True)
-    phonenumber=Column(String,index=True)
-    education=Column(String,index=True)
-    location=Column(String,index=True)
-    introduce=Column(String,index=True)
+    id = Column(Integer, primary_key=True)
+    title = Column(String)
+    name= Column(String)
+    gender= Column(String)
+    email= Column(String)
+    phonenumber=Column(String)
+    education=Column(String)
+    location=Column(String)
+    introduce=Column(String)
+
+def sqlite_pragma_listener(pragmas: dict):
+    """
+    새 SQLite 연결마다 PRAGMA 를 적용하는 connect 이벤트 리스너를 만드는 함수.
+    """
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+    return set_sqlite_pragmas
+
+def engine_options(url: str) -> dict:
+    """
+    데이터베이스 URL에 맞는 create_engine 옵션을 반환하는 함수.
+    SQLite 메모리 DB는 연결 하나를 공유하는 풀을 사용하므로 풀 크기 설정을 적용하지 않음.
+    """
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "sqlite" and parsed.database in (None, "", ":memory:"):
+        return {}
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+def create_db_engine(url: str = DATABASE_URL, pragmas: dict | None = None, **kwargs):
+    """
+    설정이 적용된 데이터베이스 엔진을 생성하는 함수.
+
+    Parameters:
+    - url (str): 데이터베이스 URL
+    - pragmas (dict | None): SQLite 일 때 적용할 PRAGMA (기본값 SQLITE_PRAGMAS)
+    - kwargs: create_engine 에 그대로 전달할 추가 옵션
+    """
+    new_engine = create_engine(url, **{**engine_options(url), **kwargs})
+    if new_engine.dialect.name == "sqlite":
+        event.listen(new_engine, "connect", sqlite_pragma_listener(SQLITE_PRAGMAS if pragmas is None else pragmas))
+    return new_engine
 
 # 데이터베이스 엔진 생성
-engine = create_engine(DATABASE_URL)  # SQLite 데이터베이스 엔진을 생성하고 파일 경로를 설정함
+engine = create_db_engine(DATABASE_URL)  # 환경 변수 설정에 맞춰 데이터베이스 엔진을 생성함
+metrics.instrument_engine(engine)  # 요청 처리 중 실행된 SQL 수와 실행 시간을 요청별로 집계함
+
+def warm_up_pool(target_engine, count: int = DB_POOL_WARMUP):
+    """
+    연결 count 개를 동시에 열었다가 풀에 반납하여, 첫 요청들이 연결 생성/PRAGMA 적용 비용을 치르지 않게 하는 함수.
+    """
+    connections = []
+    try:
+        for _ in range(max(count, 1)):
+            connections.append(target_engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+async def warm_up_async_pool(count: int = DB_POOL_WARMUP):
+    """
+    비동기 엔진의 연결을 미리 열어 두는 함수 (warm_up_pool 의 비동기 버전).
+    """
+    connections = []
+    try:
+        for _ in range(max(count, 1)):
+            connections.append(await get_async_engine().connect())
+    finally:
+        for connection in connections:
+            await connection.close()
 
 # 데이터베이스 세션 생성기 설정
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # 세션 생성기를 설정하여 SQLAlchemy 세션을 만들 때 자동 커밋과 자동 플러시 기능을 비활성화하고,
 # 위에서 생성한 데이터베이스 엔진과 연결(bind)함
 
-# 데이터베이스에 선언된 모든 테이블 생성
-Base.metadata.create_all(bind=engine)  # SQLAlchemy 모델에서 정의한 모든 테이블을 데이터베이스에 생성함
+# 데이터베이스 URL 설정 오류 예외
+class DatabaseConfigError(Exception):
+    """
+    데이터베이스 URL 설정으로 엔진을 만들 수 없을 때 발생하는 예외 (비동기 모드에서는 앱 시작 시 발생함).
+    """
+
+# 비동기 드라이버 URL 변환 함수
+def async_database_url(url: str) -> str:
+    """
+    데이터베이스 URL을 비동기 드라이버 URL로 변환하는 함수.
+
+    설명:
+    - 비동기 드라이버(postgresql+asyncpg:// 등)가 이미 지정되어 있으면 그대로 반환함.
+    - 드라이버가 없거나 동기 드라이버(postgresql+psycopg2:// 등)이면 ASYNC_DRIVERS 의 기본 비동기 드라이버로 바꿈.
+
+    Raises:
+    - DatabaseConfigError: 비동기 드라이버를 알 수 없는 데이터베이스인 경우
+    """
+    parsed = make_url(url)
+    if "+" in parsed.drivername and parsed.get_driver_name() in ASYNC_CAPABLE_DRIVERS:
+        return url
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise DatabaseConfigError(
+            f"No async driver is known for '{parsed.drivername}' databases; "
+            f"set ASYNC_DATABASE_URL with an async driver (e.g. postgresql+asyncpg://...)"
+        )
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+# 비동기 데이터베이스 엔진 및 세션 생성기 (main_async 에서 처음 사용할 때 생성함)
+_async_engine = None
+_async_sessionmaker = None
+
+def get_async_engine():
+    """
+    비동기 모드에서 사용하는 AsyncEngine을 반환하는 함수.
+    aiosqlite / asyncpg 드라이버는 비동기 모드에서만 필요하므로 처음 호출될 때 엔진을 생성함.
+    """
+    global _async_engine
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+        url = async_database_url(ASYNC_DATABASE_URL)
+        _async_engine = create_async_engine(url, **engine_options(url))
+        if _async_engine.dialect.name == "sqlite":
+            event.listen(_async_engine.sync_engine, "connect", sqlite_pragma_listener(SQLITE_PRAGMAS))
+        metrics.instrument_engine(_async_engine.sync_engine)
+    return _async_engine
+
+def reset_engines_after_fork():
+    """
+    fork 로 만든 자식 프로세스(gunicorn 워커 등)에서 부모의 풀에 있던 연결을 버리고 새 연결을 열도록 하는 함수.
+    부모가 계속 쓰는 연결을 자식이 닫지 않도록 close=False 로 풀만 새로 만듦.
+    비동기 엔진은 이벤트 루프에 묶여 있으므로 버리고, 자식에서 처음 사용할 때 다시 만듦.
+    """
+    global _async_engine, _async_sessionmaker
+    engine.dispose(close=False)
+    _async_engine = None
+    _async_sessionmaker = None
+
+os.register_at_fork(after_in_child=reset_engines_after_fork)
+
+def AsyncSessionLocal():
+    """
+    비동기 세션(AsyncSession)을 생성하는 함수.
+    커밋 후에도 응답 직렬화에서 속성을 다시 읽지 않도록 expire_on_commit을 끔.
+    """
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        _async_sessionmaker = async_sessionmaker(get_async_engine(), autoflush=False, expire_on_commit=False)
+    return _async_sessionmaker()
@@ -0,0 +1,154 @@
+# 게시글 연봉 범위 / 마감일 컬럼 모듈
+# 자유 형식 문자열인 posts.salary, posts.deadline 을 숫자(salary_min, salary_max)와 날짜(deadline_date) 컬럼으로
+# 변환해 두어, "연봉 4000만원 이상", "7일 안에 마감" 같은 범위 조건을 인덱스로 조회할 수 있게 함.
+import calendar
+import re
+from datetime import date
+
+from models import Post
+
+# 연봉 문자열에서 금액(숫자와 단위)을 추출하는 정규식 (3,000만원, 2.5억, 4천만원, 1억 2천만원)
+AMOUNT_RE = re.compile(r"(\d[\d,]*(?:\.\d+)?)\s*(억|천만|천|만)?")
+
+# 연봉 범위 구분자 (3000~4000만원, 3000-4000만원)
+RANGE_RE = re.compile(r"[~\-–〜～]")
+
+# 금액 단위별 만원 환산 값 ("4천", "1억 2천"의 천은 천만으로 봄)
+SALARY_UNITS = {"억": 10000, "천만": 1000, "천": 1000, "만": 1}
+
+# 마감일 문자열에서 연/월/일을 추출하는 정규식 (2024-1-1, 2024.01.01, 2024/1/1, 2024년 1월 1일)
+# 연/월/일 사이에는 구분자가 반드시 있어야 함 (구분자 없이 붙여 쓴 날짜는 COMPACT_DATE_RE 로 처리함)
+DATE_RE = re.compile(r"(?<!\d)(\d{4})\s*(?:[-./]|년)\s*(\d{1,2})\s*(?:[-./]|월)\s*(\d{1,2})(?!\d)")
+
+# 구분자 없이 붙여 쓴 8자리 날짜 (20240101)
+COMPACT_DATE_RE = re.compile(r"(?<!\d)(\d{4})(\d{2})(\d{2})(?!\d)")
+
+# 일 없이 연/월만 있는 마감일 (2024-12, 2024.12 마감, 2024년 12월) → 그 달의 마지막 날로 봄
+MONTH_RE = re.compile(r"(?<!\d)(\d{4})\s*(?:[-./]|년)\s*(\d{1,2})(?![\d.])")
+
+
+def _salary_amount(terms: list[tuple[str, str]], inherited: str | None) -> int | None:
+    # 범위의 한쪽 금액("1억 2천만", "2.5억", "3000")을 만원으로 환산함 (모호하면 None)
+    total = 0.0
+    previous = None
+    for number, unit in terms:
+        value = float(number.replace(",", ""))
+        if unit:
+            factor = SALARY_UNITS[unit]
+        elif previous is not None:
+            factor = 1  # "1억 2000" 처럼 큰 단위 뒤에 붙은 숫자는 만원
+        elif inherited and len(terms) == 1:
+            factor = SALARY_UNITS[inherited]  # "2~2.5억" 의 2 는 뒤 금액의 단위를 따름
+        else:
+            return None
+        if previous is not None and factor >= previous:
+            return None  # 단위가 작아지지 않으면 한 금액으로 볼 수 없음 (예: "300만원, 성과급 200%")
+        total += value * factor
+        previous = factor
+    return round(total)
+
+
+def parse_salary(salary: str | None) -> tuple[int | None, int | None]:
+    """
+    연봉 문자열을 (최소, 최대) 연봉으로 변환하는 함수 (단위: 만원).
+
+    설명:
+    - "2000~4000만원" → (2000, 4000), "4000만원" → (4000, 4000), "2.5억" → (25000, 25000),
+      "4천만원" → (4000, 4000), "1억 2천만원" → (12000, 12000)
+    - 범위 앞쪽에 단위가 없으면 뒤쪽 금액의 단위를 따름 ("2~3억" → (20000, 30000)).
+    - 단위가 전혀 없으면 큰 숫자는 원 단위로 보고 만원으로 환산함 ("30000000원" → 3000).
+    - 숫자를 찾을 수 없거나 금액을 하나로 해석할 수 없으면 (None, None)을 반환함 (예: "회사내규에 따름", "2.5").
+    """
+    if not salary:
+        return None, None
+    parts = [terms for terms in (AMOUNT_RE.findall(part) for part in RANGE_RE.split(salary)) if terms]
+    if not parts:
+        return None, None
+    if not any(unit for terms in parts for _, unit in terms):
+        if any("." in number for terms in parts for number, _ in terms):
+            return None, None
+        numbers = [int(number.replace(",", "")) for terms in parts for number, _ in terms]
+        numbers = [number // 10000 if number >= 100000 else number for number in numbers]
+        return min(numbers), max(numbers)
+    amounts = []
+    inherited = None
+    for terms in reversed(parts):
+        amount = _salary_amount(terms, inherited)
+        if amount is None:
+            return None, None
+        amounts.append(amount)
+        inherited = terms[0][1] or inherited
+    return min(amounts), max(amounts)
+
+
+def parse_deadline(deadline: str | None) -> date | None:
+    """
+    마감일 문자열을 날짜로 변환하는 함수 (날짜를 찾을 수 없으면 None, 예: "상시채용").
+
+    설명:
+    - "2024-12-31", "2024년 12월 31일", "20241231" 처럼 연/월/일이 모두 있어야 그 날짜로 봄.
+    - "2024-12", "2024년 12월" 처럼 일이 없으면 그 달의 마지막 날로 봄.
+    - 존재하지 않는 날짜(2024-02-30 등)는 None 을 반환함.
+    """
+    if not deadline:
+        return None
+    match = DATE_RE.search(deadline) or COMPACT_DATE_RE.search(deadline)
+    try:
+        if match:
+            return date(*(int(part) for part in match.groups()))
+        match = MONTH_RE.search(deadline)
+        if match:
+            year, month = (int(part) for part in match.groups())
+            return date(year, month, calendar.monthrange(year, month)[1])
+    except ValueError:
+        return None
+    return None
+
+
+def typed_values(salary: str | None, deadline: str | None) -> dict:
+    """
+    연봉/마감일 문자열로 salary_min, salary_max, deadline_date 컬럼 값을 만드는 함수.
+    """
+    salary_min, salary_max = parse_salary(salary)
+    return {"salary_min": salary_min, "salary_max": salary_max, "deadline_date": parse_deadline(deadline)}
+
+
+def apply(post):
+    """
+    게시글(Post 객체 또는 컬럼 값 dict)에 연봉 범위와 마감일 컬럼 값을 채우는 함수.
+    게시글 작성/수정 시 flush 전에 호출해야 함.
+    """
+    if isinstance(post, dict):
+        post.update(typed_values(post.get("salary"), post.get("deadline")))
+        return
+    for key, value in typed_values(post.salary, post.deadline).items():
+        setattr(post, key, value)
+
+
+def filter_posts(query, salary_min: int | None = None, salary_max: int | None = None,
+                 deadline_from: date | None = None, deadline_to: date | None = None):
+    """
+    게시글 쿼리에 연봉/마감일 범위 조건을 추가하고, (쿼리, 정렬/커서 기준 id 식)을 반환하는 함수.
+
+    Parameters:
+    - salary_min (int | None): 최대 연봉이 이 값(만원) 이상인 게시글 (예: 4000 → 연봉 4000만원 이상 가능)
+    - salary_max (int | None): 최소 연봉이 이 값(만원) 이하인 게시글
+    - deadline_from (date | None): 마감일이 이 날짜 이후인 게시글 (이 날짜 포함)
+    - deadline_to (date | None): 마감일이 이 날짜 이전인 게시글 (이 날짜 포함)
+
+    설명:
+    - 각 조건은 (컬럼, id) 복합 인덱스의 범위 검색으로 처리됨. 연봉/마감일을 알 수 없는 게시글은 제외됨.
+    - "ORDER BY id LIMIT n" 이면 SQLite는 조건과 무관하게 기본 키 순서로 테이블 전체를 스캔하는 계획을 고르므로,
+      범위 조건이 있을 때는 정렬/커서 기준을 "id + 0" 식으로 바꿔 범위 인덱스를 사용하게 함.
+    """
+    if all(value is None for value in (salary_min, salary_max, deadline_from, deadline_to)):
+        return query, Post.id
+    if salary_min is not None:
+        query = query.filter(Post.salary_max >= salary_min)
+    if salary_max is not None:
+        query = query.filter(Post.salary_min <= salary_max)
+    if deadline_from is not None:
+        query = query.filter(Post.deadline_date >= deadline_from)
+    if deadline_to is not None:
+        query = query.filter(Post.deadline_date <= deadline_to)
+    return query, Post.id + 0
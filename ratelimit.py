@@ -0,0 +1,143 @@
+# 클라이언트별 요청 속도 제한 모듈 (토큰 버킷)
+# 비밀번호 해시(bcrypt)를 실행하는 /login, /register 에 대량 요청(크리덴셜 스터핑 등)이 몰려도
+# 다른 엔드포인트가 느려지지 않도록, 클라이언트 IP 와 대상 이메일별로 허용 속도를 넘은 요청을 DB 조회/해시 전에 거절(429)함.
+#
+# 상태는 프로세스 메모리에만 두며, 키마다 (남은 토큰, 마지막 갱신 시각) 두 값만 보관함.
+# 키를 해시하여 여러 구획(shard)으로 나누고 구획마다 잠금과 LRU 순서를 따로 두므로,
+# 검사 한 번은 O(1) 이고 구획마다 최대 키 수를 넘으면 가장 오래 쓰이지 않은 키부터 지움 (메모리 사용량이 일정함).
+# 지워진 키는 다음 요청 때 토큰이 가득 찬 버킷으로 다시 시작함.
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import metrics
+
+# 속도 제한 사용 여부
+RATE_LIMIT_ENABLED = os.environ.get("RATE_LIMIT_ENABLED", "1") == "1"
+
+# 인증 요청 속도 제한: 분당 허용 요청 수와 한 번에 몰아서 보낼 수 있는 요청 수(버킷 크기)
+AUTH_IP_PER_MINUTE = float(os.environ.get("AUTH_IP_PER_MINUTE", "30"))
+AUTH_IP_BURST = int(os.environ.get("AUTH_IP_BURST", "20"))
+AUTH_EMAIL_PER_MINUTE = float(os.environ.get("AUTH_EMAIL_PER_MINUTE", "5"))
+AUTH_EMAIL_BURST = int(os.environ.get("AUTH_EMAIL_BURST", "5"))
+
+# 제한기 하나가 기억하는 최대 키 수와 구획 수
+RATE_LIMIT_MAX_KEYS = int(os.environ.get("RATE_LIMIT_MAX_KEYS", "100000"))
+RATE_LIMIT_SHARDS = 64
+
+# 클라이언트 IP 를 X-Forwarded-For 헤더의 첫 번째 주소로 볼지 여부 (리버스 프록시 뒤에서 실행할 때만 1로 설정)
+RATE_LIMIT_TRUST_PROXY = os.environ.get("RATE_LIMIT_TRUST_PROXY", "0") == "1"
+
+
+class _Shard:
+    __slots__ = ("lock", "buckets")
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.buckets: OrderedDict[str, list] = OrderedDict()  # 키 → [남은 토큰, 마지막 갱신 시각], 최근 사용한 키가 뒤쪽
+
+
+class TokenBucketLimiter:
+    """
+    키별 토큰 버킷 속도 제한기 클래스.
+
+    Attributes:
+        name (str): 제한기 이름 (거절 지표의 reason 레이블로 사용됨)
+        rate (float): 초당 채워지는 토큰 수
+        burst (int): 버킷 크기 (연속으로 허용되는 최대 요청 수)
+        max_keys (int): 기억하는 최대 키 수 (구획별로 나누어 적용됨)
+    """
+
+    def __init__(self, name: str, per_minute: float, burst: int, max_keys: int = RATE_LIMIT_MAX_KEYS,
+                 shards: int = RATE_LIMIT_SHARDS, clock=time.monotonic):
+        self.name = name
+        self.rate = per_minute / 60.0
+        self.burst = burst
+        self.max_keys = max_keys
+        self._shards = [_Shard() for _ in range(shards)]
+        self._shard_keys = max(1, max_keys // shards)
+        self._clock = clock
+
+    def acquire(self, key: str) -> float:
+        """
+        키의 버킷에서 토큰 하나를 꺼내는 함수.
+
+        Returns:
+        - float: 허용되면 0, 거절되면 토큰 하나가 다시 찰 때까지 남은 시간 (초)
+        """
+        shard = self._shards[hash(key) % len(self._shards)]
+        now = self._clock()
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+            if bucket is None:
+                if len(shard.buckets) >= self._shard_keys:
+                    shard.buckets.popitem(last=False)  # 가장 오래 쓰이지 않은 키를 지움
+                bucket = shard.buckets[key] = [float(self.burst), now]
+            else:
+                shard.buckets.move_to_end(key)
+                bucket[0] = min(float(self.burst), bucket[0] + (now - bucket[1]) * self.rate)
+                bucket[1] = now
+            if bucket[0] >= 1.0:
+                bucket[0] -= 1.0
+                return 0.0
+            return (1.0 - bucket[0]) / self.rate if self.rate > 0 else math.inf
+
+    def __len__(self) -> int:
+        return sum(len(shard.buckets) for shard in self._shards)
+
+    def reset(self):
+        """
+        모든 키의 상태를 지우는 함수 (테스트용).
+        """
+        for shard in self._shards:
+            with shard.lock:
+                shard.buckets.clear()
+
+
+class RateLimited(Exception):
+    """
+    속도 제한을 넘은 요청에서 발생하는 예외. 엔드포인트에서는 429 응답(Retry-After 헤더 포함)으로 변환됨.
+
+    Attributes:
+        reason (str): 거절한 제한기 이름
+        retry_after (float): 다시 시도할 수 있을 때까지 남은 시간 (초)
+    """
+
+    def __init__(self, reason: str, retry_after: float):
+        super().__init__(f"rate limited by {reason}")
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+# 인증 엔드포인트용 제한기 (/login, /register 가 함께 사용함)
+auth_ip = TokenBucketLimiter("auth_ip", AUTH_IP_PER_MINUTE, AUTH_IP_BURST)
+auth_email = TokenBucketLimiter("auth_email", AUTH_EMAIL_PER_MINUTE, AUTH_EMAIL_BURST)
+
+
+def client_ip(request) -> str:
+    """
+    요청한 클라이언트의 IP 주소를 반환하는 함수 (RATE_LIMIT_TRUST_PROXY=1 이면 X-Forwarded-For 의 첫 번째 주소).
+    """
+    if RATE_LIMIT_TRUST_PROXY:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+
+def check_auth(request, email: str):
+    """
+    인증 요청을 클라이언트 IP 와 이메일 기준으로 검사하는 함수 (DB 조회와 해시 계산 전에 호출해야 함).
+
+    Raises:
+    - RateLimited: IP 또는 이메일의 허용 속도를 넘은 경우
+    """
+    if not RATE_LIMIT_ENABLED:
+        return
+    for limiter, key in ((auth_ip, client_ip(request)), (auth_email, email.casefold())):
+        retry_after = limiter.acquire(key)
+        if retry_after:
+            metrics.shed_requests.inc(1, limiter.name)
+            raise RateLimited(limiter.name, retry_after)
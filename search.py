@@ -0,0 +1,176 @@
+# 게시글 전문 검색(Full-Text Search) 모듈
+# SQLite FTS5 가상 테이블(posts_fts)을 posts 테이블의 그림자 인덱스로 사용함
+import re
+
+from sqlalchemy import text, or_
+from sqlalchemy.orm import Session
+
+from models import Post
+
+# FTS5 가상 테이블 이름
+FTS_TABLE = "posts_fts"
+
+# 검색 대상 컬럼 (FTS5 테이블의 컬럼 순서와 동일해야 함)
+FTS_COLUMNS = ("title", "company_name", "content", "hashtags")
+
+# 컬럼별 bm25 가중치 (제목 > 회사 이름 > 해시태그 > 본문)
+BM25_WEIGHTS = (10.0, 5.0, 1.0, 3.0)
+
+# 검색 결과에 동등(=) 조건으로 걸 수 있는 필터 컬럼
+FILTER_COLUMNS = ("job_type", "career", "joblocation", "Education")
+
+# 검색어에서 단어를 추출하는 정규식 (한글, 영문, 숫자)
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def is_supported(bind) -> bool:
+    """
+    현재 데이터베이스가 FTS5 검색을 지원하는지 확인하는 함수 (SQLite에서만 지원).
+    """
+    return bind.dialect.name == "sqlite"
+
+
+def init_search_index(bind):
+    """
+    FTS5 가상 테이블을 생성하는 함수.
+
+    설명:
+    - 테이블이 이미 있으면 아무 작업도 하지 않음.
+    - 새로 만든 경우에는 기존 게시글로 인덱스를 채움(backfill).
+    - 본문을 따로 저장하는 일반 FTS5 테이블이며, rowid를 게시글 ID와 동일하게 맞춤.
+    """
+    if not is_supported(bind):
+        return
+    with bind.begin() as conn:
+        exists = conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": FTS_TABLE},
+        ).first()
+        if exists:
+            return
+        conn.execute(text(
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5("
+            f"{', '.join(FTS_COLUMNS)}, "
+            "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+        ))
+        # ORDER BY rank 로 정렬할 때 컬럼 가중치가 적용되도록 기본 랭킹 함수를 설정함
+        conn.execute(text(
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rank) "
+            f"VALUES ('rank', 'bm25({', '.join(str(w) for w in BM25_WEIGHTS)})')"
+        ))
+        _copy_posts(conn)
+
+
+def rebuild_search_index(db: Session):
+    """
+    FTS5 인덱스를 비우고 posts 테이블 전체로 다시 채우는 함수 (인덱스 불일치 복구용).
+    """
+    if not is_supported(db.get_bind()):
+        return
+    db.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    _copy_posts(db)
+
+
+def _copy_posts(conn):
+    # posts 테이블의 모든 게시글을 FTS5 테이블로 복사함
+    columns = ", ".join(FTS_COLUMNS)
+    conn.execute(text(f"INSERT INTO {FTS_TABLE}(rowid, {columns}) SELECT id, {columns} FROM posts"))
+
+
+def index_post(db: Session, post: Post):
+    """
+    게시글 하나를 FTS5 인덱스에 추가하거나 갱신하는 함수.
+    게시글 작성/수정과 같은 트랜잭션 안에서 호출해야 함 (post.id가 채워진 뒤, 즉 flush 이후).
+    """
+    if not is_supported(db.get_bind()):
+        return
+    unindex_post(db, post.id)
+    columns = ", ".join(FTS_COLUMNS)
+    params = ", ".join(f":{column}" for column in FTS_COLUMNS)
+    db.execute(
+        text(f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (:id, {params})"),
+        {"id": post.id, **{column: getattr(post, column) for column in FTS_COLUMNS}},
+    )
+
+
+def index_new_posts(db: Session, rows: list[dict]):
+    """
+    새로 등록된 게시글 여러 개를 한 번의 executemany 로 FTS5 인덱스에 추가하는 함수 (대량 등록용).
+    각 행에는 id 와 검색 대상 컬럼 값이 있어야 함.
+    """
+    if not rows or not is_supported(db.get_bind()):
+        return
+    columns = ", ".join(FTS_COLUMNS)
+    params = ", ".join(f":{column}" for column in FTS_COLUMNS)
+    db.execute(
+        text(f"INSERT INTO {FTS_TABLE}(rowid, {columns}) VALUES (:id, {params})"),
+        [{"id": row["id"], **{column: row[column] for column in FTS_COLUMNS}} for row in rows],
+    )
+
+
+def unindex_post(db: Session, post_id: int):
+    """
+    게시글 하나를 FTS5 인덱스에서 제거하는 함수.
+    """
+    if not is_supported(db.get_bind()):
+        return
+    db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": post_id})
+
+
+def build_match_query(q: str) -> str | None:
+    """
+    사용자가 입력한 검색어를 FTS5 MATCH 구문으로 변환하는 함수.
+
+    설명:
+    - 검색어를 단어 단위로 나누고, 각 단어를 큰따옴표로 감싸 FTS5 연산자로 해석되지 않게 함.
+    - 각 단어 뒤에 *를 붙여 접두어 검색을 수행함 (예: "개발" → "개발자").
+    - 단어 사이는 공백(AND)으로 연결하며, 단어가 하나도 없으면 None을 반환함.
+    """
+    tokens = TOKEN_RE.findall(q)
+    if not tokens:
+        return None
+    return " ".join(f'"{token}"*' for token in tokens)
+
+
+def search_posts(db: Session, q: str, filters: dict, limit: int = 10):
+    """
+    게시글을 검색어로 검색하여 관련도 순으로 반환하는 함수.
+
+    Parameters:
+    - db (Session): SQLAlchemy 세션 객체
+    - q (str): 검색어
+    - filters (dict): 동등 조건 필터 (job_type, career, joblocation, Education 중 값이 있는 것)
+    - limit (int): 조회할 게시글 개수
+
+    Returns:
+    - list: (id, company_name, title, hashtags, author_id, score) 행 목록 (score가 높을수록 관련도 높음)
+
+    설명:
+    - FTS5의 rank(가중치 bm25) 순으로 정렬하므로 검색어에 맞는 문서만 역색인에서 읽음.
+    - FTS5를 지원하지 않는 데이터베이스에서는 LIKE 검색으로 대체하며 score는 0으로 반환함.
+    """
+    match = build_match_query(q)
+    if match is None:
+        return []
+    filters = {key: value for key, value in filters.items() if key in FILTER_COLUMNS and value is not None}
+
+    if not is_supported(db.get_bind()):
+        query = db.query(Post.id, Post.company_name, Post.title, Post.hashtags, Post.author_id)
+        for token in TOKEN_RE.findall(q):
+            pattern = f"%{token}%"
+            query = query.filter(or_(*(getattr(Post, column).ilike(pattern) for column in FTS_COLUMNS)))
+        for key, value in filters.items():
+            query = query.filter(getattr(Post, key) == value)
+        return [(*row, 0.0) for row in query.order_by(Post.id.desc()).limit(limit).all()]
+
+    where = "".join(f' AND p."{key}" = :{key}' for key in filters)
+    rows = db.execute(
+        text(
+            "SELECT p.id, p.company_name, p.title, p.hashtags, p.author_id, -f.rank AS score "
+            f"FROM {FTS_TABLE} AS f JOIN posts AS p ON p.id = f.rowid "
+            f"WHERE f.{FTS_TABLE} MATCH :match{where} "
+            "ORDER BY f.rank LIMIT :limit"
+        ),
+        {"match": match, "limit": limit, **filters},
+    ).all()
+    return [tuple(row) for row in rows]
@@ -0,0 +1,256 @@
+# 멀티 프로세스(워커 여러 개) 실행 지원 모듈
+# gunicorn 등으로 워커 프로세스를 여러 개 띄울 때 다음을 처리함 (gunicorn.conf.py 참고).
+#   1) preload: 마스터 프로세스에서 스키마 준비, 추천 지원자 스냅숏, 매칭 인덱스 만들기를 한 번만 실행하고 연결을 닫은 뒤 fork 함.
+#      워커는 준비 작업을 반복하지 않고, 인덱스 배열은 copy-on-write 메모리로, 스냅숏은 디스크 메모리 맵으로 공유함.
+#   2) fork 안전성: 워커는 부모의 DB 연결, 쓰기 스레드, 해시 작업 프로세스를 물려받지 않음
+#      (models, writebatch, hashing 모듈의 os.register_at_fork 참고).
+#   3) 워커 간 캐시 일관성: 게시글/이력서 변경을 커밋과 같은 트랜잭션에서 change_log 테이블에 기록하고,
+#      각 워커는 전용 연결로 change_log 를 주기적으로 읽어 자신의 응답 캐시(메모리 백엔드), 매칭 인덱스, 추천 지원자 변경분에 반영함.
+#      SQLite 에서는 PRAGMA data_version 이 바뀌었을 때(다른 연결이 커밋했을 때)만 change_log 를 조회하므로,
+#      쓰기가 없는 동안의 확인 비용은 PRAGMA 한 번임.
+#
+# change_log 의 seq 순서가 커밋 순서와 같아야 하므로 쓰기가 직렬화되는 SQLite 를 기준으로 함.
+# (PostgreSQL 처럼 시퀀스 발급 순서와 커밋 순서가 다를 수 있으면, 늦게 커밋된 작은 seq 는 응답 캐시 TTL 이 지날 때까지 반영되지 않을 수 있음)
+import logging
+import os
+import threading
+import time
+import uuid
+
+from sqlalchemy import delete, event, func, insert, select
+from sqlalchemy.orm import Session
+
+import candidates
+import matching
+import migrations
+import versions
+from cache import response_cache, post_key, resume_key
+from models import ChangeLog, Post, Resume, engine
+
+logger = logging.getLogger(__name__)
+
+# change_log 기록과 워커별 변경 확인 사용 여부 (워커를 여러 개 띄울 때 모든 프로세스에서 1로 설정)
+WORKER_SYNC_ENABLED = os.environ.get("WORKER_SYNC_ENABLED", "0") == "1"
+
+# 다른 워커의 변경을 확인하는 주기 (ms)
+WORKER_SYNC_INTERVAL_MS = float(os.environ.get("WORKER_SYNC_INTERVAL_MS", "200"))
+
+# change_log 행을 보관하는 시간 (초)과 오래된 행을 지우는 주기 (초)
+CHANGE_LOG_RETENTION = float(os.environ.get("CHANGE_LOG_RETENTION", "3600"))
+CHANGE_LOG_PRUNE_INTERVAL = 60.0
+
+# 한 번에 읽는 change_log 행 수
+POLL_BATCH = 1000
+
+# 마스터 프로세스에서 preload() 를 실행했는지 여부 (fork 한 워커에도 그대로 전달됨)
+preloaded = False
+
+
+def _new_origin() -> str:
+    return f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+
+
+# change_log 에 기록하는 이 프로세스의 식별자 (fork 하면 자식에서 새로 만듦)
+origin = _new_origin()
+
+
+@event.listens_for(Session, "before_commit")
+def _record_changes(session):
+    # 커밋 후 이 프로세스의 매칭 인덱스/추천 지원자에 반영될 변경분을 같은 트랜잭션에서 change_log 에도 기록함
+    if not WORKER_SYNC_ENABLED or session.in_nested_transaction():
+        return
+    now = time.time()
+    rows = [
+        {"topic": topic, "item_id": item_id, "origin": origin, "created_at": now}
+        for topic, key in ((versions.POSTS, matching.PENDING_KEY), (versions.RESUMES, candidates.PENDING_KEY))
+        for item_id in session.info.get(key, ())
+    ]
+    if rows:
+        session.execute(insert(ChangeLog), rows)
+
+
+def apply_changes(conn, changed: dict[str, set]) -> int:
+    """
+    다른 프로세스가 커밋한 변경({topic: 항목 ID 집합})을 이 프로세스의 응답 캐시와 인덱스에 반영하는 함수.
+    인덱스에는 현재 행 값을 다시 읽어 넣으므로 같은 변경을 여러 번 반영해도 결과가 같음.
+
+    Returns:
+    - int: 반영한 항목 수
+    """
+    post_ids = sorted(changed.get(versions.POSTS, ()))
+    if post_ids:
+        response_cache.invalidate(*(post_key(post_id) for post_id in post_ids))
+        if matching.index.loaded:
+            rows = conn.execute(
+                select(Post.id, Post.content, Post.hashtags, Post.Education, Post.joblocation).where(Post.id.in_(post_ids))
+            )
+            values = {row[0]: tuple(row[1:]) for row in rows}
+            matching.index.apply({post_id: values.get(post_id) for post_id in post_ids})
+    resume_ids = sorted(changed.get(versions.RESUMES, ()))
+    if resume_ids:
+        response_cache.invalidate(*(resume_key(resume_id) for resume_id in resume_ids))
+        if candidates.index.snapshot is not None:
+            rows = conn.execute(
+                select(Resume.id, Resume.introduce, Resume.education, Resume.location).where(Resume.id.in_(resume_ids))
+            )
+            values = {row[0]: tuple(row[1:]) for row in rows}
+            candidates.index.apply({resume_id: values.get(resume_id) for resume_id in resume_ids})
+    return len(post_ids) + len(resume_ids)
+
+
+class ChangeListener:
+    """
+    다른 프로세스가 기록한 change_log 를 주기적으로 읽어 이 프로세스에 반영하는 클래스 (워커마다 스레드 하나).
+
+    Attributes:
+        interval (float): 확인 주기 (초)
+        last_seq (int | None): 마지막으로 읽은 change_log 순서 (None 이면 처음 확인할 때 현재 위치부터 읽음)
+    """
+
+    def __init__(self, interval_ms: float = WORKER_SYNC_INTERVAL_MS):
+        self.interval = interval_ms / 1000.0
+        self.last_seq: int | None = None
+        self._data_version = None
+        self._last_prune = time.monotonic()
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+
+    def mark(self, conn):
+        """
+        지금까지 기록된 변경은 이미 반영된 것으로 보고, 이후 기록되는 변경부터 읽도록 위치를 정하는 함수.
+        캐시/인덱스를 만들기 전에 호출해야 그 사이에 커밋된 변경을 놓치지 않음.
+        """
+        self.last_seq = conn.execute(select(func.coalesce(func.max(ChangeLog.seq), 0))).scalar()
+        conn.rollback()
+
+    def poll(self, conn) -> int:
+        """
+        새로 기록된 변경을 읽어 반영하는 함수.
+        PRAGMA data_version 은 연결마다 따로 세므로, conn 은 확인할 때마다 같은 연결이어야 함.
+
+        Returns:
+        - int: 반영한 다른 프로세스의 변경 수
+        """
+        if self.last_seq is None:
+            self.mark(conn)
+        if conn.dialect.name == "sqlite":
+            data_version = conn.exec_driver_sql("PRAGMA data_version").scalar()
+            if data_version == self._data_version:
+                conn.rollback()
+                return 0
+            self._data_version = data_version
+        applied = 0
+        while True:
+            rows = conn.execute(
+                select(ChangeLog.seq, ChangeLog.topic, ChangeLog.item_id, ChangeLog.origin)
+                .where(ChangeLog.seq > self.last_seq)
+                .order_by(ChangeLog.seq)
+                .limit(POLL_BATCH)
+            ).all()
+            if not rows:
+                break
+            changed: dict[str, set] = {}
+            for _, topic, item_id, row_origin in rows:
+                if row_origin != origin:  # 이 프로세스의 변경은 커밋할 때 이미 반영됨
+                    changed.setdefault(topic, set()).add(item_id)
+            applied += apply_changes(conn, changed)
+            self.last_seq = rows[-1][0]
+            if len(rows) < POLL_BATCH:
+                break
+        conn.rollback()
+        return applied
+
+    def prune(self, conn):
+        """
+        보관 시간이 지난 change_log 행을 지우는 함수.
+        """
+        conn.execute(delete(ChangeLog).where(ChangeLog.created_at < time.time() - CHANGE_LOG_RETENTION))
+        conn.commit()
+
+    def _run(self, bind, stop: threading.Event):
+        with bind.connect() as conn:
+            while not stop.wait(self.interval):
+                try:
+                    self.poll(conn)
+                    if time.monotonic() - self._last_prune >= CHANGE_LOG_PRUNE_INTERVAL:
+                        self._last_prune = time.monotonic()
+                        self.prune(conn)
+                except Exception:
+                    # 일시적인 오류(잠금 대기 시간 초과 등)는 다음 확인 때 다시 시도함
+                    logger.exception("worker sync poll failed")
+                    conn.rollback()
+                    self._data_version = None
+
+    def start(self, bind=engine):
+        """
+        변경 확인 스레드를 시작하는 함수 (워커의 앱 시작 시 호출).
+        """
+        if self._thread is not None:
+            return
+        if self.last_seq is None:
+            with bind.connect() as conn:
+                self.mark(conn)
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(bind, self._stop), name="worker-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        변경 확인 스레드를 종료하는 함수.
+        """
+        thread, self._thread = self._thread, None
+        if thread is not None:
+            self._stop.set()
+            thread.join()
+
+    def reset_after_fork(self):
+        """
+        fork 로 만든 자식 프로세스에서 부모의 스레드 상태를 버리는 함수 (읽은 위치 last_seq 는 이어서 사용함).
+        """
+        self._thread = None
+        self._stop = threading.Event()
+        self._data_version = None
+
+
+# 프로세스마다 하나씩 사용하는 변경 확인기
+listener = ChangeListener()
+
+
+def _after_fork_in_child():
+    global origin
+    origin = _new_origin()
+    listener.reset_after_fork()
+
+
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def prepare(bind=engine):
+    """
+    워커들이 데이터베이스와 디스크로 공유하는 준비 작업을 실행하는 함수 (스키마 준비, 추천 지원자 스냅숏 만들기).
+    uvicorn --workers 처럼 워커를 spawn 으로 띄울 때는 `python manage.py prepare` 로 먼저 실행함.
+    """
+    migrations.init_db(bind)
+    if matching.is_available():
+        candidates.index.refresh(bind)
+
+
+def preload(bind=engine):
+    """
+    fork 방식 서버(gunicorn preload_app)의 마스터 프로세스에서 워커를 만들기 전에 한 번 실행하는 함수.
+
+    설명:
+    - prepare() 에 더해 MATCHING_PRELOAD=1 이면 매칭 인덱스를 만들어 워커가 메모리를 공유하게 함.
+    - 변경 확인 위치를 스냅숏/인덱스를 만들기 전에 정하므로, 그 사이에 커밋된 변경은 워커가 읽어 반영함.
+    - 마스터가 연 연결은 fork 전에 모두 닫음.
+    """
+    global preloaded
+    migrations.init_db(bind)
+    with bind.connect() as conn:
+        listener.mark(conn)
+    if matching.is_available():
+        candidates.index.refresh(bind)
+        if matching.MATCHING_PRELOAD:
+            matching.index.load(bind)
+    bind.dispose()
+    preloaded = True
@@ -0,0 +1,195 @@
+# 게시글 해시태그 정규화 및 태그 검색 모듈
+# posts.hashtags 문자열을 tags / post_tags 테이블로 정규화하여 태그 조합 검색에 사용함
+import re
+
+from collections import Counter
+
+from sqlalchemy import distinct, func, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from models import Post, PostTag, Tag
+
+# 해시태그 문자열에서 태그를 추출하는 정규식 (#, 공백, 쉼표로 구분)
+TAG_RE = re.compile(r"[^\s#,]+")
+
+
+def parse_hashtags(hashtags: str | None) -> list[str]:
+    """
+    해시태그 문자열을 정규화된 태그 이름 목록으로 변환하는 함수.
+
+    설명:
+    - "#gobal, #ENG" → ["gobal", "eng"] 처럼 #, 공백, 쉼표를 구분자로 사용함.
+    - 대소문자를 구분하지 않도록 소문자로 변환하고, 중복은 처음 나온 순서대로 한 번만 남김.
+    """
+    if not hashtags:
+        return []
+    return list(dict.fromkeys(tag.casefold() for tag in TAG_RE.findall(hashtags)))
+
+
+def _get_or_create_tags(db: Session, names: list[str]) -> dict[str, int]:
+    # 태그 이름 목록에 해당하는 태그 ID를 조회하고, 없는 태그는 새로 생성함
+    # (다른 트랜잭션이 같은 태그를 동시에 만들어도 tags.name 고유 제약 위반 없이 그 태그를 사용함)
+    found = dict(db.query(Tag.name, Tag.id).filter(Tag.name.in_(names)).all())
+    missing = [name for name in names if name not in found]
+    if not missing:
+        return found
+    dialect = db.get_bind().dialect.name
+    if dialect in ("sqlite", "postgresql"):
+        insert_ = sqlite.insert if dialect == "sqlite" else postgresql.insert
+        db.execute(
+            insert_(Tag).on_conflict_do_nothing(index_elements=[Tag.name]),
+            [{"name": name, "post_count": 0} for name in missing],
+        )
+    else:
+        for name in missing:
+            try:
+                with db.begin_nested():  # 이미 있는 태그면 이 태그의 INSERT 만 되돌림
+                    db.execute(insert(Tag).values(name=name, post_count=0))
+            except IntegrityError:
+                pass
+    found.update(db.query(Tag.name, Tag.id).filter(Tag.name.in_(missing)).all())
+    return found
+
+
+def _bump_counts(db: Session, tag_ids, delta: int):
+    # 태그별 게시글 수를 delta 만큼 증감함
+    if tag_ids:
+        db.execute(update(Tag).where(Tag.id.in_(list(tag_ids))).values(post_count=Tag.post_count + delta))
+
+
+def set_post_tags(db: Session, post_id: int, hashtags: str | None):
+    """
+    게시글의 해시태그 문자열을 post_tags 테이블에 반영하는 함수.
+    게시글 작성/수정과 같은 트랜잭션 안에서 호출해야 함.
+
+    설명:
+    - 기존 태그와 새 태그를 비교하여 달라진 부분만 추가/삭제함.
+    - 추가/삭제된 태그의 post_count를 함께 갱신하여 태그 빈도 조회가 게시글 수와 무관하게 동작하도록 함.
+    """
+    names = parse_hashtags(hashtags)
+    current = dict(
+        db.query(Tag.name, Tag.id).join(PostTag, PostTag.tag_id == Tag.id).filter(PostTag.post_id == post_id).all()
+    )
+    removed = [tag_id for name, tag_id in current.items() if name not in names]
+    added = [name for name in names if name not in current]
+
+    if removed:
+        db.query(PostTag).filter(PostTag.post_id == post_id, PostTag.tag_id.in_(removed)).delete(synchronize_session=False)
+        _bump_counts(db, removed, -1)
+    if added:
+        tag_ids = _get_or_create_tags(db, added)
+        db.add_all(PostTag(tag_id=tag_ids[name], post_id=post_id) for name in added)
+        _bump_counts(db, [tag_ids[name] for name in added], 1)
+
+
+def add_new_posts_tags(db: Session, posts: list[tuple[int, str | None]]):
+    """
+    새로 등록된 게시글 여러 개의 태그를 한 번에 post_tags 테이블에 추가하는 함수 (대량 등록용).
+
+    Parameters:
+    - db (Session): SQLAlchemy 세션 객체
+    - posts (list): (게시글 ID, 해시태그 문자열) 목록. 아직 태그가 없는 게시글이어야 함
+
+    설명:
+    - 모든 게시글의 태그 이름을 모아 태그 조회/생성을 한 번만 수행하고, post_tags 는 executemany 로 추가함.
+    - post_count 는 같은 증가량을 가진 태그끼리 묶어 UPDATE 함.
+    """
+    parsed = [(post_id, parse_hashtags(hashtags)) for post_id, hashtags in posts]
+    names = list(dict.fromkeys(name for _, post_names in parsed for name in post_names))
+    if not names:
+        return
+    found = _get_or_create_tags(db, names)
+    links = [{"tag_id": found[name], "post_id": post_id} for post_id, post_names in parsed for name in post_names]
+    db.execute(insert(PostTag), links)
+    counts = Counter(link["tag_id"] for link in links)
+    by_delta: dict[int, list[int]] = {}
+    for tag_id, delta in counts.items():
+        by_delta.setdefault(delta, []).append(tag_id)
+    for delta, tag_ids in by_delta.items():
+        _bump_counts(db, tag_ids, delta)
+
+
+def remove_post_tags(db: Session, post_id: int):
+    """
+    게시글에 연결된 태그를 모두 제거하는 함수 (게시글 삭제 시 같은 트랜잭션 안에서 호출).
+    """
+    tag_ids = [tag_id for (tag_id,) in db.query(PostTag.tag_id).filter(PostTag.post_id == post_id).all()]
+    if tag_ids:
+        db.query(PostTag).filter(PostTag.post_id == post_id).delete(synchronize_session=False)
+        _bump_counts(db, tag_ids, -1)
+
+
+def rebuild_tags(db: Session):
+    """
+    post_tags 와 태그별 게시글 수를 posts.hashtags 로부터 다시 만드는 함수 (backfill 및 불일치 복구용).
+    """
+    db.query(PostTag).delete(synchronize_session=False)
+    db.query(Tag).update({Tag.post_count: 0}, synchronize_session=False)
+    for post_id, hashtags in db.query(Post.id, Post.hashtags).yield_per(1000):
+        set_post_tags(db, post_id, hashtags)
+
+
+def init_tags(bind):
+    """
+    기존 게시글의 해시태그를 post_tags 테이블로 채우는 함수 (post_tags가 비어 있을 때만 수행).
+    """
+    with Session(bind=bind) as db:
+        if db.query(PostTag).first() is None and db.query(Post.id).first() is not None:
+            rebuild_tags(db)
+            db.commit()
+
+
+def _tagged_post_ids(names: set[str]):
+    # 태그 이름 목록 중 하나 이상이 붙은 게시글 ID를 조회하는 SELECT (post_tags ⋈ tags)
+    return select(PostTag.post_id).join(Tag, Tag.id == PostTag.tag_id).where(Tag.name.in_(names))
+
+
+def find_post_ids(db: Session, all_tags: list[str], any_tags: list[str], limit: int = 10) -> list[int]:
+    """
+    태그 조건에 맞는 게시글 ID를 최신순으로 반환하는 함수.
+
+    Parameters:
+    - db (Session): SQLAlchemy 세션 객체
+    - all_tags (list[str]): 모두 포함해야 하는 태그 목록 (AND)
+    - any_tags (list[str]): 하나 이상 포함해야 하는 태그 목록 (OR)
+    - limit (int): 반환할 게시글 개수
+
+    Returns:
+    - list[int]: 조건에 맞는 게시글 ID 목록 (ID 내림차순)
+
+    설명:
+    - 교집합/합집합을 데이터베이스에서 계산하고 limit 개의 ID만 읽으므로, posting list 를 애플리케이션으로 가져오지 않음.
+    - all_tags 는 "GROUP BY post_id HAVING COUNT(DISTINCT tag_id) = 태그 수" 로 모든 태그가 붙은 게시글을 구함.
+    - any_tags 는 "post_id IN (태그 중 하나가 붙은 게시글)" 조건으로 구함.
+    """
+    if not all_tags and not any_tags:
+        return []
+    if all_tags:
+        names = set(all_tags)
+        query = (
+            _tagged_post_ids(names)
+            .group_by(PostTag.post_id)
+            .having(func.count(distinct(PostTag.tag_id)) == len(names))
+        )
+        if any_tags:
+            query = query.where(PostTag.post_id.in_(_tagged_post_ids(set(any_tags))))
+    else:
+        query = _tagged_post_ids(set(any_tags)).distinct()
+    return list(db.scalars(query.order_by(PostTag.post_id.desc()).limit(limit)))
+
+
+def tag_frequencies(db: Session, limit: int = 50) -> list[tuple[str, int]]:
+    """
+    게시글 수가 많은 순서대로 (태그 이름, 게시글 수) 목록을 반환하는 함수.
+    미리 집계된 post_count를 읽으므로 posts 테이블을 스캔하지 않음.
+    """
+    return [
+        tuple(row)
+        for row in db.query(Tag.name, Tag.post_count)
+        .filter(Tag.post_count > 0)
+        .order_by(Tag.post_count.desc(), Tag.name)
+        .limit(limit)
+        .all()
+    ]
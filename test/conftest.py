@@ -0,0 +1,117 @@
+# pytest 공용 설정
+# 테스트는 임시 디렉터리의 새 SQLite 데이터베이스를 사용함 (models 를 임포트하기 전에 환경 변수를 설정해야 함).
+import os
+import sys
+import tempfile
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+TEST_DIR = tempfile.mkdtemp(prefix="refujobs-test-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{os.path.join(TEST_DIR, 'test.db')}")
+os.environ.setdefault("HASH_POOL_WORKERS", "0")  # 테스트에서는 해시 작업 프로세스를 띄우지 않음
+os.environ.setdefault("CANDIDATES_INDEX_DIR", os.path.join(TEST_DIR, "candidates_index"))
+
+# 실행 중인 서버에 직접 요청을 보내는 수동 테스트 스크립트는 pytest 수집 대상에서 제외함
+collect_ignore = ["test_main.py", "test2.py", "test3.py"]
+
+SAMPLE_POST = {
+    "title": "파이썬 백엔드 개발자",
+    "company_name": "(주)테스트",
+    "hashtags": "#Python #remote",
+    "job_type": "개발",
+    "career": "신입",
+    "content": "FastAPI 경험자 우대",
+    "deadline": "2024-12-31",
+    "salary": "3000~4000만원",
+    "joblocation": "서울",
+    "Education": "대졸",
+}
+
+
+# 라우트별 요청 한 번에 허용하는 SQL 실행 수 (N+1 조회 회귀를 잡기 위한 상한)
+# 목록/개별 조회는 페이지 크기와 관계없이 일정해야 하므로 상한을 작게 두고,
+# 쓰기는 검색 인덱스/태그/필터 집계 갱신을 포함한 값으로 둠. 목록에 없는 라우트는 DEFAULT_QUERY_BUDGET 을 적용함.
+QUERY_BUDGETS = {
+    "GET /posts/": 3,  # 테이블 버전 + 페이지 (+ 작성자 IN 조회)
+    "GET /posts/{post_id}": 3,  # (If-None-Match 확인 버전) + 항목 + 캐시 저장 전 버전 확인
+    "GET /posts/search": 2,
+    "GET /posts/by-tags": 2,  # 게시글 ID (태그 조건) + 게시글
+    "GET /posts/facets": 1,
+    "GET /tags/": 1,
+    "GET /resumes/": 2,
+    "GET /resumes/{resume_id}": 3,
+    "GET /resumes/{resume_id}/matches": 3,  # 이력서 + 게시글 IN 조회 (+ 프로세스의 첫 요청이면 인덱스 만들기)
+    "GET /posts/{post_id}/candidates": 4,  # 게시글 + 새 이력서 + 이력서 IN 조회 (+ 스냅숏이 없으면 만들기)
+    "GET /users/me": 1,
+    "POST /login": 1,
+    "POST /register": 5,
+    "POST /posts/": 20,
+    "PUT /posts/{post_id}": 20,
+    "DELETE /posts/{post_id}": 20,
+    "POST /posts/bulk": 40,
+    "POST /resumes/bulk": 10,
+}
+DEFAULT_QUERY_BUDGET = 5
+
+
+@pytest.fixture(autouse=True)
+def query_budget():
+    """
+    테스트 중 처리된 모든 요청의 SQL 실행 수를 QUERY_BUDGETS 와 비교하여, 상한을 넘은 요청이 있으면 테스트를 실패시키는 fixture.
+    """
+    import metrics
+
+    violations = []
+
+    def check(method, route, status, stats):
+        budget = QUERY_BUDGETS.get(f"{method} {route}", DEFAULT_QUERY_BUDGET)
+        if stats.queries > budget:
+            violations.append(f"{method} {route} ({status}): {stats.queries} queries > budget {budget}")
+
+    metrics.request_hooks.append(check)
+    yield
+    metrics.request_hooks.remove(check)
+    assert not violations, "query budget exceeded:\n" + "\n".join(violations)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limits():
+    """
+    테스트마다 인증 요청 속도 제한 상태를 비워, 앞선 테스트의 요청 수가 다음 테스트에 영향을 주지 않게 하는 fixture.
+    """
+    import ratelimit
+
+    ratelimit.auth_ip.reset()
+    ratelimit.auth_email.reset()
+
+
+@pytest.fixture(scope="session")
+def client():
+    from fastapi.testclient import TestClient
+
+    import main
+    with TestClient(main.app) as test_client:  # with 블록 안에서 lifespan(테이블 생성/마이그레이션)이 실행됨
+        yield test_client
+
+
+@pytest.fixture
+def db(client):
+    from models import SessionLocal
+
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def query_plan(db):
+    """
+    SQLAlchemy 쿼리의 EXPLAIN QUERY PLAN 결과(단계별 설명 목록)를 반환하는 함수를 제공하는 fixture.
+    """
+    def explain(query) -> list[str]:
+        dialect = db.get_bind().dialect
+        sql = str(query.statement.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+        return [row[-1] for row in db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}")]
+    return explain
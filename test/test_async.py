@@ -0,0 +1,75 @@
+# 비동기 모드(main_async) 앱과 비동기 데이터베이스 URL 설정 테스트
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+import main_async
+import models
+from conftest import SAMPLE_POST
+from test_pagination import RESUME
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("sqlite:///./test.db", "sqlite+aiosqlite:///./test.db"),
+    ("sqlite://", "sqlite+aiosqlite://"),
+    ("postgresql://user:secret@db:5432/refujobs", "postgresql+asyncpg://user:secret@db:5432/refujobs"),
+    ("postgresql+psycopg2://user@db/refujobs", "postgresql+asyncpg://user@db/refujobs"),
+    ("postgresql+psycopg://user@db/refujobs", "postgresql+psycopg://user@db/refujobs"),
+    ("postgresql+asyncpg://user@db/refujobs", "postgresql+asyncpg://user@db/refujobs"),
+    ("mysql+pymysql://user@db/refujobs", "mysql+aiomysql://user@db/refujobs"),
+])
+def test_async_database_url(url, expected):
+    assert models.async_database_url(url) == expected
+
+
+def test_unknown_dialect_is_a_configuration_error():
+    with pytest.raises(models.DatabaseConfigError, match="ASYNC_DATABASE_URL"):
+        models.async_database_url("mssql+pyodbc://user@db/refujobs")
+
+
+@pytest.fixture(scope="module")
+def async_client(client):
+    with TestClient(main_async.app) as test_client:  # lifespan 에서 비동기 연결 풀을 미리 채움
+        yield test_client
+
+
+def test_post_crud(async_client, client):
+    response = async_client.post("/posts/", json=dict(SAMPLE_POST, title="비동기 작성", hashtags="#async-crud"))
+    assert response.status_code == 200
+    post_id = response.json()["id"]
+
+    assert async_client.get(f"/posts/{post_id}").json()["title"] == "비동기 작성"
+    assert client.get(f"/posts/{post_id}").json()["title"] == "비동기 작성"  # 같은 데이터베이스를 사용함
+    assert [post["id"] for post in async_client.get("/posts/by-tags", params={"all": "async-crud"}).json()] == [post_id]
+    # 동기 앱과 같은 저장 경로를 쓰므로 연봉/마감일 범위 검색용 컬럼도 채워짐
+    page = async_client.get("/posts/", params={"salary_min": 4000, "limit": 1, "cursor": main.encode_cursor(post_id - 1)}).json()
+    assert [post["id"] for post in page] == [post_id]
+
+    updated = async_client.put(f"/posts/{post_id}", json=dict(SAMPLE_POST, title="비동기 수정"))
+    assert updated.status_code == 200 and updated.json()["title"] == "비동기 수정"
+    assert async_client.get(f"/posts/{post_id}").json()["title"] == "비동기 수정"
+
+    assert async_client.delete(f"/posts/{post_id}").status_code == 200
+    assert async_client.get(f"/posts/{post_id}").status_code == 404
+    assert async_client.put(f"/posts/{post_id}", json=SAMPLE_POST).status_code == 404
+
+
+def test_resume_crud_and_lists(async_client):
+    async_client.post("/resumes/", json=dict(RESUME, title="비동기 목록"))
+    resume_id = async_client.post("/resumes/", json=dict(RESUME, title="비동기 이력서")).json()["id"]
+    assert async_client.get(f"/resumes/{resume_id}").json()["title"] == "비동기 이력서"
+    assert async_client.put(f"/resumes/{resume_id}", json=dict(RESUME, title="수정")).json()["title"] == "수정"
+
+    first = async_client.get("/resumes/", params={"limit": 1})
+    assert first.status_code == 200 and len(first.json()) == 1
+    second = async_client.get("/resumes/", params={"limit": 1, "cursor": first.headers["X-Next-Cursor"]})
+    assert second.json()[0]["id"] > first.json()[0]["id"]
+    assert async_client.get("/posts/", params={"limit": 0}).status_code == 422
+
+    assert async_client.delete(f"/resumes/{resume_id}").status_code == 200
+    assert async_client.get(f"/resumes/{resume_id}").status_code == 404
+
+
+def test_export_streams_from_async_session(async_client):
+    lines = async_client.get("/resumes/export").text.splitlines()
+    assert lines and all(line.startswith("{") for line in lines)
@@ -0,0 +1,54 @@
+# 인증 사용자(principal) 캐시 테스트
+from auth import PrincipalCache, principal_cache
+from models import User
+from test_ratelimit import PASSWORD, user_payload
+
+
+def login(client, email: str) -> dict:
+    client.post("/register", json=user_payload(email))
+    token = client.post("/login", json={"email": email, "password": PASSWORD}).json()["access_token"]
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_token_served_from_cache(client):
+    headers = login(client, "principal@example.com")
+    assert client.get("/users/me", headers=headers).json()["email"] == "principal@example.com"
+    hits = principal_cache.hits
+    assert client.get("/users/me", headers=headers).json()["email"] == "principal@example.com"
+    assert principal_cache.hits == hits + 1
+    assert client.get("/users/me", headers={"Authorization": "Bearer not-a-token"}).status_code == 401
+
+
+def test_update_invalidates_cached_principal(client, db):
+    headers = login(client, "rename@example.com")
+    assert client.get("/users/me", headers=headers).json()["name"] == "제한"  # 캐시에 올림
+
+    user = db.query(User).filter(User.email == "rename@example.com").one()
+    user.name = "바뀐 이름"
+    db.commit()
+    assert client.get("/users/me", headers=headers).json()["name"] == "바뀐 이름"
+
+    # 이메일이 바뀌면 이전 이메일로 발급된 토큰은 더 이상 사용할 수 없음
+    user.email = "renamed@example.com"
+    db.commit()
+    assert client.get("/users/me", headers=headers).status_code == 401
+
+
+def test_delete_invalidates_cached_principal(client, db):
+    headers = login(client, "deleted@example.com")
+    assert client.get("/users/me", headers=headers).status_code == 200
+    db.delete(db.query(User).filter(User.email == "deleted@example.com").one())
+    db.commit()
+    assert client.get("/users/me", headers=headers).status_code == 401
+
+
+def test_cache_size_is_bounded():
+    cache = PrincipalCache(2)
+    for index in range(5):
+        cache.put(f"token-{index}", User(id=index, email=f"user-{index}@example.com"), expires_at=2e9)
+    assert cache.stats()["size"] == 2
+    assert cache.get("token-0") is None and cache.get("token-4").email == "user-4@example.com"
+    cache.invalidate_email("user-4@example.com")
+    assert cache.get("token-4") is None
+    cache.put("expired", User(id=9, email="old@example.com"), expires_at=0)
+    assert cache.get("expired") is None
@@ -0,0 +1,56 @@
+# 게시글/이력서 대량 등록(JSON 배열, NDJSON) 테스트
+import json
+
+import main
+from conftest import SAMPLE_POST
+from test_pagination import RESUME
+
+
+def test_json_array_with_invalid_items(client):
+    items = [dict(SAMPLE_POST, title="대량 1"), {"title": "필드 누락"}, dict(SAMPLE_POST, title="대량 2", hashtags="#bulk-tag")]
+    response = client.post("/posts/bulk", json=items)
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["inserted"], body["failed"]) == (2, 1)
+    assert [result["index"] for result in body["results"]] == [0, 1, 2]
+    assert body["results"][1]["id"] is None and "company_name" in body["results"][1]["error"]
+
+    first, _, second = (result["id"] for result in body["results"])
+    assert second > first
+    assert client.get(f"/posts/{first}").json()["title"] == "대량 1"
+    # 검색 인덱스, 태그, 연봉/마감일 컬럼도 함께 반영됨
+    assert second in [post["id"] for post in client.get("/posts/search", params={"q": "대량"}).json()]
+    assert [post["id"] for post in client.get("/posts/by-tags", params={"all": "bulk-tag"}).json()] == [second]
+    page = client.get("/posts/", params={"salary_min": 4000, "cursor": main.encode_cursor(first - 1)}).json()
+    assert second in [post["id"] for post in page]
+
+
+def test_ndjson_resumes(client):
+    lines = [json.dumps(dict(RESUME, title=f"NDJSON {index}"), ensure_ascii=False) for index in range(3)]
+    body = "\n".join([lines[0], "{not json", "", *lines[1:]]) + "\n"
+    response = client.post("/resumes/bulk", content=body.encode(), headers={"Content-Type": "application/x-ndjson"})
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["inserted"], result["failed"]) == (3, 1)
+    assert result["results"][1]["error"].startswith("Invalid JSON")
+    ids = [item["id"] for item in result["results"] if item["id"] is not None]
+    assert [client.get(f"/resumes/{resume_id}").json()["title"] for resume_id in ids] == ["NDJSON 0", "NDJSON 1", "NDJSON 2"]
+
+
+def test_malformed_body_rejected(client):
+    assert client.post("/posts/bulk", content=b"[{", headers={"Content-Type": "application/json"}).status_code == 400
+    # application/json 본문은 전체를 하나의 JSON 으로 해석하므로 배열이 아니면 400
+    response = client.post("/posts/bulk", json={"title": "x"})
+    assert response.status_code == 400 and "JSON array" in response.json()["detail"]
+    assert client.post("/posts/bulk", content=b'{"a": 1}\n{"b": 2}', headers={"Content-Type": "application/json"}).status_code == 400
+
+
+def test_content_type_selects_format(client):
+    # 여러 줄로 들여쓴 JSON 배열도 application/json 이면 한 번에 해석함
+    pretty = json.dumps([dict(SAMPLE_POST, title="들여쓴 배열")], ensure_ascii=False, indent=2)
+    response = client.post("/posts/bulk", content=("\n" + pretty).encode(), headers={"Content-Type": "application/json; charset=utf-8"})
+    assert response.status_code == 200 and (response.json()["inserted"], response.json()["failed"]) == (1, 0)
+    # Content-Type 이 없으면 본문의 첫 글자로 판단함
+    ndjson = "\n".join(json.dumps(dict(RESUME, title=title), ensure_ascii=False) for title in ("무형식 1", "무형식 2"))
+    response = client.post("/resumes/bulk", content=ndjson.encode(), headers={"Content-Type": ""})
+    assert response.status_code == 200 and response.json()["inserted"] == 2
@@ -0,0 +1,107 @@
+# 개별 조회 응답 캐시 및 ETag(304) 테스트
+import pytest
+from starlette.requests import Request
+
+import cache
+import main
+import versions
+from cache import response_cache, post_key
+from conftest import SAMPLE_POST
+
+
+def make_request(if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "query_string": b""})
+
+
+@pytest.mark.parametrize("backend", [cache.LRUCache(100, 1 << 20), cache.RedisCache(cache.FakeRedis()), cache.NullCache()])
+def test_backends(backend):
+    backend.set("a", b"1", 60)
+    assert backend.get("a") == (None if isinstance(backend, cache.NullCache) else b"1")
+    backend.delete("a")
+    assert backend.get("a") is None
+
+
+def test_backend_interface_is_abstract():
+    with pytest.raises(TypeError):
+        cache.CacheBackend()
+
+    class Partial(cache.CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Partial()
+
+
+def test_lru_cache_limits():
+    lru = cache.LRUCache(max_entries=2, max_bytes=1 << 20)
+    lru.set("a", b"1", 60)
+    lru.set("b", b"2", 60)
+    lru.get("a")
+    lru.set("c", b"3", 60)  # 가장 오래 사용하지 않은 b 가 밀려남
+    assert (lru.get("a"), lru.get("b"), lru.get("c")) == (b"1", None, b"3")
+    assert lru.evictions == 1
+    lru.set("d", b"4", 0)
+    assert lru.get("d") is None  # TTL 만료
+
+
+def test_item_cached_and_invalidated(client):
+    post_id = client.post("/posts/", json=dict(SAMPLE_POST, title="캐시 전")).json()["id"]
+    first = client.get(f"/posts/{post_id}")
+    assert response_cache.backend.get(post_key(post_id)) is not None
+    etag = first.headers["ETag"]
+
+    hits = response_cache.hits
+    assert client.get(f"/posts/{post_id}").content == first.content
+    assert response_cache.hits == hits + 1
+
+    assert client.get(f"/posts/{post_id}", headers={"If-None-Match": etag}).status_code == 304
+    assert client.get(f"/posts/{post_id}", headers={"If-None-Match": f'W/{etag}'}).status_code == 304
+
+    client.put(f"/posts/{post_id}", json=dict(SAMPLE_POST, title="캐시 후"))
+    assert response_cache.backend.get(post_key(post_id)) is None
+    updated = client.get(f"/posts/{post_id}", headers={"If-None-Match": etag})
+    assert updated.status_code == 200 and updated.json()["title"] == "캐시 후"
+    assert updated.headers["ETag"] != etag
+
+    client.delete(f"/posts/{post_id}")
+    assert client.get(f"/posts/{post_id}").status_code == 404
+
+
+def test_list_etag(client):
+    client.post("/posts/", json=SAMPLE_POST)
+    first = client.get("/posts/", params={"limit": 5})
+    etag = first.headers["ETag"]
+    assert client.get("/posts/", params={"limit": 5}, headers={"If-None-Match": etag}).status_code == 304
+    assert client.get("/posts/", params={"limit": 6}, headers={"If-None-Match": etag}).status_code == 200  # 페이지가 다르면 ETag 도 다름
+    client.post("/posts/", json=SAMPLE_POST)
+    assert client.get("/posts/", params={"limit": 5}, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_read_racing_a_write_is_not_cached():
+    key = "post:race"
+
+    # 항목을 읽은 뒤 테이블 버전이 바뀌었으면 (조회 중 수정이 커밋됨) 캐시에 넣지 않음
+    response = main.read_cached_item(make_request(), versions.POSTS, 1, key, lambda: 8, lambda: (7, b"{}"))
+    assert response.status_code == 200 and response_cache.backend.get(key) is None
+
+    # 조회 중에 키가 무효화되었으면 버전이 같아도 캐시에 넣지 않음
+    def load_while_invalidated():
+        response_cache.invalidate(key)
+        return 8, b"{}"
+
+    main.read_cached_item(make_request(), versions.POSTS, 1, key, lambda: 8, load_while_invalidated)
+    assert response_cache.backend.get(key) is None
+
+    main.read_cached_item(make_request(), versions.POSTS, 1, key, lambda: 8, lambda: (8, b"{}"))
+    assert versions.unpack(response_cache.backend.get(key)) == (versions.item_etag(versions.POSTS, 1, 8), b"{}")
+    response_cache.invalidate(key)
+
+
+def test_set_skipped_after_invalidation():
+    generation = response_cache.generation("resume:gen")
+    response_cache.invalidate("resume:gen")
+    assert not response_cache.set("resume:gen", b"stale", generation)
+    assert response_cache.set("resume:gen", b"fresh", response_cache.generation("resume:gen"))
+    response_cache.invalidate("resume:gen")
@@ -0,0 +1,112 @@
+# 게시글 추천 지원자(GET /posts/{post_id}/candidates)와 디스크 스냅숏/구획 검색 테스트
+import os
+
+import pytest
+
+import candidates
+import matching
+from conftest import SAMPLE_POST
+from models import SessionLocal, engine
+
+pytestmark = pytest.mark.skipif(not matching.is_available(), reason="numpy is not installed")
+
+POST = dict(SAMPLE_POST, title="데이터 엔지니어", content="Kafka Spark 데이터 파이프라인 운영", hashtags="#kafka #airflow",
+            Education="대졸", joblocation="부산 해운대구")
+
+
+def make_resume(email: str, **fields) -> dict:
+    resume = {"title": "지원", "name": "지원자", "gender": "여", "email": email, "phonenumber": "010-0000-0000",
+              "education": "석사", "location": "부산", "introduce": "Kafka 와 Spark 로 데이터 파이프라인을 운영했습니다"}
+    return dict(resume, **fields)
+
+
+@pytest.fixture(scope="module")
+def posting(client):
+    resumes = {
+        "strong": make_resume("strong@example.com"),
+        "other_region": make_resume("region@example.com", location="서울 강남구"),
+        "low_education": make_resume("edu@example.com", education="고졸"),
+        "unrelated": make_resume("unrelated@example.com", introduce="그래픽 디자인 포트폴리오", location="대전"),
+    }
+    ids = {name: client.post("/resumes/", json=resume).json()["id"] for name, resume in resumes.items()}
+    post_id = client.post("/posts/", json=POST).json()["id"]
+    with SessionLocal() as db:
+        candidates.rebuild_candidates(db)  # 위 이력서를 포함한 스냅숏에서 시작함
+    return post_id, ids
+
+
+def candidate_ids(client, post_id, **params) -> list[int]:
+    response = client.get(f"/posts/{post_id}/candidates", params=params)
+    assert response.status_code == 200
+    return [resume["id"] for resume in response.json()]
+
+
+def test_candidates_ranked_and_prefiltered(client, posting):
+    post_id, ids = posting
+    response = client.get(f"/posts/{post_id}/candidates", params={"k": 1})
+    assert response.status_code == 200
+    [best] = response.json()
+    assert best["id"] == ids["strong"]
+    assert best["email"] == "strong@example.com" and best["score"] > 0
+    # 부산/대졸 이상 구획만 읽었으므로 전체 이력서보다 적게 계산함
+    assert candidates.index.last_scanned < candidates.index.snapshot.count
+
+    # 구획 안의 결과가 k 개보다 적으면 모든 구획으로 넓혀 다른 지역/학력 이력서도 포함함
+    wide = candidate_ids(client, post_id, k=candidates.MAX_K)
+    assert wide[0] == ids["strong"]
+    assert ids["other_region"] in wide and ids["low_education"] in wide
+    assert wide.index(ids["strong"]) < wide.index(ids["other_region"])
+
+
+def test_probe_keys():
+    keys = ["부산|4", "부산|1", "서울|4", "|0", "부산|0"]
+    assert candidates.probe_keys(keys, "대졸", "부산 해운대구") == ["부산|4", "|0", "부산|0"]
+    assert candidates.probe_keys(keys, "학력무관", None) == keys
+
+
+def test_snapshot_is_shared_from_disk(client, posting, monkeypatch):
+    import numpy
+
+    post_id, ids = posting
+    candidate_ids(client, post_id)
+    name = candidates._current_name(candidates.CANDIDATES_INDEX_DIR)
+    assert os.path.exists(os.path.join(candidates.CANDIDATES_INDEX_DIR, name, "cols.npy"))
+
+    # 다른 워커처럼 새 객체로 열어도 스냅숏을 다시 만들지 않고 메모리 맵으로 읽음
+    monkeypatch.setattr(candidates, "build_snapshot", lambda *args: pytest.fail("snapshot rebuilt"))
+    worker = candidates.CandidateIndex()
+    worker.refresh(engine)
+    assert worker.snapshot.name == name
+    assert isinstance(worker.snapshot.cols, numpy.memmap)
+    query = candidates.post_query(POST["content"], POST["hashtags"], POST["Education"], POST["joblocation"])
+    assert worker.top_k(query, POST["Education"], POST["joblocation"], 1)[0][0] == ids["strong"]
+
+
+def test_changes_after_snapshot(client, posting):
+    post_id, ids = posting
+    candidate_ids(client, post_id)
+
+    # 스냅숏 이후 등록된 이력서는 새 이력서 조회로 반영됨
+    new_id = client.post("/resumes/", json=make_resume("new@example.com", introduce="Kafka Spark 파이프라인 Kafka")).json()["id"]
+    assert new_id in candidate_ids(client, post_id, k=10)
+
+    # 수정/삭제는 커밋 후 바로 반영됨
+    client.put(f"/resumes/{ids['unrelated']}", json=make_resume("unrelated@example.com", location="부산"))
+    assert ids["unrelated"] in candidate_ids(client, post_id, k=10)
+    client.delete(f"/resumes/{ids['strong']}")
+    assert ids["strong"] not in candidate_ids(client, post_id, k=candidates.MAX_K)
+
+    # 새 스냅숏으로 옮겨 간 뒤에도 같은 결과가 나옴
+    before = candidate_ids(client, post_id, k=10)
+    previous = candidates.index.snapshot.name
+    with SessionLocal() as db:
+        candidates.rebuild_candidates(db)
+    assert candidate_ids(client, post_id, k=10) == before
+    assert candidates.index.snapshot.name != previous
+    assert not os.path.exists(os.path.join(candidates.CANDIDATES_INDEX_DIR, previous))
+
+
+def test_candidates_errors(client):
+    assert client.get("/posts/999999/candidates").status_code == 404
+    assert client.get("/posts/1/candidates", params={"k": 0}).status_code == 422
+    assert client.get("/posts/1/candidates", params={"k": candidates.MAX_K + 1}).status_code == 422
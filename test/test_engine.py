@@ -0,0 +1,56 @@
+# 데이터베이스 엔진/연결 풀/SQLite PRAGMA 설정 테스트
+import os
+
+import models
+from conftest import TEST_DIR
+from models import create_db_engine, engine, engine_options
+
+
+def read_pragmas(target_engine, *names) -> dict:
+    with target_engine.connect() as conn:
+        return {name: conn.exec_driver_sql(f"PRAGMA {name}").scalar() for name in names}
+
+
+def test_app_engine_applies_pragmas():
+    pragmas = read_pragmas(engine, "journal_mode", "synchronous", "busy_timeout", "temp_store", "cache_size", "mmap_size")
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,  # NORMAL
+        "busy_timeout": models.SQLITE_PRAGMAS["busy_timeout"],
+        "temp_store": 2,  # MEMORY
+        "cache_size": models.SQLITE_PRAGMAS["cache_size"],
+        "mmap_size": models.SQLITE_PRAGMAS["mmap_size"],
+    }
+
+
+def test_custom_pragmas_and_pool_options():
+    url = f"sqlite:///{os.path.join(TEST_DIR, 'engine-options.db')}"
+    custom = create_db_engine(url, pragmas={"journal_mode": "DELETE", "busy_timeout": 1234}, pool_size=3)
+    try:
+        assert read_pragmas(custom, "journal_mode", "busy_timeout") == {"journal_mode": "delete", "busy_timeout": 1234}
+        assert custom.pool.size() == 3  # kwargs 가 기본 풀 설정보다 우선함
+        assert engine.pool.size() == models.DB_POOL_SIZE
+    finally:
+        custom.dispose()
+
+
+def test_engine_options_by_url():
+    assert engine_options("sqlite://") == {}
+    assert engine_options("sqlite:///:memory:") == {}
+    options = engine_options("postgresql://user@localhost/refujobs")
+    assert options["pool_size"] == models.DB_POOL_SIZE and options["pool_pre_ping"] == models.DB_POOL_PRE_PING
+    memory = create_db_engine("sqlite://")
+    try:
+        assert read_pragmas(memory, "journal_mode") == {"journal_mode": "memory"}  # 메모리 DB 는 WAL 을 쓸 수 없음
+    finally:
+        memory.dispose()
+
+
+def test_warm_up_pool_opens_connections():
+    url = f"sqlite:///{os.path.join(TEST_DIR, 'warm-up.db')}"
+    target = create_db_engine(url)
+    try:
+        models.warm_up_pool(target, 3)
+        assert target.pool.checkedin() == 3 and target.pool.checkedout() == 0
+    finally:
+        target.dispose()
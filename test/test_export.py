@@ -0,0 +1,38 @@
+# 게시글/이력서 전체 내보내기(NDJSON, CSV) 테스트
+import csv
+import io
+import json
+
+import export
+from conftest import SAMPLE_POST
+from models import Post, Resume
+
+
+def test_posts_ndjson(client, db, monkeypatch):
+    monkeypatch.setattr(export, "EXPORT_BATCH_SIZE", 2)  # 여러 묶음으로 나누어 내보내도 행이 빠지거나 겹치지 않음
+    client.post("/posts/", json=dict(SAMPLE_POST, title='따옴표 "제목", 쉼표'))
+    response = client.get("/posts/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert response.headers["content-disposition"] == 'attachment; filename="posts.ndjson"'
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [post_id for (post_id,) in db.query(Post.id).order_by(Post.id)]
+    assert list(rows[0]) == [column.key for column in Post.__table__.columns]
+    assert rows[-1]["title"] == '따옴표 "제목", 쉼표'
+
+
+def test_resumes_csv(client, db):
+    client.post("/resumes/", json={"title": "줄바꿈\n포함", "name": "내보내기", "gender": "여", "email": "export@example.com",
+                                   "phonenumber": "010-0000-0000", "education": "대졸", "location": "서울", "introduce": "소개"})
+    response = client.get("/resumes/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.content.startswith("﻿".encode())  # Excel 용 BOM
+    rows = list(csv.reader(io.StringIO(response.content.decode().lstrip("﻿"))))
+    assert rows[0] == [column.key for column in Resume.__table__.columns]
+    assert [int(row[0]) for row in rows[1:]] == [resume_id for (resume_id,) in db.query(Resume.id).order_by(Resume.id)]
+    assert rows[-1][rows[0].index("title")] == "줄바꿈\n포함"
+
+
+def test_unknown_format_rejected(client):
+    assert client.get("/posts/export", params={"format": "xml"}).status_code == 422
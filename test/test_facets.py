@@ -0,0 +1,60 @@
+# 게시글 필터(facet) 집계 테스트
+from collections import Counter
+
+import pytest
+
+import facets
+from conftest import SAMPLE_POST
+from models import Post
+
+
+def read_counts(client) -> dict[tuple[str, str], int]:
+    response = client.get("/posts/facets")
+    assert response.status_code == 200
+    return {(facet, item["value"]): item["count"] for facet, items in response.json().items() for item in items}
+
+
+def expected_counts(db) -> dict[tuple[str, str], int]:
+    # 게시글 테이블 전체를 직접 집계한 값 (증감으로 유지되는 facet_counts 와 같아야 함)
+    counts: Counter = Counter()
+    for post in db.query(Post).all():
+        for facet, value in facets.facet_values(post).items():
+            if value is not None:
+                counts[(facet, value)] += 1
+    return dict(counts)
+
+
+@pytest.mark.parametrize("salary, bucket", [
+    ("1800만원", "~2000만원"),
+    ("3000~4000만원", "~4000만원"),
+    ("1억", "5000만원 초과"),
+    ("회사내규", "기타"),
+])
+def test_salary_bucket(salary, bucket):
+    assert facets.salary_bucket(salary) == bucket
+
+
+def test_counts_follow_writes(client, db):
+    before = read_counts(client)
+    post_id = client.post("/posts/", json=dict(SAMPLE_POST, joblocation="facet-부산", salary="1800만원")).json()["id"]
+    client.post("/posts/bulk", json=[dict(SAMPLE_POST, joblocation="facet-부산"), dict(SAMPLE_POST, joblocation="facet-대구")])
+    after = read_counts(client)
+    assert after[("joblocation", "facet-부산")] == 2 and after[("joblocation", "facet-대구")] == 1
+    assert after[("salary", "~2000만원")] == before.get(("salary", "~2000만원"), 0) + 1
+
+    client.put(f"/posts/{post_id}", json=dict(SAMPLE_POST, joblocation="facet-대구"))
+    after = read_counts(client)
+    assert after[("joblocation", "facet-부산")] == 1 and after[("joblocation", "facet-대구")] == 2
+    assert after.get(("salary", "~2000만원"), 0) == before.get(("salary", "~2000만원"), 0)
+
+    client.delete(f"/posts/{post_id}")
+    assert read_counts(client)[("joblocation", "facet-대구")] == 1
+    assert read_counts(client) == expected_counts(db)
+
+
+def test_rebuild_matches_incremental_counts(client, db):
+    client.post("/posts/", json=dict(SAMPLE_POST, career="facet-경력"))
+    incremental = read_counts(client)
+    facets.rebuild_facets(db)
+    db.commit()
+    assert read_counts(client) == incremental == expected_counts(db)
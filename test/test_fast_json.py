@@ -0,0 +1,59 @@
+# 목록 응답 직렬화 경로(행 → JSON bytes) 테스트
+import pytest
+
+import fastjson
+import main
+from conftest import SAMPLE_POST
+
+# 이스케이프 처리가 다른 부분을 확인하기 위한 문자열 (따옴표, 역슬래시, 제어 문자, 줄 구분 문자, 이모지, HTML)
+TRICKY = 'a"b\\c\n\t\x01\x1f   한글 😀 </script> é'
+
+
+@pytest.fixture(scope="module")
+def tricky_rows(client):
+    # 다른 테스트에서 만든 행과 섞이지 않도록 각 목록의 첫 ID를 반환함 (해당 ID 직전을 가리키는 커서로 조회함)
+    posts = client.post("/posts/bulk", json=[
+        dict(SAMPLE_POST, title=f"{TRICKY} {index}", company_name=TRICKY, hashtags="#" + TRICKY) for index in range(15)
+    ])
+    resume = {"title": TRICKY, "name": "홍길동", "gender": "남", "email": "hong@example.com",
+              "phonenumber": "010-0000-0000", "education": "대졸", "location": "서울", "introduce": TRICKY * 20}
+    resumes = client.post("/resumes/bulk", json=[resume] * 15)
+    return {"/posts/": posts.json()["results"][0]["id"], "/resumes/": resumes.json()["results"][0]["id"]}
+
+
+@pytest.mark.parametrize("path", ["/posts/", "/resumes/"])
+def test_fast_list_matches_response_model_bytes(client, tricky_rows, monkeypatch, path):
+    cursor = main.encode_cursor(tricky_rows[path] - 1)
+    for _ in range(3):  # 15개를 7개씩 (마지막 페이지는 다음 커서 없음)
+        params = {"limit": 7, "cursor": cursor}
+        monkeypatch.setattr(main, "FAST_LIST_RESPONSES", True)
+        fast = client.get(path, params=params)
+        monkeypatch.setattr(main, "FAST_LIST_RESPONSES", False)
+        slow = client.get(path, params=params)
+        assert fast.status_code == slow.status_code == 200
+        assert fast.content == slow.content
+        assert fast.headers["content-type"] == slow.headers["content-type"]
+        for header in ("ETag", "X-Next-Cursor"):
+            assert fast.headers.get(header) == slow.headers.get(header)
+        assert fast.json() and TRICKY in fast.json()[0]["title"]
+        cursor = fast.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+
+def test_stdlib_fallback_matches_orjson(monkeypatch):
+    if fastjson.orjson is None:
+        pytest.skip("orjson is not installed")
+    names = ["id", "title", "author"]
+    rows = [(1, TRICKY, {"id": 3, "name": "작성자"}), (2**40, "", None)]
+    expected = fastjson.rows(names, rows)
+    monkeypatch.setattr(fastjson, "orjson", None)
+    assert fastjson.rows(names, rows) == expected
+
+
+def test_openapi_schema_unchanged(client):
+    paths = client.get("/openapi.json").json()["paths"]
+    for path, model in (("/posts/", "PostResponse2"), ("/resumes/", "ResumeResponse")):
+        schema = paths[path]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert schema["type"] == "array"
+        assert schema["items"] == {"$ref": f"#/components/schemas/{model}"}
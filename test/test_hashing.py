@@ -0,0 +1,69 @@
+# 비밀번호 해시 전용 프로세스 풀 테스트
+# (conftest 는 HASH_POOL_WORKERS=0 으로 스레드에서 직접 계산하므로, 여기서는 실제 작업 프로세스를 띄우는 풀을 따로 만듦)
+import time
+
+import pytest
+
+import hashing
+from test_metrics import metric_value
+from test_ratelimit import PASSWORD, user_payload
+
+
+@pytest.fixture(scope="module")
+def process_pool():
+    pool = hashing.HashPool(workers=1, max_pending=1, timeout=30)
+    try:
+        yield pool
+    finally:
+        pool.shutdown()
+
+
+def test_hash_and_verify_in_worker_process(process_pool):
+    hashed = process_pool.run(hashing._hash, PASSWORD)
+    assert hashed.startswith("$2") and hashed != PASSWORD
+    assert process_pool.run(hashing._verify, PASSWORD, hashed)
+    assert not process_pool.run(hashing._verify, "wrong", hashed)
+    stats = process_pool.stats()
+    assert stats["pending"] == 0 and stats["completed"] >= 3 and stats["busy_seconds"] > 0
+
+
+def test_saturated_pool_rejects_immediately(process_pool):
+    busy = process_pool.submit(time.sleep, 1)
+    rejected = process_pool.stats()["rejected"]
+    started = time.perf_counter()
+    with pytest.raises(hashing.HashPoolSaturated):
+        process_pool.run(hashing._hash, PASSWORD)
+    assert time.perf_counter() - started < 0.5  # 대기열이 가득 차면 기다리지 않고 거절함
+    assert process_pool.stats()["rejected"] == rejected + 1
+    busy.result()
+    assert process_pool.stats()["pending"] == 0
+
+
+def test_slow_job_times_out(process_pool, monkeypatch):
+    monkeypatch.setattr(process_pool, "timeout", 0.1)
+    with pytest.raises(hashing.HashPoolSaturated):
+        process_pool.run(time.sleep, 1)
+    assert process_pool.stats()["timed_out"] >= 1
+    deadline = time.monotonic() + 5
+    while process_pool.stats()["pending"] and time.monotonic() < deadline:
+        time.sleep(0.05)  # 제한 시간이 지난 작업도 끝날 때까지 자리를 차지함
+    assert process_pool.stats()["pending"] == 0
+
+
+def test_register_returns_503_when_pool_is_busy(client, process_pool, monkeypatch):
+    monkeypatch.setattr(hashing, "pool", process_pool)
+    busy = process_pool.submit(time.sleep, 1)
+    rejected = metric_value(client.get("/metrics").text, "app_hash_pool_jobs_total", outcome="rejected")
+    response = client.post("/register", json=user_payload("busy-pool@example.com"))
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    text = client.get("/metrics").text  # 거절된 요청 수와 풀 사용률이 /metrics 에 나타남
+    assert metric_value(text, "app_hash_pool_jobs_total", outcome="rejected") == rejected + 1
+    assert metric_value(text, "app_hash_pool_utilisation") == 1
+    busy.result()
+
+    # 풀에 자리가 나면 같은 요청이 성공하고, 해시는 작업 프로세스에서 계산됨
+    completed = process_pool.stats()["completed"]
+    assert client.post("/register", json=user_payload("busy-pool@example.com")).status_code == 200
+    assert client.post("/login", json={"email": "busy-pool@example.com", "password": PASSWORD}).status_code == 200
+    assert process_pool.stats()["completed"] == completed + 2
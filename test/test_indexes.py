@@ -0,0 +1,25 @@
+# 조회 형태별 인덱스 사용 테스트
+from sqlalchemy import inspect
+
+import main
+from migrations import LEGACY_INDEXES
+from models import Post, engine
+
+
+def test_legacy_single_column_indexes_removed(client):
+    inspector = inspect(engine)
+    existing = {index["name"] for table in ("users", "posts", "resumes") for index in inspector.get_indexes(table)}
+    assert not existing & {name for name, _, _ in LEGACY_INDEXES}
+    assert {"ix_posts_author_id", "ix_posts_list"} <= existing
+
+
+def test_post_list_uses_covering_index(db, query_plan):
+    query = main.projection_query(db, Post, main.POST_LIST_FIELDS).order_by(Post.id)
+    for page in (query.limit(11), query.filter(Post.id > 10).limit(11)):
+        plan = query_plan(page)
+        assert any("COVERING INDEX ix_posts_list" in step for step in plan), plan
+
+
+def test_posts_by_author_uses_index(db, query_plan):
+    plan = query_plan(db.query(Post.id).filter(Post.author_id == 1))
+    assert any("ix_posts_author_id" in step for step in plan), plan
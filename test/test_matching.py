@@ -0,0 +1,121 @@
+# 이력서-게시글 매칭(GET /resumes/{resume_id}/matches)과 매칭 인덱스 증분 갱신 테스트
+import subprocess
+import sys
+
+import pytest
+
+import matching
+from conftest import ROOT, SAMPLE_POST
+from models import Post, SessionLocal
+
+pytestmark = pytest.mark.skipif(not matching.is_available(), reason="numpy is not installed")
+
+RESUME = {
+    "title": "데이터 엔지니어 지원",
+    "name": "홍길동",
+    "gender": "남",
+    "email": "match@example.com",
+    "phonenumber": "010-0000-0000",
+    "education": "석사",
+    "location": "부산",
+    "introduce": "Spark 와 Kafka 로 데이터 파이프라인을 운영했습니다. 데이터엔지니어링 경력 3년",
+}
+
+
+def make_post(**fields) -> dict:
+    return dict(SAMPLE_POST, **fields)
+
+
+@pytest.fixture(scope="module")
+def matched(client):
+    # 이력서와 본문/학력/지역이 모두 맞는 게시글, 본문만 맞는 게시글, 관계없는 게시글
+    best = client.post("/posts/", json=make_post(
+        title="데이터 엔지니어", content="Spark, Kafka 기반 데이터 파이프라인 개발", hashtags="#데이터엔지니어링 #spark",
+        Education="석사", joblocation="부산",
+    )).json()["id"]
+    text_only = client.post("/posts/", json=make_post(
+        title="데이터 플랫폼", content="Kafka 데이터 파이프라인 운영", hashtags="#kafka", Education="대졸", joblocation="서울",
+    )).json()["id"]
+    unrelated = client.post("/posts/", json=make_post(
+        title="디자이너", content="UI 디자인", hashtags="#figma", Education="고졸", joblocation="대전",
+    )).json()["id"]
+    resume_id = client.post("/resumes/", json=RESUME).json()["id"]
+    return resume_id, best, text_only, unrelated
+
+
+def match_ids(client, resume_id, **params) -> list[int]:
+    response = client.get(f"/resumes/{resume_id}/matches", params=params)
+    assert response.status_code == 200
+    return [post["id"] for post in response.json()]
+
+
+def test_matches_ranked_by_score(client, matched):
+    resume_id, best, text_only, unrelated = matched
+    posts = client.get(f"/resumes/{resume_id}/matches", params={"k": 50}).json()
+    ids = [post["id"] for post in posts]
+    assert ids.index(best) < ids.index(text_only)
+    assert unrelated not in ids
+    assert [post["score"] for post in posts] == sorted((post["score"] for post in posts), reverse=True)
+    assert set(posts[0]) == {"id", "company_name", "title", "hashtags", "author_id", "score"}
+    assert len(match_ids(client, resume_id, k=1)) == 1
+
+
+def test_matches_follow_post_changes(client, matched):
+    resume_id, best, text_only, unrelated = matched
+    match_ids(client, resume_id)  # 인덱스를 만들어 둔 뒤의 변경이 증분으로 반영되는지 확인함
+
+    client.put(f"/posts/{unrelated}", json=make_post(
+        title="데이터 엔지니어", content="Spark Kafka 데이터 파이프라인 운영 데이터엔지니어링", Education="석사", joblocation="부산",
+    ))
+    assert unrelated in match_ids(client, resume_id, k=50)
+
+    client.delete(f"/posts/{unrelated}")
+    assert unrelated not in match_ids(client, resume_id, k=50)
+
+    created = client.post("/posts/bulk", json=[make_post(content="Kafka Spark 파이프라인", joblocation="부산")]).json()
+    assert created["results"][0]["id"] in match_ids(client, resume_id, k=50)
+
+
+def test_rolled_back_changes_are_not_indexed(client, matched):
+    resume_id, *_ = matched
+    match_ids(client, resume_id)
+    with SessionLocal() as db:
+        db_post = Post(**make_post(content="Spark Kafka 파이프라인"))
+        db.add(db_post)
+        db.flush()
+        post_id = db_post.id
+        matching.track_post(db, db_post)
+        db.rollback()
+    assert post_id not in matching.index.rows
+
+
+def test_incremental_index_matches_rebuild():
+    posts = [(1, "Kafka 스트리밍", "#kafka", "대졸", "서울"), (2, "React 프론트엔드", "#react", "대졸", "부산"),
+             (3, "Kafka Spark 배치", "#spark", "석사", "부산")]
+    incremental = matching.MatchIndex(capacity=1)
+    incremental.build([])
+    incremental.apply({post_id: values for post_id, *values in posts})
+    incremental.apply({2: None, 3: ("Kafka 스트리밍 배치", "#spark", "석사", "부산")})
+    rebuilt = matching.MatchIndex()
+    rebuilt.build([posts[0], (3, "Kafka 스트리밍 배치", "#spark", "석사", "부산")])
+
+    query = matching.resume_query("Kafka 배치 경험", "석사", "부산")
+    expected = rebuilt.top_k(query, 10)
+    actual = incremental.top_k(query, 10)
+    assert [post_id for post_id, _ in actual] == [post_id for post_id, _ in expected] == [3, 1]
+    assert [score for _, score in actual] == pytest.approx([score for _, score in expected])
+    assert (incremental.df == rebuilt.df).all()
+    assert len(incremental) == 2
+
+
+def test_matches_errors(client):
+    assert client.get("/resumes/999999/matches").status_code == 404
+    assert client.get("/resumes/1/matches", params={"k": 0}).status_code == 422
+    assert client.get("/resumes/1/matches", params={"k": matching.MAX_K + 1}).status_code == 422
+
+
+def test_app_import_does_not_load_numpy():
+    # numpy 는 매칭 인덱스를 처음 만들 때 임포트되므로, 앱을 임포트하는 것만으로는 읽지 않음
+    code = "import sys, main, main_async; print(','.join(m for m in ('numpy', 'passlib', 'jose') if m in sys.modules))"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ""
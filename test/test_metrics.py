@@ -0,0 +1,110 @@
+# 요청별 계측(/metrics, Server-Timing) 테스트
+import re
+
+import cache
+import hashing
+import metrics
+from conftest import SAMPLE_POST
+
+
+def metric_value(text: str, name: str, default: float | None = None, **labels) -> float:
+    label_text = ",".join(f'{key}="{value}"' for key, value in labels.items())
+    series = f"{name}{{{label_text}}}" if labels else name
+    match = re.search(rf"^{re.escape(series)} (\S+)$", text, re.MULTILINE)
+    if match is None and default is not None:
+        return default
+    assert match, f"{series} not found"
+    return float(match.group(1))
+
+
+def test_metrics_records_route_latency_and_queries(client):
+    post_id = client.post("/posts/", json=SAMPLE_POST).json()["id"]
+    before = client.get("/metrics").text
+    route = dict(method="GET", route="/posts/{post_id}", status="200")
+    count = metric_value(before, "http_request_duration_seconds_count", default=0, **route)
+
+    client.get(f"/posts/{post_id}", headers={"Cache-Control": "no-cache"})
+    client.get("/posts/999999")
+
+    text = client.get("/metrics").text
+    assert text.startswith("# HELP ")
+    assert metric_value(text, "http_request_duration_seconds_count", **route) >= count + 1
+    assert metric_value(text, "http_request_duration_seconds_bucket", **route, le="+Inf") >= count + 1
+    assert metric_value(text, "http_request_duration_seconds_count", method="GET", route="/posts/{post_id}", status="404") >= 1
+    assert metric_value(text, "db_queries_total", method="POST", route="/posts/", status="200") >= 1
+
+
+def test_server_timing_header(client, monkeypatch):
+    assert "server-timing" not in client.get("/posts/").headers
+
+    monkeypatch.setattr(metrics, "SERVER_TIMING", True)
+    header = client.get("/posts/", params={"limit": 1, "fields": "id"}).headers["server-timing"]
+    assert re.search(r'db;dur=[\d.]+;desc="\d+ queries"', header)
+    assert "total;dur=" in header
+
+
+def test_bcrypt_and_jwt_phases(client, monkeypatch):
+    monkeypatch.setattr(metrics, "SERVER_TIMING", True)
+    user = {
+        "email": "metrics@example.com",
+        "password": "secret",
+        "name": "계측",
+        "gender": "남",
+        "country": "대한민국",
+        "birthdate": "1990-01-01",
+    }
+    assert "bcrypt;dur=" in client.post("/register", json=user).headers["server-timing"]
+    response = client.post("/login", json={"email": user["email"], "password": user["password"]})
+    assert "bcrypt;dur=" in response.headers["server-timing"]
+    assert "jwt;dur=" in response.headers["server-timing"]
+
+    text = client.get("/metrics").text
+    assert metric_value(text, "app_phase_duration_seconds_count", phase="bcrypt") >= 2
+    assert metric_value(text, "app_phase_duration_seconds_count", phase="jwt") >= 1
+
+
+def test_histogram_render_is_cumulative():
+    histogram = metrics.Histogram("sample_seconds", "sample", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 5.0):
+        histogram.observe(value, "/a")
+    text = "\n".join(histogram.render())
+    assert 'sample_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'sample_seconds_bucket{route="/a",le="1"} 3' in text
+    assert 'sample_seconds_bucket{route="/a",le="+Inf"} 4' in text
+    assert 'sample_seconds_count{route="/a"} 4' in text
+
+
+def test_response_cache_metrics(client, monkeypatch):
+    post_id = client.post("/posts/", json=SAMPLE_POST).json()["id"]
+    before = client.get("/metrics").text
+    client.get(f"/posts/{post_id}")  # 생성 직후에는 캐시에 없음
+    client.get(f"/posts/{post_id}")
+
+    text = client.get("/metrics").text
+    assert "# TYPE app_response_cache_requests_total counter" in text
+    for result in ("hit", "miss"):
+        assert metric_value(text, "app_response_cache_requests_total", result=result) == (
+            metric_value(before, "app_response_cache_requests_total", result=result) + 1
+        )
+
+    monkeypatch.setattr(cache.response_cache, "backend", cache.LRUCache(max_entries=1, max_bytes=1 << 20))
+    evictions = metric_value(client.get("/metrics").text, "app_response_cache_evictions_total")
+    assert evictions == 0
+    client.get(f"/posts/{post_id}")
+    client.get(f"/posts/{client.post('/posts/', json=SAMPLE_POST).json()['id']}")  # 항목 한도가 1이므로 앞의 게시글이 밀려남
+    assert metric_value(client.get("/metrics").text, "app_response_cache_evictions_total") == 1
+
+
+def test_hash_pool_metrics(client):
+    text = client.get("/metrics").text
+    assert "# TYPE app_hash_pool_pending gauge" in text
+    assert metric_value(text, "app_hash_pool_pending") == hashing.stats()["pending"]
+    assert metric_value(text, "app_hash_pool_jobs_total", outcome="rejected") == hashing.stats()["rejected"]
+    assert 0 <= metric_value(text, "app_hash_pool_utilisation") <= 1
+
+
+def test_health_runs_no_sql(client):
+    response = client.get("/health")
+    assert response.status_code == 200 and response.json() == {"status": "ok"}
+    text = client.get("/metrics").text  # 부하 테스트의 기준 요청이므로 DB 를 사용하지 않아야 함
+    assert metric_value(text, "http_request_db_queries_sum", method="GET", route="/health", status="200") == 0
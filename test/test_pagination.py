@@ -0,0 +1,77 @@
+# 목록 조회 키셋(커서) 페이지네이션 테스트
+import pytest
+
+import main
+from conftest import SAMPLE_POST
+from models import Post, Resume
+
+RESUME = {"title": "페이지", "name": "지원자", "gender": "여", "email": "page@example.com",
+          "phonenumber": "010-0000-0000", "education": "대졸", "location": "서울", "introduce": "소개"}
+
+
+@pytest.fixture(scope="module")
+def seeded(client):
+    for i in range(7):
+        client.post("/posts/", json=dict(SAMPLE_POST, title=f"페이지 {i}"))
+        client.post("/resumes/", json=dict(RESUME, title=f"페이지 {i}"))
+
+
+def walk_cursor(client, path: str, limit: int) -> list[int]:
+    ids, cursor = [], None
+    while True:
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        response = client.get(path, params=params)
+        assert response.status_code == 200
+        page = [item["id"] for item in response.json()]
+        assert len(page) <= limit
+        ids += page
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return ids
+        assert len(page) == limit  # 다음 페이지가 있으면 현재 페이지는 가득 차 있음
+
+
+def walk_skip(client, path: str, limit: int) -> list[int]:
+    ids, skip = [], 0
+    while True:
+        page = [item["id"] for item in client.get(path, params={"skip": skip, "limit": limit}).json()]
+        ids += page
+        if len(page) < limit:
+            return ids
+        skip += limit
+
+
+@pytest.mark.parametrize("path, model", [("/posts/", Post), ("/resumes/", Resume)])
+@pytest.mark.parametrize("limit", [1, 3, 100])
+def test_every_page_walked_once(client, db, seeded, path, model, limit):
+    expected = [item_id for (item_id,) in db.query(model.id).order_by(model.id)]
+    by_cursor = walk_cursor(client, path, limit)
+    assert by_cursor == expected  # 중복/누락 없이 ID 순서대로 모든 행을 읽음
+    assert walk_skip(client, path, limit) == expected
+
+
+@pytest.mark.parametrize("path", ["/posts/", "/resumes/"])
+def test_last_page_has_no_cursor(client, db, seeded, path):
+    count = len(client.get(path, params={"limit": 100}).json())
+    response = client.get(path, params={"limit": count})
+    assert "X-Next-Cursor" not in response.headers
+    assert "X-Next-Cursor" in client.get(path, params={"limit": count - 1}).headers
+
+
+@pytest.mark.parametrize("path", ["/posts/", "/resumes/"])
+@pytest.mark.parametrize("params", [{"limit": 0}, {"limit": -1}, {"skip": -1}])
+def test_invalid_page_parameters(client, path, params):
+    assert client.get(path, params=params).status_code == 422
+
+
+@pytest.mark.parametrize("path", ["/posts/", "/resumes/"])
+def test_large_limit_is_clamped(client, seeded, path, monkeypatch):
+    # MAX_PAGE_SIZE 보다 큰 limit 은 거절하지 않고 한 페이지 최대 크기만큼만 반환함
+    monkeypatch.setattr(main, "MAX_PAGE_SIZE", 2)
+    response = client.get(path, params={"limit": 1000})
+    assert response.status_code == 200 and len(response.json()) == 2
+    assert "X-Next-Cursor" in response.headers
+
+
+def test_invalid_cursor(client):
+    assert client.get("/posts/", params={"cursor": "not-a-cursor"}).status_code == 400
@@ -0,0 +1,86 @@
+# 게시글 연봉/마감일 범위 검색 테스트
+from datetime import date
+
+import pytest
+
+import main
+import postfields
+from conftest import SAMPLE_POST
+from models import Post
+
+
+@pytest.mark.parametrize("salary, expected", [
+    ("3000~4000만원", (3000, 4000)),
+    ("4,500만원", (4500, 4500)),
+    ("1억", (10000, 10000)),
+    ("30000000~40000000원", (3000, 4000)),
+    ("2.5억", (25000, 25000)),
+    ("4천만원", (4000, 4000)),
+    ("1억 2천만원", (12000, 12000)),
+    ("2천500만원", (2500, 2500)),
+    ("2~2.5억", (20000, 25000)),
+    ("4000만원~1억", (4000, 10000)),
+    ("2.5", (None, None)),
+    ("월 300만원, 성과급 200%", (None, None)),
+    ("회사내규에 따름", (None, None)),
+    (None, (None, None)),
+])
+def test_parse_salary(salary, expected):
+    assert postfields.parse_salary(salary) == expected
+
+
+@pytest.mark.parametrize("deadline, expected", [
+    ("2024-1-1", date(2024, 1, 1)),
+    ("2024.12.31", date(2024, 12, 31)),
+    ("2024년 3월 5일", date(2024, 3, 5)),
+    ("20240630", date(2024, 6, 30)),
+    ("2024-02-30", None),
+    ("2024-12", date(2024, 12, 31)),  # 일이 없으면 그 달의 마지막 날
+    ("2024년 12월", date(2024, 12, 31)),
+    ("2024.12 마감", date(2024, 12, 31)),
+    ("2024년 2월까지", date(2024, 2, 29)),
+    ("2024-13", None),
+    ("202412", None),
+    ("2024 12 31", None),
+    ("상시채용", None),
+])
+def test_parse_deadline(deadline, expected):
+    assert postfields.parse_deadline(deadline) == expected
+
+
+def test_range_filters(client):
+    low = client.post("/posts/", json=dict(SAMPLE_POST, salary="2000~2500만원", deadline="2030-01-05")).json()["id"]
+    high = client.post("/posts/", json=dict(SAMPLE_POST, salary="5000~6000만원", deadline="2030-01-20")).json()["id"]
+    unknown = client.post("/posts/", json=dict(SAMPLE_POST, salary="회사내규", deadline="상시")).json()["id"]
+
+    def ids(**params):
+        return {post["id"] for post in client.get("/posts/", params={"limit": 100, **params}).json()}
+
+    assert high in ids(salary_min=4000) and low not in ids(salary_min=4000)
+    assert low in ids(salary_max=3000) and high not in ids(salary_max=3000)
+    assert ids(deadline_from="2030-01-01", deadline_to="2030-01-10") >= {low}
+    assert high not in ids(deadline_from="2030-01-01", deadline_to="2030-01-10")
+    assert unknown not in ids(salary_min=0) | ids(deadline_from="2000-01-01")
+
+    # 수정하면 연봉/마감일 컬럼도 다시 계산됨
+    client.put(f"/posts/{low}", json=dict(SAMPLE_POST, salary="7000만원", deadline="2030-01-20"))
+    assert low in ids(salary_min=7000)
+
+
+def test_range_filter_pagination(client):
+    created = [client.post("/posts/", json=dict(SAMPLE_POST, salary="9000만원")).json()["id"] for _ in range(5)]
+    first = client.get("/posts/", params={"salary_min": 9000, "limit": 3})
+    second = client.get("/posts/", params={"salary_min": 9000, "limit": 3, "cursor": first.headers["X-Next-Cursor"]})
+    assert [post["id"] for post in first.json() + second.json()][-5:] == created
+
+
+@pytest.mark.parametrize("filters, index", [
+    ({"salary_min": 4000}, "ix_posts_salary_max_id"),
+    ({"salary_max": 3000}, "ix_posts_salary_min_id"),
+    ({"deadline_from": date(2030, 1, 1), "deadline_to": date(2030, 1, 8)}, "ix_posts_deadline_date_id"),
+])
+def test_range_filters_use_index(db, query_plan, filters, index):
+    query, id_column = postfields.filter_posts(main.projection_query(db, Post, main.POST_LIST_FIELDS), **filters)
+    plan = query_plan(query.order_by(id_column).filter(id_column > 10).limit(11))
+    assert any(index in step for step in plan), plan
+    assert not any(step.startswith("SCAN posts") for step in plan), plan
@@ -0,0 +1,99 @@
+# 작성자 포함 조회(?include=author)와 라우트별 SQL 실행 수 상한 테스트
+# 요청마다의 SQL 수는 conftest.py 의 query_budget fixture 가 QUERY_BUDGETS 와 비교하여 검사함.
+import pytest
+from sqlalchemy import update
+
+from conftest import SAMPLE_POST
+from models import Post, SessionLocal, User
+
+AUTHORS = 10
+
+
+@pytest.fixture(scope="module")
+def authored_posts(client):
+    # 작성자 AUTHORS 명이 번갈아 작성한 게시글 50개 (작성자를 지연 로딩하면 게시글마다 SELECT 가 한 번씩 더 실행됨)
+    with SessionLocal() as db:
+        users = [
+            User(email=f"author{index}@example.com", hashed_password="x", name=f"작성자{index}", gender="남",
+                 country="대한민국")
+            for index in range(AUTHORS)
+        ]
+        db.add_all(users)
+        db.commit()
+        author_ids = [user.id for user in users]
+    items = [dict(SAMPLE_POST, title=f"작성자 테스트 {index}") for index in range(50)]
+    post_ids = [result["id"] for result in client.post("/posts/bulk", json=items).json()["results"]]
+    with SessionLocal() as db:
+        db.execute(update(Post), [
+            {"id": post_id, "author_id": author_ids[index % AUTHORS]} for index, post_id in enumerate(post_ids)
+        ])
+        db.commit()
+    client.post("/posts/", json=SAMPLE_POST)  # 테이블 버전을 올려 이전 목록 ETag/캐시를 무효화함
+    return post_ids, author_ids
+
+
+def test_list_include_author(client, authored_posts):
+    post_ids, author_ids = authored_posts
+    cursor = None
+    seen = {}
+    while True:
+        params = {"limit": 50, "include": "author", **({"cursor": cursor} if cursor else {})}
+        response = client.get("/posts/", params=params)
+        assert response.status_code == 200
+        seen.update({post["id"]: post for post in response.json()})
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+    for index, post_id in enumerate(post_ids):
+        assert seen[post_id]["author"] == {"id": author_ids[index % AUTHORS], "name": f"작성자{index % AUTHORS}"}
+        assert seen[post_id]["author_id"] == author_ids[index % AUTHORS]
+
+
+def test_list_include_author_with_fields(client, authored_posts):
+    post_ids, author_ids = authored_posts
+    posts = client.get("/posts/", params={"limit": 100, "include": "author", "fields": "title"}).json()
+    post = next(post for post in posts if post["id"] == post_ids[3])
+    assert post == {"id": post_ids[3], "title": "작성자 테스트 3", "author": {"id": author_ids[3], "name": "작성자3"}}
+
+
+def test_detail_include_author(client, authored_posts):
+    post_ids, author_ids = authored_posts
+    response = client.get(f"/posts/{post_ids[1]}", params={"include": "author"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["author"] == {"id": author_ids[1], "name": "작성자1"}
+    assert body["salary"] == SAMPLE_POST["salary"]
+    assert "author" not in client.get(f"/posts/{post_ids[1]}").json()
+
+    etag = response.headers["ETag"]
+    assert etag != client.get(f"/posts/{post_ids[1]}").headers["ETag"]
+    assert client.get(f"/posts/{post_ids[1]}", params={"include": "author"}, headers={"If-None-Match": etag}).status_code == 304
+
+    partial = client.get(f"/posts/{post_ids[1]}", params={"include": "author", "fields": "title"}).json()
+    assert partial == {"id": post_ids[1], "title": "작성자 테스트 1", "author": {"id": author_ids[1], "name": "작성자1"}}
+
+
+def test_include_unknown_is_rejected(client):
+    assert client.get("/posts/", params={"include": "comments"}).status_code == 400
+    assert client.get("/posts/1", params={"include": "comments"}).status_code == 400
+
+
+def test_read_endpoints_within_budget(client, authored_posts):
+    # 페이지가 가득 찬 상태에서 조회 엔드포인트를 모두 호출함 (상한 검사는 query_budget fixture 가 함)
+    post_ids, _ = authored_posts
+    resume = {"title": "이력서", "name": "홍길동", "gender": "남", "email": "hong@example.com",
+              "phonenumber": "010-0000-0000", "education": "대졸", "location": "서울", "introduce": "소개"}
+    resume_id = client.post("/resumes/", json=resume).json()["id"]
+    for path, params in [
+        ("/posts/", {"limit": 50}),
+        ("/posts/", {"limit": 50, "include": "author", "salary_min": 1000}),
+        (f"/posts/{post_ids[0]}", {}),
+        (f"/posts/{post_ids[0]}", {"include": "author"}),
+        ("/posts/search", {"q": "작성자"}),
+        ("/posts/by-tags", {"any": "python"}),
+        ("/posts/facets", {}),
+        ("/tags/", {}),
+        ("/resumes/", {"limit": 50}),
+        (f"/resumes/{resume_id}", {}),
+    ]:
+        assert client.get(path, params=params).status_code == 200, path
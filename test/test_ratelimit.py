@@ -0,0 +1,76 @@
+# 인증 요청 속도 제한(토큰 버킷)과 거절 지표 테스트
+import hashing
+import metrics
+import ratelimit
+from test_metrics import metric_value
+
+PASSWORD = "secret"
+
+
+def user_payload(email: str) -> dict:
+    return {"email": email, "password": PASSWORD, "name": "제한", "gender": "남", "country": "대한민국",
+            "birthdate": "1990-01-01"}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_token_bucket_refills_over_time():
+    clock = FakeClock()
+    limiter = ratelimit.TokenBucketLimiter("test", per_minute=60, burst=3, clock=clock)
+    assert [limiter.acquire("a") for _ in range(3)] == [0, 0, 0]
+    assert limiter.acquire("a") == 1.0  # 초당 1개씩 채워짐
+    assert limiter.acquire("b") == 0  # 키마다 따로 셈
+    clock.now += 2.5
+    assert limiter.acquire("a") == 0 and limiter.acquire("a") == 0
+    assert 0 < limiter.acquire("a") <= 0.5
+
+
+def test_token_bucket_footprint_is_bounded():
+    limiter = ratelimit.TokenBucketLimiter("test", per_minute=60, burst=1, max_keys=64, shards=4)
+    for index in range(10000):
+        limiter.acquire(f"client-{index}")
+    assert len(limiter) <= 64
+    # 지워진 키는 가득 찬 버킷으로 다시 시작함
+    assert limiter.acquire("client-0") == 0
+
+
+def test_login_throttled_before_db_and_hashing(client, monkeypatch):
+    email = "throttle@example.com"
+    assert client.post("/register", json=user_payload(email)).status_code == 200
+    monkeypatch.setattr(metrics, "SERVER_TIMING", True)
+    seen = []
+    monkeypatch.setattr(metrics, "request_hooks", [*metrics.request_hooks, lambda *labels: seen.append(labels)])
+    before = metrics.shed_requests.value("auth_email")
+
+    statuses = [client.post("/login", json={"email": email, "password": "wrong"}).status_code
+                for _ in range(ratelimit.AUTH_EMAIL_BURST - 1)]
+    assert statuses == [401] * (ratelimit.AUTH_EMAIL_BURST - 1)
+    response = client.post("/login", json={"email": email, "password": PASSWORD})
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert "bcrypt" not in response.headers["server-timing"]
+    method, route, status, stats = seen[-1]
+    assert (route, status, stats.queries) == ("/login", "429", 0)
+    assert metrics.shed_requests.value("auth_email") == before + 1
+    assert metric_value(client.get("/metrics").text, "app_shed_requests_total", reason="auth_email") >= 1
+
+
+def test_register_throttled_per_ip(client, monkeypatch):
+    monkeypatch.setattr(ratelimit, "auth_ip", ratelimit.TokenBucketLimiter("auth_ip", per_minute=1, burst=2))
+    statuses = [client.post("/register", json=user_payload(f"ip-{index}@example.com")).status_code for index in range(3)]
+    assert statuses == [200, 200, 429]
+    assert metrics.shed_requests.value("auth_ip") >= 1
+
+
+def test_hash_pool_ceiling_is_counted(client, monkeypatch):
+    monkeypatch.setattr(hashing.pool, "max_pending", 0)
+    before = metrics.shed_requests.value("hash_pool_saturated")
+    response = client.post("/register", json=user_payload("saturated@example.com"))
+    assert response.status_code == 503
+    assert metrics.shed_requests.value("hash_pool_saturated") == before + 1
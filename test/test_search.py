@@ -0,0 +1,63 @@
+# 게시글 전문 검색(FTS5, LIKE 대체 검색) 테스트
+import pytest
+
+import search
+from conftest import SAMPLE_POST
+
+
+@pytest.fixture(scope="module")
+def searchable(client):
+    def create(**fields):
+        return client.post("/posts/", json=dict(SAMPLE_POST, **fields)).json()["id"]
+
+    return {
+        "title": create(title="쿠버네티스 플랫폼 엔지니어", content="클러스터 운영", career="경력"),
+        "content": create(title="인프라 담당자", content="쿠버네티스 운영 경험", career="신입"),
+        "other": create(title="프론트엔드 개발자", content="React 경험", career="경력"),
+    }
+
+
+def search_ids(client, **params):
+    response = client.get("/posts/search", params=params)
+    assert response.status_code == 200
+    return [post["id"] for post in response.json()]
+
+
+def test_build_match_query():
+    assert search.build_match_query('개발 "AND" -x') == '"개발"* "AND"* "x"*'
+    assert search.build_match_query("!!") is None
+
+
+def test_fts_ranks_title_matches_first(client, searchable):
+    assert search_ids(client, q="쿠버네티스") == [searchable["title"], searchable["content"]]
+    assert search_ids(client, q="쿠버") == [searchable["title"], searchable["content"]]  # 접두어 검색
+    assert search_ids(client, q="쿠버네티스 운영 경험") == [searchable["content"]]  # 모든 단어를 포함해야 함
+    assert search_ids(client, q="쿠버네티스", career="신입") == [searchable["content"]]
+    assert search_ids(client, q="!!") == []
+    scores = [post["score"] for post in client.get("/posts/search", params={"q": "쿠버네티스"}).json()]
+    assert scores == sorted(scores, reverse=True) and scores[0] > 0
+
+
+def test_index_follows_updates_and_deletes(client, searchable):
+    post_id = client.post("/posts/", json=dict(SAMPLE_POST, title="일시적 오라클 DBA")).json()["id"]
+    assert search_ids(client, q="오라클") == [post_id]
+    client.put(f"/posts/{post_id}", json=dict(SAMPLE_POST, title="일시적 포스트그레스 DBA"))
+    assert search_ids(client, q="오라클") == []
+    assert search_ids(client, q="포스트그레스") == [post_id]
+    client.delete(f"/posts/{post_id}")
+    assert search_ids(client, q="포스트그레스") == []
+
+
+def test_like_fallback(client, searchable, monkeypatch):
+    # FTS5 를 지원하지 않는 데이터베이스에서는 LIKE 검색으로 최신순 결과를 반환함
+    monkeypatch.setattr(search, "is_supported", lambda bind: False)
+    results = client.get("/posts/search", params={"q": "쿠버네티스"}).json()
+    assert [post["id"] for post in results] == [searchable["content"], searchable["title"]]
+    assert all(post["score"] == 0.0 for post in results)
+    assert search_ids(client, q="쿠버네티스 운영", career="경력") == [searchable["title"]]
+
+
+def test_limit_validated(client, searchable):
+    assert search_ids(client, q="쿠버네티스", limit=1) == [searchable["title"]]
+    for limit in (0, -1, 101):
+        assert client.get("/posts/search", params={"q": "쿠버네티스", "limit": limit}).status_code == 422
@@ -0,0 +1,93 @@
+# 멀티 프로세스 실행 지원(워커 간 변경 반영, fork 후 연결 풀, preload) 테스트
+import os
+
+import pytest
+from sqlalchemy import func, insert, select
+
+import serving
+import writebatch
+from conftest import SAMPLE_POST
+from models import ChangeLog, Post, SessionLocal, engine
+from matching import track_post
+
+
+@pytest.fixture
+def worker_sync(monkeypatch):
+    monkeypatch.setattr(serving, "WORKER_SYNC_ENABLED", True)
+    listener = serving.ChangeListener()
+    with engine.connect() as conn:
+        listener.mark(conn)
+        yield listener, conn
+
+
+def commit_as_other_worker(monkeypatch, post_id: int, title: str):
+    # 다른 워커가 같은 데이터베이스에서 게시글을 수정한 것처럼 이 프로세스의 응답 캐시를 건드리지 않고 커밋함
+    with monkeypatch.context() as patch:
+        patch.setattr(serving, "origin", "other-worker")
+        with SessionLocal() as db:
+            db_post = db.get(Post, post_id)
+            db_post.title = title
+            track_post(db, db_post)
+            db.commit()
+
+
+def test_other_worker_changes_invalidate_local_cache(client, worker_sync, monkeypatch):
+    listener, conn = worker_sync
+    post_id = client.post("/posts/", json=dict(SAMPLE_POST, title="처음 제목")).json()["id"]
+    assert client.get(f"/posts/{post_id}").json()["title"] == "처음 제목"  # 응답 캐시에 올림
+    assert listener.poll(conn) == 0  # 이 프로세스가 기록한 변경은 건너뜀
+
+    commit_as_other_worker(monkeypatch, post_id, "다른 워커가 수정")
+    assert client.get(f"/posts/{post_id}").json()["title"] == "처음 제목"  # 아직 이 프로세스의 캐시는 모름
+    assert listener.poll(conn) == 1
+    assert client.get(f"/posts/{post_id}").json()["title"] == "다른 워커가 수정"
+
+    # 커밋이 없으면 PRAGMA data_version 만 확인하고 change_log 를 읽지 않음
+    last_seq = listener.last_seq
+    assert listener.poll(conn) == 0 and listener.last_seq == last_seq
+
+
+def test_change_log_disabled_by_default(client):
+    with SessionLocal() as db:
+        before = db.scalar(select(func.count()).select_from(ChangeLog))
+    client.post("/posts/", json=SAMPLE_POST)
+    with SessionLocal() as db:
+        assert db.scalar(select(func.count()).select_from(ChangeLog)) == before
+
+
+def test_prune_removes_old_rows(client, worker_sync):
+    listener, conn = worker_sync
+    conn.execute(insert(ChangeLog), [{"topic": "posts", "item_id": 1, "origin": "old", "created_at": 0.0}])
+    conn.commit()
+    listener.prune(conn)
+    assert conn.scalar(select(func.count()).select_from(ChangeLog).where(ChangeLog.origin == "old")) == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+def test_forked_child_opens_its_own_connections(client):
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SELECT 1")
+    assert engine.pool.checkedin() >= 1
+    pid = os.fork()
+    if pid == 0:
+        # 자식 프로세스: 부모의 연결과 쓰기 스레드를 물려받지 않고 새 연결로 조회함
+        code = 0 if engine.pool.checkedin() == 0 and writebatch.writer._thread is None else 1
+        try:
+            with engine.connect() as conn:
+                conn.exec_driver_sql("SELECT count(*) FROM posts").scalar()
+        except Exception:
+            code = 2
+        os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    with engine.connect() as conn:  # 부모의 풀은 그대로 사용할 수 있음
+        assert conn.exec_driver_sql("SELECT 1").scalar() == 1
+
+
+def test_preload_marks_change_log_position(client, monkeypatch):
+    monkeypatch.setattr(serving, "preloaded", False)
+    monkeypatch.setattr(serving, "listener", serving.ChangeListener())
+    serving.preload(engine)
+    assert serving.preloaded
+    with SessionLocal() as db:
+        assert serving.listener.last_seq == (db.scalar(select(func.max(ChangeLog.seq))) or 0)
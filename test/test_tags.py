@@ -0,0 +1,73 @@
+# 해시태그 정규화 및 태그 조합 검색 테스트
+from sqlalchemy import event
+
+import tags
+from conftest import SAMPLE_POST
+from models import PostTag, SessionLocal, Tag
+
+
+def test_parse_hashtags():
+    assert tags.parse_hashtags("#Python, #remote #python") == ["python", "remote"]
+    assert tags.parse_hashtags(None) == []
+
+
+def test_tag_created_concurrently_is_reused(client):
+    # 태그 조회와 생성 사이에 다른 세션이 같은 태그를 만들어 커밋해도 고유 제약 위반 없이 그 태그를 사용함
+    with SessionLocal() as db:
+        @event.listens_for(db, "do_orm_execute", once=True)
+        def create_elsewhere(state):
+            with SessionLocal() as other:
+                other.add(Tag(name="race-tag", post_count=0))
+                other.commit()
+
+        post_id = client.post("/posts/", json=dict(SAMPLE_POST, hashtags="#seed")).json()["id"]
+        tag_ids = tags._get_or_create_tags(db, ["race-tag", "race-new"])
+        db.commit()
+        assert db.query(Tag.name, Tag.id).filter(Tag.name.in_(["race-tag", "race-new"])).count() == 2
+        assert set(tag_ids) == {"race-tag", "race-new"}
+
+        tags.set_post_tags(db, post_id, "#race-tag #race-new")
+        db.commit()
+        linked = {tag_id for (tag_id,) in db.query(PostTag.tag_id).filter(PostTag.post_id == post_id)}
+        assert linked == set(tag_ids.values())
+
+
+
+def test_posts_by_tags(client, db):
+    both = client.post("/posts/", json=dict(SAMPLE_POST, hashtags="#tagq-a #tagq-b")).json()["id"]
+    only_a = client.post("/posts/", json=dict(SAMPLE_POST, hashtags="#tagq-a")).json()["id"]
+    only_c = client.post("/posts/", json=dict(SAMPLE_POST, hashtags="#TAGQ-C")).json()["id"]
+
+    def ids(**params):
+        response = client.get("/posts/by-tags", params=params)
+        assert response.status_code == 200
+        return [post["id"] for post in response.json()]
+
+    assert ids(all="tagq-a,tagq-b") == [both]
+    assert ids(all="tagq-a") == [only_a, both]  # 최신순
+    assert ids(any="tagq-b #tagq-c") == [only_c, both]
+    assert ids(all="tagq-a", any="tagq-b,tagq-c") == [both]
+    assert ids(all="tagq-a,nope") == []
+    assert ids(any="tagq-a,tagq-b,tagq-c", limit=2) == [only_c, only_a]
+
+    # 수정/삭제하면 태그 연결과 태그별 게시글 수도 함께 바뀜
+    client.put(f"/posts/{only_a}", json=dict(SAMPLE_POST, hashtags="#tagq-c"))
+    assert ids(all="tagq-a") == [both]
+    assert ids(any="tagq-c") == [only_c, only_a]
+    client.delete(f"/posts/{only_c}")
+    assert ids(any="tagq-c") == [only_a]
+    counts = dict(db.query(Tag.name, Tag.post_count).filter(Tag.name.like("tagq-%")))
+    assert counts["tagq-a"] == 1 and counts["tagq-c"] == 1
+
+
+def test_by_tags_limit_validated(client):
+    for limit in (0, -1, 101):
+        assert client.get("/posts/by-tags", params={"any": "python", "limit": limit}).status_code == 422
+
+
+def test_tag_frequencies_limit_validated(client):
+    client.post("/posts/", json=dict(SAMPLE_POST, hashtags="#freq-a #freq-b"))
+    frequencies = client.get("/tags/", params={"limit": 1})
+    assert frequencies.status_code == 200 and len(frequencies.json()) == 1
+    for limit in (0, -1, 101):
+        assert client.get("/tags/", params={"limit": limit}).status_code == 422
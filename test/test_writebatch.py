@@ -0,0 +1,84 @@
+# 작성/수정 묶음 커밋(group commit) 테스트
+import re
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+import main
+import metrics
+import writebatch
+from conftest import SAMPLE_POST
+from models import Post, SessionLocal, User
+
+
+def add_user(email: str):
+    def job(db):
+        db.add(User(email=email))
+        db.flush()
+        return email
+    return job
+
+
+def test_writer_groups_jobs_and_isolates_failures():
+    writer = writebatch.GroupCommitWriter(window_ms=500, max_items=3)
+    before = metrics.write_batch_size.count()
+    try:
+        futures = [
+            writer.submit(add_user(email))
+            for email in ("batch-a@example.com", "batch-b@example.com", "batch-a@example.com", "batch-c@example.com")
+        ]
+        # 각 작업은 자신의 결과를 받고, 실패한 작업만 되돌려짐
+        assert futures[0].result() == "batch-a@example.com"
+        assert futures[1].result() == "batch-b@example.com"
+        with pytest.raises(IntegrityError):
+            futures[2].result()
+        assert futures[3].result() == "batch-c@example.com"
+    finally:
+        writer.stop()
+    assert metrics.write_batch_size.count() == before + 2  # 3개 + 1개 두 번에 나누어 커밋함
+    with SessionLocal() as db:
+        emails = [email for (email,) in db.query(User.email).filter(User.email.like("batch-%"))]
+    assert sorted(emails) == ["batch-a@example.com", "batch-b@example.com", "batch-c@example.com"]
+
+
+def test_failed_job_does_not_leave_post_behind(client):
+    writer = writebatch.GroupCommitWriter(window_ms=500, max_items=2)
+    post = main.PostCreate(**dict(SAMPLE_POST, title="묶음 실패"))
+
+    def failing(db):
+        main.save_new_post(db, post)
+        raise ValueError("rejected")
+
+    try:
+        failed = writer.submit(failing)
+        created = writer.submit(lambda db: main.save_new_post(db, post).id)
+        with pytest.raises(ValueError):
+            failed.result()
+        post_id = created.result()
+    finally:
+        writer.stop()
+    with SessionLocal() as db:
+        assert db.query(Post).filter(Post.title == "묶음 실패").count() == 1
+    assert client.get(f"/posts/{post_id}").json()["title"] == "묶음 실패"
+
+
+def test_batched_endpoints(client, monkeypatch):
+    monkeypatch.setattr(writebatch, "WRITE_BATCH_ENABLED", True)
+    before = metrics.write_batch_size.count()
+
+    response = client.post("/posts/", json=dict(SAMPLE_POST, title="묶음 작성"))
+    assert response.status_code == 200
+    post_id = response.json()["id"]
+    assert client.get(f"/posts/{post_id}").json()["title"] == "묶음 작성"  # 응답 캐시에 올림
+
+    assert client.put(f"/posts/{post_id}", json=dict(SAMPLE_POST, title="묶음 수정")).json()["title"] == "묶음 수정"
+    assert client.get(f"/posts/{post_id}").json()["title"] == "묶음 수정"  # 커밋 후 캐시가 무효화됨
+    assert client.put("/posts/999999", json=SAMPLE_POST).status_code == 404
+
+    resume = {"title": "묶음", "name": "지원자", "gender": "여", "email": "batch@example.com",
+              "phonenumber": "010-0000-0000", "education": "대졸", "location": "서울", "introduce": "소개"}
+    resume_id = client.post("/resumes/", json=resume).json()["id"]
+    assert client.put(f"/resumes/{resume_id}", json=dict(resume, title="묶음 수정")).json()["title"] == "묶음 수정"
+
+    assert metrics.write_batch_size.count() == before + 5
+    assert re.search(r"^db_write_batch_size_count [1-9]\d*$", client.get("/metrics").text, re.MULTILINE)
@@ -0,0 +1,99 @@
+# 테이블 버전 카운터 및 ETag 모듈
+# posts / resumes / users 테이블에 쓰기가 있을 때마다 table_versions 의 버전을 같은 트랜잭션에서 증가시키고,
+# 응답 본문을 해시하지 않고 이 버전으로 ETag를 만들어 If-None-Match 요청에 304로 응답함.
+import hashlib
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from models import TableVersion
+
+POSTS = "posts"
+RESUMES = "resumes"
+USERS = "users"  # 작성자 정보를 함께 담은 게시글 응답(?include=author)의 ETag 에 사용됨
+
+
+def bump(db: Session, name: str):
+    """
+    테이블 버전을 1 증가시키는 함수. 쓰기와 같은 트랜잭션 안에서 호출해야 함.
+    """
+    result = db.execute(
+        update(TableVersion).where(TableVersion.name == name).values(version=TableVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        db.add(TableVersion(name=name, version=1))
+        db.flush()
+
+
+def version_subquery(name: str):
+    """
+    테이블 버전을 읽는 스칼라 서브쿼리. 행 조회와 같은 SELECT 문에 넣으면 같은 시점의 버전을 함께 읽을 수 있음.
+    """
+    return select(TableVersion.version).where(TableVersion.name == name).scalar_subquery()
+
+
+def current(db: Session, name: str) -> int:
+    """
+    테이블의 현재 버전을 반환하는 함수 (기본 키 조회 한 번).
+    """
+    return db.execute(select(TableVersion.version).where(TableVersion.name == name)).scalar() or 0
+
+
+def combined(db: Session, *names: str) -> str:
+    """
+    여러 테이블의 현재 버전을 한 번의 조회로 읽어 "3.1" 형식의 버전 문자열로 만드는 함수.
+    다른 테이블의 데이터를 함께 담은 응답(예: 게시글 + 작성자)의 ETag 에 사용함.
+    """
+    rows = dict(db.execute(select(TableVersion.name, TableVersion.version).where(TableVersion.name.in_(names))).all())
+    return ".".join(str(rows.get(name) or 0) for name in names)
+
+
+def item_etag(name: str, item_id: int, version: int | str | None, variant: str = "") -> str:
+    """
+    개별 항목의 강한(strong) ETag를 만드는 함수.
+    같은 항목이라도 응답 형태(variant, 예: 선택한 필드 목록)가 다르면 다른 ETag가 됨.
+    """
+    suffix = f"-{hashlib.sha1(variant.encode()).hexdigest()[:8]}" if variant else ""
+    return f'"{name}-{item_id}-{version or 0}{suffix}"'
+
+
+def list_etag(name: str, version: int | str, query_string: str) -> str:
+    """
+    목록 페이지의 강한(strong) ETag를 만드는 함수.
+    같은 버전이라도 페이지 파라미터(skip, limit, cursor 등)가 다르면 다른 ETag가 됨.
+    """
+    params = "&".join(sorted(query_string.split("&")))
+    digest = hashlib.sha1(params.encode()).hexdigest()[:16]
+    return f'"{name}-{version}-{digest}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    If-None-Match 헤더 값에 ETag가 포함되어 있는지 확인하는 함수 (RFC 7232 약한 비교).
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def pack(etag: str, body: bytes) -> bytes:
+    """
+    응답 캐시에 ETag와 본문을 함께 저장하기 위해 하나의 bytes로 합치는 함수.
+    """
+    return etag.encode() + b"\n" + body
+
+
+def unpack(value: bytes) -> tuple[str, bytes]:
+    """
+    pack()으로 합친 값을 (ETag, 본문)으로 나누는 함수.
+    """
+    etag, body = value.split(b"\n", 1)
+    return etag.decode(), body
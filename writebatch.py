@@ -0,0 +1,184 @@
+# 게시글/이력서 쓰기 묶음 커밋(group commit) 모듈
+# SQLite 는 쓰기 트랜잭션을 한 번에 하나만 실행하고 커밋마다 WAL 에 기록하므로, 작성/수정 요청이 몰리면
+# 요청 스레드마다 쓰기 잠금을 두고 경쟁하며 커밋하는 대신 쓰기 전용 스레드 하나가 대기열의 요청을 모아 한 트랜잭션으로 커밋함.
+# 첫 요청이 들어온 뒤 WRITE_BATCH_WINDOW_MS 가 지나거나 WRITE_BATCH_MAX_ITEMS 개가 모이면 커밋하며,
+# 요청마다 SAVEPOINT 안에서 실행하므로 한 요청이 실패(404, 제약 조건 위반 등)해도 그 요청만 되돌리고 나머지는 함께 커밋함.
+# 각 요청은 자신의 결과 또는 예외를 Future 로 받음 (커밋이 실패하면 묶음의 모든 요청이 같은 예외를 받음).
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import metrics
+from models import SessionLocal
+
+# 묶음 커밋 사용 여부 (0이면 요청마다 자신의 세션에서 커밋함)
+WRITE_BATCH_ENABLED = os.environ.get("WRITE_BATCH_ENABLED", "0") == "1"
+
+# 첫 요청이 들어온 뒤 다른 요청을 기다리는 최대 시간 (ms, 0이면 이미 쌓여 있는 요청만 모음)
+WRITE_BATCH_WINDOW_MS = float(os.environ.get("WRITE_BATCH_WINDOW_MS", "2"))
+
+# 한 트랜잭션으로 커밋하는 최대 요청 수
+WRITE_BATCH_MAX_ITEMS = int(os.environ.get("WRITE_BATCH_MAX_ITEMS", "64"))
+
+# 쓰기 스레드 종료 요청 표시
+_STOP = object()
+
+
+def _save_info(db) -> dict:
+    # session.info 에 쌓인 커밋 후 작업 목록(matching/candidates 변경분 등)을 복사함
+    return {key: dict(value) if isinstance(value, dict) else value for key, value in db.info.items()}
+
+
+def _restore_info(db, saved: dict):
+    # 되돌린 요청이 session.info 에 남긴 변경분이 커밋 후 반영되지 않도록 요청 전 상태로 되돌림
+    db.info.clear()
+    db.info.update(saved)
+
+
+class GroupCommitWriter:
+    """
+    대기열에 쌓인 쓰기 작업을 한 트랜잭션으로 묶어 커밋하는 단일 쓰기 스레드 클래스.
+
+    Attributes:
+        session_factory: 쓰기 스레드가 묶음마다 여는 세션 생성기
+        window (float): 첫 작업 이후 다른 작업을 기다리는 최대 시간 (초)
+        max_items (int): 한 트랜잭션으로 커밋하는 최대 작업 수
+    """
+
+    def __init__(self, session_factory=SessionLocal, window_ms: float = WRITE_BATCH_WINDOW_MS,
+                 max_items: int = WRITE_BATCH_MAX_ITEMS):
+        self.session_factory = session_factory
+        self.window = max(window_ms, 0.0) / 1000.0
+        self.max_items = max(max_items, 1)
+        self._queue: queue.SimpleQueue | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def submit(self, fn) -> Future:
+        """
+        쓰기 작업을 대기열에 넣고 Future 를 반환하는 함수.
+
+        Parameters:
+        - fn: 쓰기 스레드의 세션을 받아 변경을 적용하고 결과를 반환하는 함수 (커밋은 하지 않아야 하며,
+          세션이 닫힌 뒤에도 읽을 수 있는 값(응답 모델 등)을 반환해야 함)
+        """
+        future: Future = Future()
+        with self._lock:
+            # 쓰기 스레드는 처음 작업이 들어올 때 시작함 (종료 후 다시 사용하면 새로 시작함)
+            # (스레드마다 대기열을 따로 두어, 종료 중인 스레드의 작업과 섞이지 않게 함)
+            if self._thread is None:
+                self._queue = queue.SimpleQueue()
+                self._thread = threading.Thread(target=self._loop, args=(self._queue,), name="write-batch", daemon=True)
+                self._thread.start()
+            self._queue.put((fn, future))
+        return future
+
+    def run(self, fn):
+        """
+        쓰기 작업을 제출하고 커밋될 때까지 기다리는 함수 (동기 엔드포인트용).
+        """
+        started = time.perf_counter()
+        try:
+            return self.submit(fn).result()
+        finally:
+            # 대기열에서 기다린 시간을 포함한 쓰기 시간
+            metrics.record_phase("write_batch", time.perf_counter() - started)
+
+    async def run_async(self, fn):
+        """
+        쓰기 작업을 제출하고 이벤트 루프를 막지 않고 커밋을 기다리는 함수 (비동기 엔드포인트용).
+        """
+        started = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(self.submit(fn))
+        finally:
+            metrics.record_phase("write_batch", time.perf_counter() - started)
+
+    def _collect(self, jobs: queue.SimpleQueue, first) -> tuple[list, bool]:
+        # 첫 작업 이후 window 동안 또는 max_items 개가 찰 때까지 작업을 모음
+        batch = [first]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_items:
+            remaining = deadline - time.monotonic()
+            try:
+                item = jobs.get(timeout=remaining) if remaining > 0 else jobs.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+        return batch, False
+
+    def _loop(self, jobs: queue.SimpleQueue):
+        while True:
+            item = jobs.get()
+            if item is _STOP:
+                return
+            batch, stopping = self._collect(jobs, item)
+            self.flush(batch)
+            if stopping:
+                return
+
+    def flush(self, batch: list):
+        """
+        작업 묶음을 한 트랜잭션에서 실행하고 커밋한 뒤 각 Future 에 결과를 전달하는 함수.
+        """
+        batch = [(fn, future) for fn, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+        metrics.write_batch_size.observe(len(batch))
+        outcomes = []
+        try:
+            with self.session_factory() as db:
+                if db.get_bind().dialect.name == "sqlite":
+                    # pysqlite 는 첫 SAVEPOINT 를 바깥 트랜잭션으로 취급해 RELEASE 때 커밋하므로 트랜잭션을 직접 시작함
+                    # (IMMEDIATE 로 쓰기 잠금을 처음부터 잡아 읽기 → 쓰기 전환 중 잠금 충돌을 피함)
+                    db.connection().exec_driver_sql("BEGIN IMMEDIATE")
+                for fn, future in batch:
+                    saved = _save_info(db)
+                    try:
+                        with db.begin_nested():  # 예외가 나면 이 요청의 변경만 SAVEPOINT 까지 되돌림
+                            result = fn(db)
+                    except Exception as exc:
+                        _restore_info(db, saved)
+                        outcomes.append((future, exc, False))
+                    else:
+                        outcomes.append((future, result, True))
+                db.commit()
+        except Exception as exc:
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+        for future, value, ok in outcomes:
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def reset_after_fork(self):
+        """
+        fork 로 만든 자식 프로세스에서 부모의 쓰기 스레드 상태를 버리는 함수 (스레드는 fork 후 복사되지 않음).
+        """
+        self._queue = None
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def stop(self):
+        """
+        대기 중인 작업을 모두 커밋한 뒤 쓰기 스레드를 종료하는 함수.
+        """
+        with self._lock:
+            thread, self._thread = self._thread, None
+            if thread is not None:
+                self._queue.put(_STOP)
+                self._queue = None
+        if thread is not None:
+            thread.join()
+
+
+# 애플리케이션 전체에서 공유하는 쓰기 스레드
+writer = GroupCommitWriter()
+os.register_at_fork(after_in_child=writer.reset_after_fork)